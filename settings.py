@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -38,6 +40,46 @@ class Settings(BaseSettings):
         description="The name of the PostgreSQL database to connect to."
     )
 
+    POSTGRES_POOL_MIN_SIZE: int = Field(
+        1,
+        ge=0,
+        description="Number of PostgreSQL connections each worker opens at startup and keeps in its pool."
+    )
+
+    POSTGRES_POOL_MAX_SIZE: int = Field(
+        10,
+        ge=1,
+        description="Maximum number of PostgreSQL connections in the pool of each worker."
+    )
+
+    POSTGRES_POOL_MAX_INACTIVE_LIFETIME: float = Field(
+        300.0,
+        ge=0,
+        description="Seconds after which an idle pooled PostgreSQL connection above the minimum is closed; 0 keeps them open."
+    )
+
+    DB_GENERATE_SCHEMAS: bool = Field(
+        False,
+        description="Create missing database tables and indexes when a worker starts. When off, "
+                    "run `python -m src.db.schema` after upgrading to create them."
+    )
+
+    DB_MIGRATE_ON_STARTUP: bool = Field(
+        False,
+        description="Run the data migrations when a worker starts. When off, run them once "
+                    "with `python -m src.db.recipe.migrations` after upgrading."
+    )
+
+    DB_SEED_TEST_DATA: bool = Field(
+        False,
+        description="Upsert the demo products and recipes when a worker starts."
+    )
+
+    DB_DELETE_TEST_DATA_ON_SHUTDOWN: bool = Field(
+        False,
+        description="Delete the demo products and recipes when a worker stops."
+    )
+
     LLM_NAME: str = Field(
         ...,
         description="The name of the language model being used (e.g., 'ollama' or 'openai')."
@@ -79,14 +121,249 @@ class Settings(BaseSettings):
     )
 
     REDIS_HOST: str = Field(
-        ...,
+        "localhost",
         description="Redis host."
     )
 
     REDIS_PORT: str = Field(
-        ...,
+        "6379",
         description="Redis port"
     )
 
+    CACHE_BACKEND: Literal["redis", "memory"] = Field(
+        "redis",
+        description="Shared cache backend: 'redis', or 'memory' for a process-local cache with no Redis at all."
+    )
+
+    CACHE_L1_ENABLED: bool = Field(
+        False,
+        description="Keep an in-process LRU tier in front of Redis."
+    )
+
+    CACHE_L1_MAX_SIZE: int = Field(
+        1024,
+        ge=1,
+        description="Maximum number of entries in the in-process cache tier."
+    )
+
+    CACHE_L1_TTL: int = Field(
+        60,
+        ge=1,
+        description="Time to live, in seconds, of entries in the in-process cache tier. "
+                    "Never longer than the remaining Redis TTL of the entry."
+    )
+
+    PLANNER_MODE: Literal["separate", "fused"] = Field(
+        "separate",
+        description="'separate' runs the Planner and Recipe agents one after the other, "
+                    "'fused' plans and selects recipes in a single MealPlanner LLM call."
+    )
+
+    RECIPE_RETRIEVAL_TOP_K: int = Field(
+        50,
+        ge=0,
+        description="Number of best matching recipes, by BM25 over the plan, put into the recipe selection "
+                    "prompt. 0 puts every recipe into the prompt."
+    )
+
+    PRODUCT_INDEX_ENABLED: bool = Field(
+        False,
+        description="Rank candidate products per ingredient with the memory-mapped product embedding index "
+                    "instead of sending every product of the category."
+    )
+
+    PRODUCT_INDEX_PATH: str = Field(
+        "data/product_index.npy",
+        description="File of the product embedding index, shared by all workers of a host."
+    )
+
+    PRODUCT_INDEX_DIM: int = Field(
+        256,
+        ge=16,
+        description="Number of dimensions of the product embeddings."
+    )
+
+    PRODUCT_INDEX_TOP_K: int = Field(
+        5,
+        ge=1,
+        description="Number of candidate products per ingredient taken from the product index."
+    )
+
+    PRODUCT_INDEX_REBUILD_DELAY: float = Field(
+        2.0,
+        ge=0,
+        description="Seconds a product write waits before the background index rebuild, "
+                    "so that writes made meanwhile share one rebuild."
+    )
+
+    PRODUCT_FINDER_MODE: Literal["batch", "fan_out"] = Field(
+        "batch",
+        description="'batch' selects products for all recipes in one LLM call, "
+                    "'fan_out' makes one concurrent call per recipe."
+    )
+
+    PRODUCT_FINDER_MAX_CONCURRENCY: int = Field(
+        4,
+        ge=1,
+        description="Maximum number of concurrent per-recipe LLM calls in the 'fan_out' product finder mode."
+    )
+
+    BUDGETING_MODE: Literal["deterministic", "explain"] = Field(
+        "deterministic",
+        description="How BudgetingAgent checks the budget: 'deterministic' compares the total in Python, "
+                    "'explain' asks the LLM."
+    )
+
+    CACHE_TTL: int = Field(
+        7 * 24 * 3600,
+        ge=1,
+        description="Default time to live, in seconds, of agent cache entries. Catalog and recipe edits "
+                    "invalidate entries through generation counters, so this can be long."
+    )
+
+    PROMPT_VERSION: str = Field(
+        "1",
+        description="Version of the agent prompts. Changing it invalidates all cached LLM results."
+    )
+
+    CATALOG_GENERATION_CHECK_INTERVAL: float = Field(
+        1.0,
+        ge=0,
+        description="Seconds between checks of the shared catalog generations for a stale in-memory snapshot."
+    )
+
+    CACHE_SERIALIZER: Literal["json", "orjson", "msgpack"] = Field(
+        "json",
+        description="Serializer for values written to Redis. 'orjson' and 'msgpack' need their packages installed."
+    )
+
+    CACHE_COMPRESSION: Literal["none", "zlib", "zstd"] = Field(
+        "none",
+        description="Compression for values written to Redis. 'zstd' needs the zstandard package installed."
+    )
+
+    CACHE_COMPRESSION_THRESHOLD: int = Field(
+        1024,
+        ge=0,
+        description="Serialized values smaller than this many bytes are stored uncompressed."
+    )
+
+    PLANNER_SEMANTIC_CACHE_ENABLED: bool = Field(
+        False,
+        description="Reuse planner results of similar (not only identical) requests seen by this worker."
+    )
+
+    PLANNER_SEMANTIC_THRESHOLD: float = Field(
+        0.85,
+        gt=0,
+        le=1,
+        description="Minimum cosine similarity between two requests for a semantic planner cache hit."
+    )
+
+    PLANNER_SEMANTIC_CACHE_SIZE: int = Field(
+        4096,
+        ge=1,
+        description="Maximum number of requests kept in the semantic planner cache of a worker."
+    )
+
+    SINGLE_FLIGHT_DISTRIBUTED: bool = Field(
+        False,
+        description="Also coalesce identical agent cache misses across workers with a short Redis lock."
+    )
+
+    SINGLE_FLIGHT_LOCK_TTL: float = Field(
+        60,
+        gt=0,
+        description="Seconds a cross-worker single-flight lock is held at most; waiters compute themselves after it."
+    )
+
+    SINGLE_FLIGHT_POLL_INTERVAL: float = Field(
+        0.1,
+        gt=0,
+        description="Seconds between cache checks while another worker holds the single-flight lock."
+    )
+
+    TRANSCRIPTION_BASE_URL: Optional[str] = Field(
+        None,
+        description="Base URL of the OpenAI-compatible transcription API. Defaults to the OpenAI API."
+    )
+
+    TRANSCRIPTION_MAX_CONNECTIONS: int = Field(
+        20,
+        ge=1,
+        description="Size of the pooled HTTP connections used for audio transcription."
+    )
+
+    AUDIO_MAX_UPLOAD_BYTES: int = Field(
+        25 * 1024 * 1024,
+        gt=0,
+        description="Maximum accepted audio upload size in bytes (Whisper rejects files above 25 MB)."
+    )
+
+    BULK_IMPORT_BATCH_SIZE: int = Field(
+        1000,
+        ge=1,
+        description="Number of NDJSON rows written per transaction by the bulk import endpoints."
+    )
+
+    BULK_IMPORT_MAX_LINE_BYTES: int = Field(
+        1024 * 1024,
+        ge=1,
+        description="Maximum size, in bytes, of a single NDJSON line accepted by the bulk import endpoints."
+    )
+
+    LIST_DEFAULT_LIMIT: int = Field(
+        100,
+        ge=1,
+        description="Number of items per page returned by the product and recipe listing endpoints by default."
+    )
+
+    LIST_MAX_LIMIT: int = Field(
+        1000,
+        ge=1,
+        description="Maximum number of items per page accepted by the product and recipe listing endpoints."
+    )
+
+    LIST_CHUNK_SIZE: int = Field(
+        200,
+        ge=1,
+        description="Number of rows fetched per query while a listing page is streamed."
+    )
+
+    GRAPH_TOPOLOGY: Literal["supervisor", "linear"] = Field(
+        "supervisor",
+        description="Agent graph wiring: 'supervisor' routes through the Supervisor after every agent, "
+                    "'linear' connects the agents directly."
+    )
+
+    GRAPH_CACHE_ENABLED: bool = Field(
+        True,
+        description="Return the memoized final state of a graph run for repeated requests against the same catalog."
+    )
+
+    GRAPH_MAX_CONCURRENCY: int = Field(
+        4,
+        ge=1,
+        description="Maximum number of graph runs executing at the same time in one worker."
+    )
+
+    GRAPH_MAX_QUEUE: int = Field(
+        16,
+        ge=0,
+        description="Maximum number of graph runs waiting for a free slot before new requests are rejected."
+    )
+
+    GRAPH_QUEUE_TIMEOUT: float = Field(
+        30,
+        gt=0,
+        description="Seconds a queued graph run may wait for a free slot before it is rejected."
+    )
+
+    GRAPH_RETRY_AFTER: int = Field(
+        5,
+        ge=0,
+        description="Value of the Retry-After header, in seconds, sent when a graph run is rejected."
+    )
+
 # Instance of the Settings class, which loads the configuration from the environment.
 settings: Settings = Settings()
@@ -0,0 +1,48 @@
+"""
+Measure the BudgetSolver min-cost selection on large synthetic catalogs.
+
+Usage:
+    python -m src.benchmarks.bench_budget_solver --products-per-category 5000 --categories 12
+"""
+import argparse
+import random
+import statistics
+import time
+
+from src.db.product.enums import ProductCategoryEnum
+from src.llm.agents.budget_solver.budget_solver import select_cheapest_basket
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    categories = [category.value for category in list(ProductCategoryEnum)[:args.categories]]
+    candidates = {
+        category: [
+            (f"{category} {index}", rng.randint(1, 1000), "Bench", category)
+            for index in range(args.products_per_category)
+        ]
+        for category in categories
+    }
+
+    ingredients = [{"name": f"{category} {index}", "category": category} for category in categories for index in range(2)]
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        selection = select_cheapest_basket(candidates=candidates, ingredients=ingredients, budget=args.budget)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{args.categories} categories x {args.products_per_category} products: "
+        f"median {statistics.median(timings):.3f} ms, max {max(timings):.3f} ms, "
+        f"total {selection.total_cost}, feasible={selection.feasible}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products-per-category", type=int, default=5000)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--budget", type=float, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,73 @@
+"""
+Compare cache codec configurations on realistic agent payloads: encode and
+decode time per value and the number of bytes stored in Redis.
+
+Usage:
+    python -m src.benchmarks.bench_cache_codec --repeat 2000
+"""
+import argparse
+import time
+from typing import Any, Dict
+
+from src.redis_client.codec import CacheCodec
+
+
+def agent_payloads() -> Dict[str, Any]:
+    """
+    Build values shaped like the ones the agents cache.
+    """
+    def product(index: int) -> Dict[str, Any]:
+        return {
+            "name": f"Organic Whole Milk 1L #{index}",
+            "price": 1.99 + index,
+            "manufacturer": "SimpleDairy Cooperative",
+            "composition": "Whole milk, vitamin D, vitamin A palmitate",
+        }
+
+    return {
+        "recipes (plan)": ["Cheese Sandwich", "Tomato Salad", "Milkshake", "Simple Pizza"],
+        "products x12 (product_finder)": [product(index) for index in range(12)],
+        "budgeting x12": {"products": [product(index) for index in range(12)], "budget": 50},
+        "products x300": [product(index) for index in range(300)],
+    }
+
+
+def measure(codec: CacheCodec, value: Any, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = codec.encode(value)
+    encode_us = (time.perf_counter() - start) / repeat * 1e6
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        codec.decode(encoded)
+    decode_us = (time.perf_counter() - start) / repeat * 1e6
+    return encode_us, decode_us, len(encoded)
+
+
+def main(args: argparse.Namespace) -> None:
+    configurations = []
+    for serializer in ("json", "orjson", "msgpack"):
+        for compression in ("none", "zlib", "zstd"):
+            try:
+                configurations.append(CacheCodec(
+                    serializer=serializer,
+                    compression=compression,
+                    compress_threshold=args.threshold
+                ))
+            except ValueError:
+                print(f"skipping {serializer}+{compression}: package not installed")
+
+    for name, value in agent_payloads().items():
+        print(f"\n{name}")
+        print(f"{'codec':>16} {'encode us':>10} {'decode us':>10} {'bytes':>8}")
+        for codec in configurations:
+            encode_us, decode_us, size = measure(codec, value, args.repeat)
+            print(f"{codec.serializer + '+' + codec.compression:>16} {encode_us:10.1f} {decode_us:10.1f} {size:8d}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--threshold", type=int, default=1024)
+    main(parser.parse_args())
@@ -0,0 +1,99 @@
+"""
+Compare candidate product lookups and category filters before and after the
+normalized ingredient table, on a large synthetic SQLite catalog.
+
+Usage:
+    python -m src.benchmarks.bench_catalog_schema --products 100000 --recipes 10000 --latency-ms 1
+"""
+import argparse
+import asyncio
+import random
+import statistics
+
+from src.benchmarks.common import QueryCounter, sqlite_orm, timed
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.product.repository import get_products_by_categories
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.migrations import migrate_recipe_ingredients
+from src.db.recipe.model import RecipeModel
+from src.db.recipe.repository import (
+    get_candidate_products,
+    get_recipe_names_by_ingredient_category,
+    get_recipes_by_names,
+)
+
+
+async def batched_candidates(names):
+    """
+    The JSON-based lookup: load the recipes, then every product of their ingredient categories.
+    """
+    recipes = await get_recipes_by_names(names=names)
+    categories = [ingredient["category"] for recipe in recipes for ingredient in recipe.ingredients]
+    products = await get_products_by_categories(categories=categories)
+    return {
+        recipe.name: [products.get(ingredient["category"], []) for ingredient in recipe.ingredients]
+        for recipe in recipes
+    }
+
+
+async def json_recipes_by_category(category):
+    """
+    The JSON-based category filter: scan every recipe's ingredients.
+    """
+    rows = await RecipeModel.all().values_list("name", "ingredients")
+    return [name for name, ingredients in rows if any(item["category"] == category for item in ingredients)]
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    categories = [category.value for category in ProductCategoryEnum]
+
+    async with sqlite_orm():
+        await ProductModel.bulk_create([
+            ProductModel(name=f"Product {index}", price=rng.randint(1, 1000), category=rng.choice(categories))
+            for index in range(args.products)
+        ], batch_size=5000)
+        await RecipeModel.bulk_create([
+            RecipeModel(
+                name=f"Recipe {index}",
+                category=rng.choice(list(RecipeCategoryEnum)),
+                ingredients=[
+                    {"name": f"Ingredient {item}", "category": rng.choice(categories), "weight_grams": 100}
+                    for item in range(args.ingredients)
+                ],
+            )
+            for index in range(args.recipes)
+        ], batch_size=5000)
+        migrated = await migrate_recipe_ingredients(batch_size=5000)
+        print(f"{args.products} products, {args.recipes} recipes, {migrated} ingredient rows migrated")
+
+        counter = QueryCounter(latency_ms=args.latency_ms)
+        counter.install()
+        names = [f"Recipe {index}" for index in rng.sample(range(args.recipes), args.selected)]
+
+        for label, func in (
+            ("JSON + batched products", lambda: batched_candidates(names)),
+            ("single join, all products", lambda: get_candidate_products(names=names)),
+            (f"single join, top {args.limit}", lambda: get_candidate_products(names=names, limit_per_ingredient=args.limit)),
+            ("recipes by category, JSON scan", lambda: json_recipes_by_category(categories[0])),
+            ("recipes by category, index", lambda: get_recipe_names_by_ingredient_category(category=categories[0])),
+        ):
+            counter.reset()
+            timings = await timed(func, args.repeat)
+            print(
+                f"{label:<32} {counter.count // args.repeat} queries, "
+                f"median {statistics.median(timings):8.2f} ms, max {max(timings):8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--recipes", type=int, default=10_000)
+    parser.add_argument("--ingredients", type=int, default=6)
+    parser.add_argument("--selected", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,47 @@
+"""
+Measure the orchestration overhead of the supervisor and linear graph topologies.
+
+Every agent is replaced by a stub that fills its state fields without any LLM or
+database call, so the timings are pure LangGraph scheduling and state merging.
+
+Usage:
+    python -m src.benchmarks.bench_graph_topology --repeat 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.benchmarks.common import create_stub_agents
+from src.llm.graph import build_graph
+from src.llm.graph_schema import AgentState
+
+
+async def measure(topology: str, *, over_budget: bool, repeat: int) -> None:
+    graph = build_graph(topology=topology, agents=create_stub_agents(over_budget=over_budget))
+    initial_state: AgentState = {"user_input": "Dinner for 4", "budget": 10}
+
+    steps = [update async for update in graph.astream(initial_state, stream_mode="updates")]
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await graph.ainvoke(initial_state)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{topology:<10} over_budget={over_budget!s:<5} {len(steps)} node runs: "
+        f"median {statistics.median(timings):.3f} ms, max {max(timings):.3f} ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    for over_budget in (False, True):
+        for topology in ("supervisor", "linear"):
+            await measure(topology, over_budget=over_budget, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,50 @@
+"""
+Measure the cold import time of a module with `python -X importtime` and fail
+when it exceeds a threshold, so startup regressions are caught.
+
+Each run is a fresh interpreter; the best of `--repeat` runs is compared with
+`--max-ms`, and the exit status is 1 when it is exceeded.
+
+Usage:
+    python -m src.benchmarks.bench_import_time --module src.app --max-ms 3000 --top 15
+"""
+import argparse
+import sys
+from typing import Dict, List, Tuple
+
+from src.benchmarks.common import PROVIDER_MODULES, measure_import_time
+
+
+def heaviest(timings: Dict[str, Tuple[int, int]], top: int) -> List[Tuple[str, int]]:
+    """
+    Return the top-level packages with the largest cumulative import time.
+    """
+    packages = [(name, cumulative) for name, (_, cumulative) in timings.items() if "." not in name]
+    return sorted(packages, key=lambda package: -package[1])[:top]
+
+
+def main(args: argparse.Namespace) -> int:
+    runs = [measure_import_time(args.module) for _ in range(args.repeat)]
+    best = min(runs, key=lambda timings: timings[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    for name, cumulative in heaviest(best, args.top):
+        print(f"{name:<40} {cumulative / 1000:>9.1f} ms")
+    providers = [name for name in PROVIDER_MODULES if name in best]
+    if providers:
+        print(f"provider SDKs imported at startup: {', '.join(providers)}")
+
+    print(f"{args.module} imported in {total_ms:.1f} ms (best of {args.repeat}, limit {args.max_ms:.0f} ms)")
+    if total_ms > args.max_ms:
+        print(f"FAIL: import time exceeds {args.max_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="src.app")
+    parser.add_argument("--max-ms", type=float, default=3000)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeat", type=int, default=3)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,123 @@
+"""
+Compare the ProductFinderAgent candidate loading strategies: one query per
+ingredient, two batched queries, and the in-memory catalog snapshot.
+
+Usage:
+    python -m src.benchmarks.bench_product_finder_queries --recipes 5 --ingredients 6 --latency-ms 1
+"""
+import argparse
+import asyncio
+import statistics
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from src.benchmarks.common import QueryCounter, sqlite_orm, timed, use_memory_cache
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.catalog.snapshot import catalog
+from src.db.product.repository import get_product_by_category, get_products_by_categories
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.model import RecipeModel
+from src.db.recipe.repository import get_recipe_by_name, get_recipes_by_names
+from src.llm.agents.product_finder.product_finder import ProductFinderAgent
+
+
+async def load_candidates_per_ingredient(recipes: List[str]) -> Dict[str, List[Any]]:
+    """
+    The previous implementation: one query per recipe and one per ingredient.
+    """
+    products: Dict[str, List[Any]] = defaultdict(list)
+    for name in recipes:
+        recipe = await get_recipe_by_name(name=name)
+        if not recipe or not recipe.ingredients:
+            continue
+        for ingredient in recipe.ingredients:
+            product = await get_product_by_category(category=ingredient["category"])
+            if product:
+                products[name].append(product)
+    return products
+
+
+async def load_candidates_batched(recipes: List[str]) -> Dict[str, List[Any]]:
+    """
+    One query for all recipes and one for all distinct ingredient categories.
+    """
+    found = await get_recipes_by_names(names=recipes)
+    by_category = await get_products_by_categories(
+        categories=[ingredient["category"] for recipe in found for ingredient in recipe.ingredients]
+    )
+    products: Dict[str, List[Any]] = defaultdict(list)
+    recipes_by_name = {recipe.name: recipe for recipe in found}
+    for name in recipes:
+        recipe = recipes_by_name.get(name)
+        if not recipe:
+            continue
+        for ingredient in recipe.ingredients:
+            product = by_category.get(ingredient["category"])
+            if product:
+                products[name].append(product)
+    return products
+
+
+async def seed(recipes: int, ingredients: int, products_per_category: int) -> List[str]:
+    categories = list(ProductCategoryEnum)
+    await ProductModel.bulk_create([
+        ProductModel(
+            name=f"{category.value[:30]} {index}",
+            price=index + 1,
+            category=category,
+            manufacturer="Bench",
+            composition=category.value,
+        )
+        for category in categories
+        for index in range(products_per_category)
+    ])
+
+    names = [f"Recipe {index}" for index in range(recipes)]
+    await RecipeModel.bulk_create([
+        RecipeModel(
+            name=name,
+            category=RecipeCategoryEnum.ENTREE,
+            ingredients=[
+                # Categories intentionally repeat across recipes, as they do in real menus.
+                {"name": f"Ingredient {i}", "category": categories[(r + i) % 8].value, "weight_grams": 100}
+                for i in range(ingredients)
+            ],
+        )
+        for r, name in enumerate(names)
+    ])
+    return names
+
+
+async def main(args: argparse.Namespace) -> None:
+    use_memory_cache()
+    async with sqlite_orm():
+        names = await seed(args.recipes, args.ingredients, args.products_per_category)
+        await catalog.refresh()
+        counter = QueryCounter(latency_ms=args.latency_ms)
+        counter.install()
+
+        for label, loader in (
+            ("per-ingredient", load_candidates_per_ingredient),
+            ("batched", load_candidates_batched),
+            ("snapshot", ProductFinderAgent.load_candidates),
+        ):
+            counter.reset()
+            await loader(names)
+            queries = counter.count
+            timings = await timed(lambda: loader(names), args.repeat)
+            print(
+                f"{label:>15}: {queries:3d} queries, "
+                f"median {statistics.median(timings):7.2f} ms, "
+                f"p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipes", type=int, default=5)
+    parser.add_argument("--ingredients", type=int, default=6)
+    parser.add_argument("--products-per-category", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Simulated round trip per query.")
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+Measure building, incrementally rebuilding and querying the memory-mapped
+product embedding index on a large synthetic catalog.
+
+Usage:
+    python -m src.benchmarks.bench_product_index --products 50000 --top-k 5
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.db.catalog.product_index import ProductIndex, build_product_index
+from src.db.product.enums import ProductCategoryEnum
+from src.llm.embeddings import HashedNgramEmbedder
+
+WORDS = "fresh organic whole skimmed smoked sliced tomato cheese milk chicken beef rice pasta flour apple".split()
+INGREDIENTS = ("mozzarella", "tomatoes", "chicken breast", "basmati rice", "whole milk", "flour")
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    categories = [category.value for category in ProductCategoryEnum]
+    rows = [
+        (product_id, rng.choice(categories), f"{' '.join(rng.choices(WORDS, k=3)).title()} {product_id}",
+         ", ".join(rng.choices(WORDS, k=4)))
+        for product_id in range(1, args.products + 1)
+    ]
+    embedder = HashedNgramEmbedder(dim=args.dim)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "product_index.npy"
+
+        start = time.perf_counter()
+        build_product_index(rows, path=path, embedder=embedder)
+        print(f"full build: {len(rows)} products in {time.perf_counter() - start:.2f} s, "
+              f"{path.stat().st_size / 2 ** 20:.1f} MiB")
+
+        for product_id in rng.sample(range(len(rows)), args.changed):
+            rows[product_id] = (*rows[product_id][:3], "changed composition")
+        start = time.perf_counter()
+        embedded = build_product_index(rows, path=path, embedder=embedder)
+        print(f"incremental rebuild: {embedded} embedded in {time.perf_counter() - start:.2f} s")
+
+        index = ProductIndex(path)
+        timings = []
+        for _ in range(args.repeat):
+            for ingredient in INGREDIENTS:
+                start = time.perf_counter()
+                index.search(ingredient, rng.choice(categories), args.top_k)
+                timings.append((time.perf_counter() - start) * 1000)
+        print(f"top {args.top_k} per ingredient: median {statistics.median(timings):.3f} ms, "
+              f"max {max(timings):.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--changed", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=20)
+    main(parser.parse_args())
@@ -0,0 +1,47 @@
+"""
+Compare the prompt size of the catalog data rendered as Python reprs and as
+compact tables, for a synthetic catalog.
+
+Usage:
+    python -m src.benchmarks.bench_prompt_size --recipes 5 --ingredients 6 --products-per-category 3
+"""
+import argparse
+import random
+
+from src.db.product.enums import ProductCategoryEnum
+from src.llm.agents.common.prompt_format import format_product_candidates, format_recipes
+from src.llm.agents.common.token_counter import count_tokens
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    categories = [category.value for category in ProductCategoryEnum]
+    products_by_category = {
+        category: [
+            (f"{category.title()} Product {index} 500g", round(rng.uniform(1, 20), 2), f"Maker {index}",
+             f"{category}, water, salt")
+            for index in range(args.products_per_category)
+        ]
+        for category in categories
+    }
+    candidates = {
+        f"Recipe {recipe}": [products_by_category[rng.choice(categories)] for _ in range(args.ingredients)]
+        for recipe in range(args.recipes)
+    }
+    recipes = [{"name": f"Recipe {index}", "category": "dinner"} for index in range(args.recipe_list)]
+
+    for label, as_repr, as_table in (
+        ("product candidates", str(candidates), format_product_candidates(candidates)),
+        ("recipe list", str(recipes), format_recipes(recipes)),
+    ):
+        before, after = count_tokens(as_repr), count_tokens(as_table)
+        print(f"{label:<20} repr {before:>7} tokens, table {after:>7} tokens ({1 - after / before:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipes", type=int, default=5)
+    parser.add_argument("--ingredients", type=int, default=6)
+    parser.add_argument("--products-per-category", type=int, default=3)
+    parser.add_argument("--recipe-list", type=int, default=200)
+    main(parser.parse_args())
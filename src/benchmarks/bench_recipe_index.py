@@ -0,0 +1,68 @@
+"""
+Measure building and querying the BM25 recipe index on a large synthetic recipe book.
+
+Usage:
+    python -m src.benchmarks.bench_recipe_index --recipes 100000 --top-k 50
+"""
+import argparse
+import random
+import statistics
+import time
+
+from src.db.catalog.recipe_index import RecipeIndex
+from src.db.product.enums import ProductCategoryEnum
+from src.db.recipe.enums import RecipeCategoryEnum
+
+WORDS = (
+    "tomato pasta chicken beef salad soup cheese rice curry fish vegan spicy garlic lemon bread egg "
+    "potato mushroom pork tofu creamy roasted grilled baked fresh quick simple classic"
+).split()
+
+QUERIES = (
+    "A simple vegetarian dinner with pasta and tomato for 4 people",
+    "Spicy chicken curry for lunch",
+    "Quick breakfast with eggs and bread",
+)
+
+
+def main(args: argparse.Namespace) -> None:
+    rng = random.Random(42)
+    words = WORDS + [f"dish{index}" for index in range(args.vocabulary)]
+    product_categories = [category.value for category in ProductCategoryEnum]
+    recipe_categories = [category.value for category in RecipeCategoryEnum]
+    recipes = [
+        {
+            "name": f"{' '.join(rng.choices(words, k=3)).title()} {index}",
+            "category": rng.choice(recipe_categories),
+            "ingredients": [
+                {"name": rng.choice(words), "category": rng.choice(product_categories)}
+                for _ in range(args.ingredients)
+            ],
+        }
+        for index in range(args.recipes)
+    ]
+
+    start = time.perf_counter()
+    index = RecipeIndex(recipes)
+    print(f"built {len(index)} recipes, {len(index.postings)} terms in {time.perf_counter() - start:.2f} s")
+
+    for query in QUERIES:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = index.search(query, args.top_k)
+            timings.append((time.perf_counter() - start) * 1000)
+        print(
+            f"top {args.top_k} for {query!r}: median {statistics.median(timings):.3f} ms, "
+            f"max {max(timings):.3f} ms, best {results[0]['name']!r}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recipes", type=int, default=100_000)
+    parser.add_argument("--ingredients", type=int, default=6)
+    parser.add_argument("--vocabulary", type=int, default=3000)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,155 @@
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+
+from tortoise import Tortoise, connections
+
+from src.llm.agents.product_finder.schemas import ProductInfo
+from src.llm.graph_schema import AgentState
+from src.redis_client.client import LRUCache, cache
+
+
+class QueryCounter:
+    """
+    Counts queries sent through the default Tortoise connection and optionally
+    adds a fixed delay per query to emulate the network round trip to Postgres.
+    """
+
+    _METHODS = ("execute_query", "execute_query_dict", "execute_insert", "execute_many")
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.count = 0
+
+    def install(self) -> None:
+        """
+        Wrap the query methods of the default connection.
+        """
+        import asyncio
+
+        connection = connections.get("default")
+        for method_name in self._METHODS:
+            original = getattr(connection, method_name)
+
+            def wrap(func: Callable) -> Callable:
+                async def wrapper(*args, **kwargs):
+                    self.count += 1
+                    if self.latency_ms:
+                        await asyncio.sleep(self.latency_ms / 1000)
+                    return await func(*args, **kwargs)
+                return wrapper
+
+            setattr(connection, method_name, wrap(original))
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+def use_memory_cache() -> None:
+    """
+    Switch the shared agent cache to the in-memory backend so benchmarks need no Redis.
+    """
+    cache.client = None
+    cache.l1 = LRUCache(max_size=10_000)
+
+
+@asynccontextmanager
+async def sqlite_orm() -> AsyncIterator[None]:
+    """
+    Initialize the application models on an in-memory SQLite database.
+    """
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["src.db.db_models"]},
+    )
+    await Tortoise.generate_schemas()
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
+
+
+async def timed(func: Callable, repeat: int) -> List[float]:
+    """
+    Await `func()` `repeat` times and return the wall time of each run in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def create_stub_agents(*, over_budget: bool) -> Dict[str, Callable]:
+    """
+    Create stub node functions that produce a complete pipeline state.
+
+    Args:
+        over_budget (bool): Whether Budgeting reports the basket as over budget.
+
+    Returns:
+        Dict[str, Callable]: Node functions keyed by node name.
+    """
+    async def planner(state: AgentState) -> AgentState:
+        return {"plan": "dinner", "user_intent": "dinner", "servings": "4"}
+
+    async def meal_planner(state: AgentState) -> AgentState:
+        return {**await planner(state), **await recipe(state)}
+
+    async def recipe(state: AgentState) -> AgentState:
+        return {"recipes": ["Simple Pizza"]}
+
+    async def product_finder(state: AgentState) -> AgentState:
+        return {"products": [ProductInfo(name="Flour 1kg", price=2.0, manufacturer="Mill", composition="wheat")]}
+
+    async def budgeting(state: AgentState) -> AgentState:
+        return {"total_cost": 2.0, "within_budget": not over_budget}
+
+    async def budget_solver(state: AgentState) -> AgentState:
+        return {"budget_solved": True, "within_budget": True}
+
+    async def finalizer(state: AgentState) -> AgentState:
+        return {"final_message": "Buy flour"}
+
+    return {
+        "Planner": planner,
+        "MealPlanner": meal_planner,
+        "Recipe": recipe,
+        "ProductFinder": product_finder,
+        "Budgeting": budgeting,
+        "BudgetSolver": budget_solver,
+        "Finalizer": finalizer,
+    }
+
+
+# LLM provider SDKs that must only be imported once an agent is created
+PROVIDER_MODULES = ("openai", "langchain_openai", "langchain_ollama")
+
+
+def measure_import_time(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter and return the import time of every module it loaded.
+
+    Args:
+        module (str): The dotted module name.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Self and cumulative import time, in microseconds, of each loaded module.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
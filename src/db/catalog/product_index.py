@@ -0,0 +1,249 @@
+"""
+Memory-mapped embedding index of the product catalog.
+
+The index is a single `.npy` file holding one record per product, sorted by
+category: its id, a CRC32 of its embedded text, its category and its embedding.
+Workers open it with `mmap`, so the operating system shares one copy of the
+pages between all of them. Rebuilds write a new file next to it and swap it in
+with `os.replace`, so readers always see a complete index.
+
+Build it offline with:
+    python -m src.db.catalog.product_index
+"""
+import asyncio
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from settings import settings
+from src.db.db_setup import DB
+from src.db.product.enums import category_value
+from src.db.product.model import ProductModel
+from src.llm.embeddings import HashedNgramEmbedder
+from src.logger.logger import logger
+
+
+def index_dtype(dim: int) -> np.dtype:
+    """
+    Return the record type of an index with `dim`-dimensional embeddings.
+    """
+    return np.dtype([("id", "<i8"), ("hash", "<u4"), ("category", "<U20"), ("vector", "<f4", (dim,))])
+
+
+def product_text(name: str, composition: Optional[str]) -> str:
+    """
+    Return the embedded text of a product: its name and composition.
+    """
+    return f"{name} {composition or ''}".strip()
+
+
+def build_product_index(
+    rows: Iterable[Tuple[int, str, str, Optional[str]]],
+    *,
+    path: Path,
+    embedder: HashedNgramEmbedder
+) -> int:
+    """
+    Build the index file from product rows, reusing the embeddings of unchanged products.
+
+    Products whose id and text hash match a record of the existing file keep its
+    vector; only new and edited products are embedded. The new file replaces the
+    old one atomically.
+
+    Args:
+        rows (Iterable[Tuple[int, str, str, Optional[str]]]): `(id, category, name, composition)` of every product.
+        path (Path): The index file.
+        embedder (HashedNgramEmbedder): The embedder.
+
+    Returns:
+        int: The number of products that had to be embedded.
+    """
+    existing = np.load(path, mmap_mode="r") if path.exists() else None
+    previous: Dict[int, Tuple[int, int]] = {}
+    if existing is not None and existing.dtype == index_dtype(embedder.dim):
+        previous = {
+            product_id: (text_hash, position)
+            for position, (product_id, text_hash) in enumerate(zip(existing["id"].tolist(), existing["hash"].tolist()))
+        }
+
+    rows = sorted(((category_value(category), product_id, name, composition)
+                   for product_id, category, name, composition in rows))
+    records = np.zeros(len(rows), dtype=index_dtype(embedder.dim))
+    embedded = 0
+    for position, (category, product_id, name, composition) in enumerate(rows):
+        text = product_text(name, composition)
+        text_hash = zlib.crc32(text.encode())
+        cached = previous.get(product_id)
+        if cached is not None and cached[0] == text_hash:
+            vector = existing["vector"][cached[1]]
+        else:
+            vector = embedder.embed(text)
+            embedded += 1
+        records[position] = (product_id, text_hash, category, vector)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as file:
+        np.save(file, records)
+    os.replace(temporary, path)
+    return embedded
+
+
+class ProductIndex:
+    """
+    Read-only view of an index file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Memory-map an index file.
+
+        Args:
+            path (Path): The index file.
+        """
+        self.records = np.load(path, mmap_mode="r")
+        self.embedder = HashedNgramEmbedder(dim=self.records.dtype["vector"].shape[0])
+        categories, starts = np.unique(self.records["category"], return_index=True)
+        ends = list(starts[1:]) + [len(self.records)]
+        self.ranges: Dict[str, Tuple[int, int]] = {
+            str(category): (int(start), int(end)) for category, start, end in zip(categories, starts, ends)
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def search(self, text: str, category: str, k: int) -> List[int]:
+        """
+        Return the ids of the `k` products of a category most similar to a text.
+
+        Args:
+            text (str): The query text, e.g. an ingredient name.
+            category (str): The product category value.
+            k (int): The number of products to return.
+
+        Returns:
+            List[int]: Product ids, most similar first.
+        """
+        start, end = self.ranges.get(category, (0, 0))
+        if start == end:
+            return []
+
+        k = min(k, end - start)
+        scores = self.records["vector"][start:end] @ self.embedder.embed(text)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [int(product_id) for product_id in self.records["id"][start:end][top]]
+
+
+class ProductIndexStore:
+    """
+    Opens the index file of this worker and reopens it when another process replaces it.
+    """
+
+    def __init__(self, *, path: Path, dim: int, check_interval: float, rebuild_delay: float = 0.0) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            path (Path): The index file.
+            dim (int): Number of embedding dimensions of rebuilt indexes.
+            check_interval (float): Minimum number of seconds between checks for a replaced file.
+            rebuild_delay (float): Seconds a scheduled rebuild waits, so that writes made
+                meanwhile are folded into it.
+        """
+        self.path = path
+        self.embedder = HashedNgramEmbedder(dim=dim)
+        self.check_interval = check_interval
+        self.rebuild_delay = rebuild_delay
+        self._index: Optional[ProductIndex] = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+        self._stale = False
+
+    def get(self) -> Optional[ProductIndex]:
+        """
+        Return the current index, or None if it has not been built.
+
+        Returns:
+            Optional[ProductIndex]: The memory-mapped index.
+        """
+        if self._index is None or time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return self._index
+            if (stat.st_ino, stat.st_mtime_ns) != self._file_id:
+                self._index = ProductIndex(self.path)
+                self._file_id = (stat.st_ino, stat.st_mtime_ns)
+                logger.info(f"Product index loaded: {len(self._index)} products from {self.path}")
+        return self._index
+
+    async def rebuild(self) -> None:
+        """
+        Rebuild the index from the database, embedding only new and edited products.
+        """
+        async with self._lock:
+            rows = await ProductModel.all().values_list("id", "category", "name", "composition")
+            embedded = await asyncio.to_thread(build_product_index, rows, path=self.path, embedder=self.embedder)
+            self._checked_at = 0.0
+        logger.info(f"Product index rebuilt: {len(rows)} products, {embedded} embedded")
+
+    def schedule_rebuild(self) -> asyncio.Task:
+        """
+        Rebuild the index in the background after `rebuild_delay` seconds.
+
+        Writes made before the rebuild starts share it; writes made while it runs
+        schedule one more, so the index always catches up with the last write.
+
+        Returns:
+            asyncio.Task: The background rebuild.
+        """
+        self._stale = True
+        if self._rebuild_task is None or self._rebuild_task.done():
+            self._rebuild_task = asyncio.create_task(self._rebuild_while_stale())
+        return self._rebuild_task
+
+    async def _rebuild_while_stale(self) -> None:
+        while self._stale:
+            await asyncio.sleep(self.rebuild_delay)
+            self._stale = False
+            try:
+                await self.rebuild()
+            except Exception as e:
+                logger.error(f"Product index rebuild failed: {e}")
+
+    async def close(self) -> None:
+        """
+        Cancel a scheduled rebuild; the next worker rebuilds the index when it starts.
+        """
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            self._rebuild_task.cancel()
+            await asyncio.gather(self._rebuild_task, return_exceptions=True)
+
+
+# Process-wide product index
+product_index = ProductIndexStore(
+    path=Path(settings.PRODUCT_INDEX_PATH),
+    dim=settings.PRODUCT_INDEX_DIM,
+    check_interval=settings.CATALOG_GENERATION_CHECK_INTERVAL,
+    rebuild_delay=settings.PRODUCT_INDEX_REBUILD_DELAY
+)
+
+
+async def main() -> None:
+    await DB.init_orm()
+    try:
+        await product_index.rebuild()
+    finally:
+        await DB.close_orm()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+import asyncio
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.db.catalog.snapshot import CatalogSnapshot, catalog
+from src.logger.logger import logger
+
+# Words only: numbers in a plan are servings or counts, not recipe features
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]*")
+_STOPWORDS = frozenset({"a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with"})
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split a text into lowercase word tokens without numbers and stopwords.
+    """
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def recipe_text(recipe: Dict[str, Any]) -> str:
+    """
+    Return the searchable text of a recipe: its name, category and ingredient names and categories.
+    """
+    parts = [recipe["name"], str(recipe.get("category") or "")]
+    for ingredient in recipe.get("ingredients") or []:
+        if isinstance(ingredient, dict):
+            parts.extend(str(ingredient.get(key) or "") for key in ("name", "category"))
+    return " ".join(parts)
+
+
+class RecipeIndex:
+    """
+    Immutable in-memory BM25 index over recipes.
+
+    Each term maps to NumPy arrays of the recipes containing it and their
+    precomputed BM25 weights, so a query costs one vectorized addition per query
+    term plus a partial sort, independent of the Python object count.
+    """
+
+    def __init__(self, recipes: Iterable[Dict[str, Any]], *, k1: float = 1.2, b: float = 0.75) -> None:
+        """
+        Build the index.
+
+        Args:
+            recipes (Iterable[Dict[str, Any]]): Recipes with `name`, `category` and `ingredients`.
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 document length normalization.
+        """
+        self.recipes: List[Dict[str, Any]] = list(recipes)
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        lengths = np.zeros(len(self.recipes), dtype=np.int64)
+        for doc_id, recipe in enumerate(self.recipes):
+            tokens = tokenize(recipe_text(recipe))
+            term_ids.extend(vocabulary.setdefault(token, len(vocabulary)) for token in tokens)
+            lengths[doc_id] = len(tokens)
+        if not term_ids:
+            return
+
+        # One (term, recipe) pair per token; counting unique pairs gives the term
+        # frequencies already grouped by term and sorted by recipe.
+        total = len(self.recipes)
+        doc_ids = np.repeat(np.arange(total, dtype=np.int64), lengths)
+        pairs, frequencies = np.unique(np.array(term_ids, dtype=np.int64) * total + doc_ids, return_counts=True)
+        pair_terms, pair_docs = np.divmod(pairs, total)
+
+        document_frequency = np.bincount(pair_terms, minlength=len(vocabulary))
+        idf = np.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+        norms = k1 * (1 - b + b * lengths / max(float(lengths.mean()), 1.0))
+        frequencies = frequencies.astype(np.float32)
+        weights = (idf[pair_terms] * frequencies * (k1 + 1) / (frequencies + norms[pair_docs])).astype(np.float32)
+        pair_docs = pair_docs.astype(np.int32)
+
+        bounds = np.concatenate(([0], np.cumsum(document_frequency)))
+        for term, term_id in vocabulary.items():
+            start, end = bounds[term_id], bounds[term_id + 1]
+            self.postings[term] = (pair_docs[start:end], weights[start:end])
+
+    def __len__(self) -> int:
+        return len(self.recipes)
+
+    def search(self, query: str, k: int) -> List[Dict[str, Any]]:
+        """
+        Return the `k` recipes that best match a query.
+
+        Recipes matching no query term are only used to fill up the result when
+        fewer than `k` recipes match, in catalog order.
+
+        Args:
+            query (str): The query text, e.g. the planner's plan.
+            k (int): The number of recipes to return.
+
+        Returns:
+            List[Dict[str, Any]]: The best matching recipes, best first.
+        """
+        if k >= len(self.recipes):
+            return list(self.recipes)
+
+        scores = np.zeros(len(self.recipes), dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is not None:
+                doc_ids, weights = posting
+                scores[doc_ids] += weights
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [self.recipes[doc_id] for doc_id in top]
+
+
+class RecipeIndexStore:
+    """
+    Keeps the `RecipeIndex` of the current catalog snapshot.
+
+    The index is rebuilt only when the recipe book changes, i.e. when the snapshot's
+    "recipes" generation differs from the one it was built at; product edits reuse it.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty store.
+        """
+        self._index: Optional[RecipeIndex] = None
+        self._built_for: Optional[Tuple[Any, int]] = None
+        self._lock = asyncio.Lock()
+
+    async def for_snapshot(self, snapshot: CatalogSnapshot) -> RecipeIndex:
+        """
+        Return the index of a snapshot's recipes, building it if the recipes changed.
+
+        The build runs in a worker thread, so it never blocks the event loop, and
+        the new index replaces the old one only once it is complete. Concurrent
+        callers share one build.
+
+        Args:
+            snapshot (CatalogSnapshot): The catalog snapshot.
+
+        Returns:
+            RecipeIndex: The recipe index.
+        """
+        key = (snapshot.generations.get("recipes"), len(snapshot.recipes_by_name))
+        if self._index is not None and self._built_for == key:
+            return self._index
+
+        async with self._lock:
+            if self._index is None or self._built_for != key:
+                index = await asyncio.to_thread(RecipeIndex, list(snapshot.recipes_by_name.values()))
+                self._index, self._built_for = index, key
+                logger.info(f"Recipe index built: {len(index)} recipes, {len(index.postings)} terms")
+            return self._index
+
+    async def search(self, query: str, k: int) -> List[Dict[str, Any]]:
+        """
+        Return the `k` recipes of the current catalog that best match a query.
+
+        Args:
+            query (str): The query text.
+            k (int): The number of recipes to return.
+
+        Returns:
+            List[Dict[str, Any]]: The best matching recipes with their `name` and `category`.
+        """
+        snapshot = await catalog.get()
+        return [
+            {"name": recipe["name"], "category": recipe["category"]}
+            for recipe in (await self.for_snapshot(snapshot)).search(query, k)
+        ]
+
+
+# Process-wide recipe index
+recipe_index = RecipeIndexStore()
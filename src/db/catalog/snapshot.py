@@ -0,0 +1,175 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.db.product.enums import category_value
+from src.db.product.model import ProductModel
+from src.db.recipe.model import RecipeModel
+from settings import settings
+from src.logger.logger import logger
+from src.redis_client.services import get_generations
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """
+    Immutable in-memory view of the product catalog and the recipe book.
+
+    Attributes:
+        version (int): Monotonically increasing snapshot number within this process.
+        products_by_category (Mapping[str, Tuple[tuple, ...]]): Product category value mapped to
+            `(name, price, manufacturer, composition)` tuples, the same shape as `get_product_by_category`.
+        recipes_by_name (Mapping[str, Dict[str, Any]]): Recipe name mapped to its `name`, `category`
+            and `ingredients`.
+        generations (Mapping[str, int]): The shared "catalog" and "recipes" cache generations
+            the snapshot was loaded at.
+        products_by_id (Mapping[int, tuple]): Product id mapped to the same product tuple.
+    """
+    version: int
+    products_by_category: Mapping[str, Tuple[tuple, ...]] = field(default_factory=dict)
+    recipes_by_name: Mapping[str, Dict[str, Any]] = field(default_factory=dict)
+    generations: Mapping[str, int] = field(default_factory=dict)
+    products_by_id: Mapping[int, tuple] = field(default_factory=dict)
+
+    def get_products_by_category(self, category: Any) -> List[tuple]:
+        """
+        Return the products of a single category.
+
+        Args:
+            category (Any): A `ProductCategoryEnum` member or its string value.
+
+        Returns:
+            List[tuple]: The product tuples of the category.
+        """
+        return list(self.products_by_category.get(category_value(category), ()))
+
+    def get_products_by_categories(self, categories: Iterable[Any]) -> Dict[str, List[tuple]]:
+        """
+        Return the products of several categories, skipping empty ones.
+
+        Args:
+            categories (Iterable[Any]): Category enum members or string values.
+
+        Returns:
+            Dict[str, List[tuple]]: Category value mapped to its product tuples.
+        """
+        products = {}
+        for category in {category_value(category) for category in categories}:
+            if category in self.products_by_category:
+                products[category] = list(self.products_by_category[category])
+        return products
+
+    def get_recipe(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a recipe by its name, or None if it does not exist.
+        """
+        return self.recipes_by_name.get(name)
+
+    def get_recipes(self) -> List[Dict[str, Any]]:
+        """
+        Return all recipes with their names and categories, like `get_recipes`.
+        """
+        return [
+            {"name": recipe["name"], "category": recipe["category"]}
+            for recipe in self.recipes_by_name.values()
+        ]
+
+
+class CatalogStore:
+    """
+    Holds the current `CatalogSnapshot` of the process.
+
+    Readers always get a complete snapshot. A refresh builds a new snapshot from
+    the database and swaps the reference in one assignment (copy-on-write), so
+    in-flight readers keep a consistent view of the previous version.
+
+    Edits made by other workers are picked up by comparing the snapshot's cache
+    generations with the shared ones, at most once per `check_interval` seconds.
+    """
+
+    # Cache namespaces whose generations track catalog edits
+    NAMESPACES = ("catalog", "recipes")
+
+    def __init__(self, *, check_interval: float = settings.CATALOG_GENERATION_CHECK_INTERVAL) -> None:
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = asyncio.Lock()
+        self.check_interval = check_interval
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> int:
+        """
+        The version of the current snapshot, or 0 if nothing is loaded yet.
+        """
+        return self._snapshot.version if self._snapshot else 0
+
+    async def get(self) -> CatalogSnapshot:
+        """
+        Return the current snapshot, loading it on first use.
+
+        Returns:
+            CatalogSnapshot: The current catalog snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return await self.refresh()
+
+        if time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            if await get_generations(*self.NAMESPACES) != snapshot.generations:
+                logger.info("Catalog changed in another worker, reloading the snapshot.")
+                return await self.refresh()
+        return snapshot
+
+    async def refresh(self) -> CatalogSnapshot:
+        """
+        Reload the catalog from the database and atomically publish a new snapshot.
+
+        Returns:
+            CatalogSnapshot: The newly published snapshot.
+        """
+        async with self._lock:
+            # Read the generations first: an edit racing with the load bumps them
+            # again, so the next check reloads instead of keeping a stale snapshot.
+            generations = await get_generations(*self.NAMESPACES)
+            product_rows = await ProductModel.all().order_by("id").values_list(
+                "id", "category", "name", "price", "manufacturer", "composition"
+            )
+            recipe_rows = await RecipeModel.all().order_by("id").values("name", "category", "ingredients")
+
+            products: Dict[str, List[tuple]] = {}
+            products_by_id: Dict[int, tuple] = {}
+            for product_id, category, *product in product_rows:
+                products_by_id[product_id] = tuple(product)
+                products.setdefault(category_value(category), []).append(products_by_id[product_id])
+
+            recipes = {
+                row["name"]: {
+                    "name": row["name"],
+                    "category": getattr(row["category"], "value", row["category"]),
+                    "ingredients": row["ingredients"] or [],
+                }
+                for row in recipe_rows
+            }
+
+            snapshot = CatalogSnapshot(
+                version=self.version + 1,
+                products_by_category=MappingProxyType({k: tuple(v) for k, v in products.items()}),
+                recipes_by_name=MappingProxyType(recipes),
+                generations=MappingProxyType(generations),
+                products_by_id=MappingProxyType(products_by_id),
+            )
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+
+        logger.info(
+            f"Catalog snapshot v{snapshot.version} loaded: "
+            f"{len(product_rows)} products, {len(recipes)} recipes"
+        )
+        return snapshot
+
+
+# Process-wide catalog instance
+catalog = CatalogStore()
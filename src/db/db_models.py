@@ -1,7 +1,7 @@
 from tortoise.contrib.pydantic import pydantic_model_creator
 
 from src.db.product.model import ProductModel
-from src.db.recipe.model import RecipeModel
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
 
 ProductPydantic = pydantic_model_creator(ProductModel)
 RecipePydantic = pydantic_model_creator(RecipeModel)
\ No newline at end of file
@@ -4,6 +4,10 @@ from settings import settings
 
 DB = PostgresDB(
     dsn=f"postgres://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
-        f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+        f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}",
+    generate_schemas=settings.DB_GENERATE_SCHEMAS,
+    min_size=settings.POSTGRES_POOL_MIN_SIZE,
+    max_size=settings.POSTGRES_POOL_MAX_SIZE,
+    max_inactive_connection_lifetime=settings.POSTGRES_POOL_MAX_INACTIVE_LIFETIME
 )
 
@@ -1,6 +1,7 @@
 from threading import Lock
 from tortoise import Tortoise
 from typing import Optional
+from urllib.parse import urlencode
 
 
 class PostgresDB:
@@ -17,25 +18,44 @@ class PostgresDB:
                     cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, dsn: str) -> None:
+    def __init__(
+        self,
+        dsn: str,
+        generate_schemas: bool = False,
+        min_size: int = 1,
+        max_size: int = 5,
+        max_inactive_connection_lifetime: float = 300.0
+    ) -> None:
         """
         Initialize the database connection.
 
         Args:
             dsn (str): The database connection string.
+            generate_schemas (bool): Whether `init_orm` creates missing tables.
+            min_size (int): Number of connections opened with the pool and kept open.
+            max_size (int): Maximum number of pooled connections.
+            max_inactive_connection_lifetime (float): Seconds after which idle connections
+                above `min_size` are closed; 0 keeps them open.
         """
         if not hasattr(self, "_dsn"):
-            self._dsn = dsn
+            pool = urlencode({
+                "minsize": min_size,
+                "maxsize": max_size,
+                "max_inactive_connection_lifetime": max_inactive_connection_lifetime
+            })
+            self._dsn = f"{dsn}{'&' if '?' in dsn else '?'}{pool}"
+            self._generate_schemas = generate_schemas
 
     async def init_orm(self) -> None:
         """
-        Initialize the ORM and generate database schemas.py.
+        Initialize the ORM, generating missing database schemas if enabled.
         """
         await Tortoise.init(
             db_url=self._dsn,
             modules={"models": ["src.db.db_models"]},
         )
-        await Tortoise.generate_schemas()
+        if self._generate_schemas:
+            await Tortoise.generate_schemas()
 
     async def close_orm(self) -> None:
         """
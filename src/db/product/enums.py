@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any
 
 class ProductCategoryEnum(str, Enum):
     SAUCES = "sauces"
@@ -23,3 +24,13 @@ class ProductCategoryEnum(str, Enum):
     ORGANIC = "organic"
     CONVENIENCE_FOODS = "convenience_foods"
     INTERNATIONAL_FOODS = "international_foods"
+
+
+def category_value(category: Any) -> str:
+    """
+    Normalize a category enum member or raw string to its plain string value.
+
+    Enum members and their string values hash differently, so dictionaries keyed
+    by category always use the plain string.
+    """
+    return category.value if isinstance(category, ProductCategoryEnum) else str(category)
@@ -44,3 +44,6 @@ class ProductModel(CommonModel):
         description="The main composition or ingredients of the product (optional)."
     )
 
+    class Meta:
+        # Candidate lookups filter by category and rank by price
+        indexes = (("category", "price"),)
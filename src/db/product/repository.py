@@ -1,6 +1,9 @@
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from typing import Dict, Any, Iterable, List, Optional
 
-from src.db.product.enums import ProductCategoryEnum
+from tortoise.transactions import in_transaction
+
+from src.db.product.enums import ProductCategoryEnum, category_value
 from src.db.product.model import ProductModel
 
 
@@ -19,6 +22,31 @@ async def get_product_by_category(*, category: str) -> List[tuple]:
     )
 
 
+async def get_products_by_categories(*, categories: Iterable[str]) -> Dict[str, List[tuple]]:
+    """
+    Retrieve products for several categories in a single query.
+
+    Args:
+        categories: The category names. Duplicates are ignored.
+
+    Returns:
+        A mapping of category name to a list of tuples containing product details,
+        in the same shape as `get_product_by_category`.
+    """
+    unique_categories = list({category_value(category) for category in categories})
+    if not unique_categories:
+        return {}
+
+    rows = await ProductModel.filter(category__in=unique_categories).values_list(
+        "category", "name", "price", "manufacturer", "composition"
+    )
+
+    products: Dict[str, List[tuple]] = defaultdict(list)
+    for category, *product in rows:
+        products[category_value(category)].append(tuple(product))
+    return dict(products)
+
+
 async def get_product_by_name(*, name: str) -> Optional[ProductModel]:
     """
     Retrieve a product by its name.
@@ -98,3 +126,67 @@ async def delete_product(name: str) -> int:
         The number of deleted rows.
     """
     return await ProductModel.filter(name=name).delete()
+
+
+async def upsert_products(*, products: List[Dict[str, Any]]) -> int:
+    """
+    Insert or update several products in one transaction, matching them by name.
+
+    Later duplicates of a name within the batch win.
+
+    Args:
+        products (List[Dict[str, Any]]): The product fields, as for `create_product`.
+
+    Returns:
+        int: The number of products written.
+    """
+    unique = {product["name"]: product for product in products}
+    async with in_transaction():
+        await ProductModel.bulk_create(
+            [ProductModel(**product) for product in unique.values()],
+            on_conflict=["name"],
+            update_fields=["price", "category", "manufacturer", "composition"]
+        )
+    return len(unique)
+
+
+async def list_products(
+    *,
+    limit: int,
+    after_id: Optional[int] = None,
+    category: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    name_prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve one page of products ordered by id, optionally filtered.
+
+    Pages are keyset-paginated: pass the id of the last product of the previous
+    page as `after_id`, so every page is one index range scan.
+
+    Args:
+        limit (int): Maximum number of products to return.
+        after_id (Optional[int]): Only return products with a greater id.
+        category (Optional[str]): Only return products of this category.
+        min_price (Optional[float]): Only return products at least this expensive.
+        max_price (Optional[float]): Only return products at most this expensive.
+        name_prefix (Optional[str]): Only return products whose name starts with this text (case-sensitive).
+
+    Returns:
+        List[Dict[str, Any]]: The products with their id and fields, as plain dicts.
+    """
+    query = ProductModel.all()
+    if after_id is not None:
+        query = query.filter(id__gt=after_id)
+    if category is not None:
+        query = query.filter(category=category_value(category))
+    if min_price is not None:
+        query = query.filter(price__gte=min_price)
+    if max_price is not None:
+        query = query.filter(price__lte=max_price)
+    if name_prefix:
+        query = query.filter(name__startswith=name_prefix)
+    return await query.order_by("id").limit(limit).values(
+        "id", "name", "price", "category", "manufacturer", "composition"
+    )
@@ -0,0 +1,44 @@
+import asyncio
+from typing import List
+
+from tortoise.expressions import Subquery
+from tortoise.transactions import in_transaction
+
+from src.db.db_setup import DB
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
+from src.db.recipe.repository import build_ingredient_rows
+from src.logger.logger import logger
+
+
+async def migrate_recipe_ingredients(*, batch_size: int = 1000) -> int:
+    """
+    Fill the ingredient table from the `ingredients` JSON of recipes that have no ingredient rows yet.
+
+    Safe to run repeatedly: recipes that already have rows are skipped.
+
+    Args:
+        batch_size (int): Number of ingredient rows inserted per statement.
+
+    Returns:
+        int: The number of ingredient rows created.
+    """
+    recipes = await RecipeModel.exclude(id__in=Subquery(RecipeIngredientModel.all().values("recipe_id")))
+
+    rows: List[RecipeIngredientModel] = [row for recipe in recipes for row in build_ingredient_rows(recipe)]
+    if rows:
+        async with in_transaction():
+            await RecipeIngredientModel.bulk_create(rows, batch_size=batch_size)
+        logger.info(f"Migrated {len(rows)} ingredients of {len(recipes)} recipes to the ingredient table")
+    return len(rows)
+
+
+async def main() -> None:
+    await DB.init_orm()
+    try:
+        await migrate_recipe_ingredients()
+    finally:
+        await DB.close_orm()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
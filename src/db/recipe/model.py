@@ -1,5 +1,6 @@
 from tortoise import fields
 from src.db.common.model import CommonModel
+from src.db.product.enums import ProductCategoryEnum
 from src.db.recipe.enums import RecipeCategoryEnum
 
 
@@ -27,3 +28,45 @@ class RecipeModel(CommonModel):
     ingredients = fields.JSONField(
         description="A JSON object representing the ingredients of the recipe, including name, quantity, category, etc."
     )
+
+
+class RecipeIngredientModel(CommonModel):
+    """
+    ORM model representing one ingredient of a recipe.
+
+    Mirrors the entries of `RecipeModel.ingredients`, so recipes can be filtered
+    and joined to products by category in SQL.
+
+    Attributes:
+        recipe (RecipeModel): The recipe the ingredient belongs to.
+        name (str): The name of the ingredient.
+        category (ProductCategoryEnum): The product category the ingredient is bought from.
+        weight_grams (int, optional): The amount of the ingredient in grams. Can be null.
+    """
+    recipe: fields.ForeignKeyRelation[RecipeModel] = fields.ForeignKeyField(
+        "models.RecipeModel",
+        related_name="ingredient_rows",
+        on_delete=fields.CASCADE,
+        description="The recipe the ingredient belongs to."
+    )
+
+    name: str = fields.CharField(
+        max_length=100,
+        description="The name of the ingredient."
+    )
+
+    category: ProductCategoryEnum = fields.CharEnumField(
+        ProductCategoryEnum,
+        max_length=20,
+        index=True,
+        description="The product category the ingredient is bought from."
+    )
+
+    weight_grams: int = fields.IntField(
+        null=True,
+        default=None,
+        description="The amount of the ingredient in grams (optional)."
+    )
+
+    class Meta:
+        indexes = (("recipe_id", "category"),)
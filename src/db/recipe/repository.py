@@ -1,6 +1,17 @@
-from typing import Dict, Any, Optional, List
-from src.db.recipe.model import RecipeModel
+from collections import defaultdict
+from typing import Dict, Any, Iterable, Optional, List
+
+from pypika_tortoise import Table
+from pypika_tortoise.functions import Coalesce, Max
+from tortoise import connections
+from tortoise.expressions import Subquery
+from tortoise.transactions import in_transaction
+
+from src.db.product.enums import ProductCategoryEnum, category_value
+from src.db.product.model import ProductModel
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
 from src.db.recipe.enums import RecipeCategoryEnum
+from src.logger.logger import logger
 
 
 async def get_recipe_by_name(*, name: str) -> Optional[RecipeModel]:
@@ -16,6 +27,22 @@ async def get_recipe_by_name(*, name: str) -> Optional[RecipeModel]:
     return await RecipeModel.get_or_none(name=name)
 
 
+async def get_recipes_by_names(*, names: Iterable[str]) -> List[RecipeModel]:
+    """
+    Retrieve several recipes by their names in a single query.
+
+    Args:
+        names (Iterable[str]): The names of the recipes to retrieve.
+
+    Returns:
+        List[RecipeModel]: The recipes that were found. Missing names are skipped.
+    """
+    unique_names = list(set(names))
+    if not unique_names:
+        return []
+    return await RecipeModel.filter(name__in=unique_names)
+
+
 async def get_recipes() -> List[Dict[str, Any]]:
     """
     Retrieve all recipes with their names and categories.
@@ -26,6 +53,44 @@ async def get_recipes() -> List[Dict[str, Any]]:
     return await RecipeModel.all().values("name", "category")
 
 
+async def list_recipes(
+    *,
+    limit: int,
+    after_id: Optional[int] = None,
+    category: Optional[str] = None,
+    ingredient_category: Optional[str] = None,
+    name_prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve one page of recipes ordered by id, optionally filtered.
+
+    Pages are keyset-paginated: pass the id of the last recipe of the previous
+    page as `after_id`, so every page is one index range scan.
+
+    Args:
+        limit (int): Maximum number of recipes to return.
+        after_id (Optional[int]): Only return recipes with a greater id.
+        category (Optional[str]): Only return recipes of this category.
+        ingredient_category (Optional[str]): Only return recipes with an ingredient of this product category.
+        name_prefix (Optional[str]): Only return recipes whose name starts with this text (case-sensitive).
+
+    Returns:
+        List[Dict[str, Any]]: The recipes with their id and fields, as plain dicts.
+    """
+    query = RecipeModel.all()
+    if after_id is not None:
+        query = query.filter(id__gt=after_id)
+    if category is not None:
+        query = query.filter(category=category)
+    if ingredient_category is not None:
+        query = query.filter(id__in=Subquery(
+            RecipeIngredientModel.filter(category=category_value(ingredient_category)).values("recipe_id")
+        ))
+    if name_prefix:
+        query = query.filter(name__startswith=name_prefix)
+    return await query.order_by("id").limit(limit).values("id", "name", "category", "ingredients")
+
+
 async def create_recipe(
     *,
     name: str,
@@ -45,11 +110,13 @@ async def create_recipe(
     """
     recipe = await get_recipe_by_name(name=name)
     if not recipe:
-        recipe = await RecipeModel.create(
-            name=name,
-            category=category,
-            ingredients=ingredients
-        )
+        async with in_transaction():
+            recipe = await RecipeModel.create(
+                name=name,
+                category=category,
+                ingredients=ingredients
+            )
+            await RecipeIngredientModel.bulk_create(build_ingredient_rows(recipe))
     return recipe
 
 
@@ -69,7 +136,11 @@ async def update_recipe(
     """
     for field, value in update_data.items():
         setattr(recipe, field, value)
-    await recipe.save()
+    async with in_transaction():
+        await recipe.save()
+        if "ingredients" in update_data:
+            await RecipeIngredientModel.filter(recipe_id=recipe.id).delete()
+            await RecipeIngredientModel.bulk_create(build_ingredient_rows(recipe))
     return recipe
 
 
@@ -86,3 +157,141 @@ async def delete_recipe(name: str) -> int:
     return await RecipeModel.filter(name=name).delete()
 
 
+def build_ingredient_rows(recipe: RecipeModel) -> List[RecipeIngredientModel]:
+    """
+    Build the (unsaved) ingredient rows of a recipe from its `ingredients` JSON.
+
+    Ingredients without a valid product category are skipped.
+
+    Args:
+        recipe (RecipeModel): The saved recipe.
+
+    Returns:
+        List[RecipeIngredientModel]: The ingredient rows.
+    """
+    rows = []
+    for ingredient in recipe.ingredients or []:
+        try:
+            category = ProductCategoryEnum(category_value(ingredient.get("category")))
+        except (AttributeError, ValueError):
+            logger.warning(f"Skipping ingredient of '{recipe.name}' without a valid category: {ingredient}")
+            continue
+        rows.append(RecipeIngredientModel(
+            recipe_id=recipe.id,
+            name=str(ingredient.get("name") or category.value)[:100],
+            category=category,
+            weight_grams=ingredient.get("weight_grams")
+        ))
+    return rows
+
+
+async def get_recipe_names_by_ingredient_category(*, category: str) -> List[str]:
+    """
+    Retrieve the names of the recipes that use an ingredient of a product category.
+
+    Args:
+        category (str): The product category.
+
+    Returns:
+        List[str]: The recipe names.
+    """
+    return await RecipeModel.filter(
+        ingredient_rows__category=category_value(category)
+    ).distinct().values_list("name", flat=True)
+
+
+async def get_candidate_products(
+    *,
+    names: Iterable[str],
+    limit_per_ingredient: Optional[int] = None
+) -> Dict[str, List[List[tuple]]]:
+    """
+    Retrieve the candidate products of every ingredient of several recipes in a single query.
+
+    Recipes are joined to their ingredient rows and those to the products of the
+    same category, cheapest first. With `limit_per_ingredient`, only products up to
+    the price of the n-th cheapest of the category are returned (products tied at
+    that price included), which keeps the join a range scan of the `(category, price)` index.
+
+    Args:
+        names (Iterable[str]): The recipe names.
+        limit_per_ingredient (Optional[int]): Maximum number of products per ingredient.
+
+    Returns:
+        Dict[str, List[List[tuple]]]: Recipe name mapped to the candidate product tuples
+            `(name, price, manufacturer, composition)` of each ingredient, in ingredient order.
+            Ingredients without products are left out.
+    """
+    unique_names = list(set(names))
+    if not unique_names:
+        return {}
+
+    connection = connections.get("default")
+    query_class = connection.query_class
+    recipe = Table(RecipeModel._meta.db_table)
+    ingredient = Table(RecipeIngredientModel._meta.db_table)
+    product = Table(ProductModel._meta.db_table)
+
+    query = (
+        query_class.from_(ingredient)
+        .join(recipe).on(ingredient.recipe_id == recipe.id)
+        .join(product).on(product.category == ingredient.category)
+        .select(
+            recipe.name.as_("recipe"), ingredient.id.as_("ingredient_id"),
+            product.name, product.price, product.manufacturer, product.composition
+        )
+        .where(recipe.name.isin(unique_names))
+        .orderby(recipe.id, ingredient.id, product.price, product.id)
+    )
+    if limit_per_ingredient is not None:
+        # The price of the n-th cheapest product of the ingredient's category (or the
+        # highest price if there are fewer), so the join becomes an index range scan.
+        cheapest = Table(ProductModel._meta.db_table).as_("cheapest")
+        priciest = Table(ProductModel._meta.db_table).as_("priciest")
+        price_limit = Coalesce(
+            query_class.from_(cheapest)
+            .select(cheapest.price)
+            .where(cheapest.category == ingredient.category)
+            .orderby(cheapest.price)
+            .limit(1)
+            .offset(limit_per_ingredient - 1),
+            query_class.from_(priciest)
+            .select(Max(priciest.price))
+            .where(priciest.category == ingredient.category)
+        )
+        query = query.where(product.price <= price_limit)
+
+    rows = await connection.execute_query_dict(*query.get_parameterized_sql())
+
+    candidates: Dict[str, Dict[int, List[tuple]]] = defaultdict(dict)
+    for row in rows:
+        candidates[row["recipe"]].setdefault(row["ingredient_id"], []).append(
+            (row["name"], row["price"], row["manufacturer"], row["composition"])
+        )
+    return {name: list(ingredients.values()) for name, ingredients in candidates.items()}
+
+
+async def upsert_recipes(*, recipes: List[Dict[str, Any]]) -> int:
+    """
+    Insert or update several recipes and their ingredient rows in one transaction,
+    matching recipes by name.
+
+    Later duplicates of a name within the batch win.
+
+    Args:
+        recipes (List[Dict[str, Any]]): The recipe fields, as for `create_recipe`.
+
+    Returns:
+        int: The number of recipes written.
+    """
+    unique = {recipe["name"]: recipe for recipe in recipes}
+    async with in_transaction():
+        await RecipeModel.bulk_create(
+            [RecipeModel(**recipe) for recipe in unique.values()],
+            on_conflict=["name"],
+            update_fields=["category", "ingredients"]
+        )
+        saved = await RecipeModel.filter(name__in=list(unique))
+        await RecipeIngredientModel.filter(recipe_id__in=[recipe.id for recipe in saved]).delete()
+        await RecipeIngredientModel.bulk_create([row for recipe in saved for row in build_ingredient_rows(recipe)])
+    return len(unique)
@@ -0,0 +1,20 @@
+import asyncio
+
+from tortoise import Tortoise
+
+from src.db.db_setup import DB
+
+
+async def main() -> None:
+    """
+    Create the missing tables and indexes of every model, leaving existing ones untouched.
+    """
+    await DB.init_orm()
+    try:
+        await Tortoise.generate_schemas(safe=True)
+    finally:
+        await DB.close_orm()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
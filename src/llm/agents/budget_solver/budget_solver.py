@@ -0,0 +1,127 @@
+from typing import Any, Iterable, List, Mapping, Sequence
+
+from src.db.catalog.snapshot import catalog
+from src.db.product.enums import category_value
+from src.llm.agents.budget_solver.schemas import BasketSelection
+from src.llm.agents.product_finder.schemas import ProductInfo
+from src.llm.graph_schema import AgentState
+from src.logger.logger import logger
+
+
+def matches_ingredient(ingredient_name: str, product_name: str) -> bool:
+    """
+    Check whether a product name refers to an ingredient, e.g. "Cheese" and "Gouda Cheese 200g".
+    """
+    ingredient_name, product_name = ingredient_name.casefold().strip(), product_name.casefold()
+    return bool(ingredient_name) and (ingredient_name in product_name or product_name in ingredient_name)
+
+
+def select_cheapest_basket(
+    *,
+    candidates: Mapping[str, Sequence[tuple]],
+    ingredients: Iterable[Mapping[str, Any]],
+    budget: float
+) -> BasketSelection:
+    """
+    Pick the cheapest product for every required ingredient and check the basket against the budget.
+
+    Each ingredient gets the cheapest product of its category whose name matches
+    the ingredient name, or the cheapest product of the category if none does.
+    Ingredients are independent, so the per-ingredient minimum is the min-cost
+    basket. If even that basket exceeds the budget, the budget is infeasible.
+
+    Args:
+        candidates (Mapping[str, Sequence[tuple]]): Category value mapped to
+            `(name, price, manufacturer, composition)` tuples.
+        ingredients (Iterable[Mapping[str, Any]]): One entry with `name` and `category` per
+            ingredient of every selected recipe.
+        budget (float): The user's budget.
+
+    Returns:
+        BasketSelection: One product per ingredient, their total cost and whether they fit the budget.
+    """
+    products: List[ProductInfo] = []
+    missing: List[str] = []
+
+    for ingredient in ingredients:
+        category = category_value(ingredient["category"])
+        options = candidates.get(category)
+        if not options:
+            if category not in missing:
+                missing.append(category)
+            continue
+
+        named = [option for option in options if matches_ingredient(ingredient.get("name", ""), option[0])]
+        name, price, manufacturer, composition = min(named or options, key=lambda option: option[1])
+        products.append(ProductInfo(
+            name=name,
+            price=price,
+            manufacturer=manufacturer or "",
+            composition=composition or ""
+        ))
+
+    total_cost = sum(product.price for product in products)
+    return BasketSelection(
+        products=products,
+        total_cost=total_cost,
+        feasible=total_cost <= budget,
+        missing_categories=missing
+    )
+
+
+class BudgetSolverAgent:
+    """
+    BudgetSolverAgent replaces an over-budget basket with the min-cost basket
+    for the selected recipes, without calling an LLM.
+    """
+
+    @staticmethod
+    async def generate(user_input: AgentState) -> AgentState:
+        """
+        Select the cheapest product for every ingredient of the selected recipes and update the state.
+
+        Args:
+            user_input (AgentState): The current agent state containing recipes and budget.
+
+        Returns:
+            AgentState: The updated state with the solved products, total cost and budget status.
+        """
+        recipes = user_input.get("recipes") or []
+        budget = user_input["budget"]
+        snapshot = await catalog.get()
+
+        ingredients = [
+            ingredient
+            for name in recipes
+            for ingredient in (snapshot.get_recipe(name) or {}).get("ingredients", [])
+            if ingredient.get("category")
+        ]
+        selection = select_cheapest_basket(
+            candidates=snapshot.get_products_by_categories(ingredient["category"] for ingredient in ingredients),
+            ingredients=ingredients,
+            budget=budget
+        )
+
+        if selection.missing_categories:
+            logger.warning(f"BudgetSolverAgent found no products for categories: {selection.missing_categories}")
+
+        user_input["budget_solved"] = True
+        if not selection.products:
+            user_input["final_budget_status"] = "No catalog products found for the selected recipes."
+            logger.warning(f"BudgetSolverAgent: {user_input['final_budget_status']}")
+            return user_input
+
+        user_input["products"] = selection.products
+        user_input["total_cost"] = selection.total_cost
+        user_input["within_budget"] = selection.feasible
+
+        if selection.feasible:
+            logger.info(f"BudgetSolverAgent found a basket for {selection.total_cost} within budget {budget}.")
+        else:
+            user_input["final_budget_status"] = (
+                f"Budget is infeasible: the cheapest basket for the selected recipes "
+                f"costs {selection.total_cost}, which exceeds the budget of {budget}."
+            )
+            logger.info(f"BudgetSolverAgent: {user_input['final_budget_status']}")
+
+        return user_input
@@ -0,0 +1,14 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+from src.llm.agents.product_finder.schemas import ProductInfo
+
+
+class BasketSelection(BaseModel):
+    products: List[ProductInfo] = Field(..., description="The cheapest matching product for every required ingredient.")
+    total_cost: float = Field(..., description="The total price of the selected products.")
+    feasible: bool = Field(..., description="True if the total cost fits within the budget.")
+    missing_categories: List[str] = Field(
+        default_factory=list,
+        description="Required categories with no product in the catalog."
+    )
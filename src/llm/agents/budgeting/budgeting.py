@@ -3,21 +3,39 @@ from typing import List, Tuple
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from settings import settings
+
 from src.llm.agents.budgeting.schemas import BudgetingStructuredSchema
 from src.llm.agents.common.base_agent import BaseLLMAgent
 from src.llm.agents.product_finder.schemas import ProductInfo
 from src.llm.graph_schema import AgentState
 from src.logger.logger import logger
 from src.redis_client.client import cache
-from src.redis_client.services import make_cache_key
+from src.redis_client.services import get_cache_namespaces, make_cache_key
 
 
 class BudgetingAgent(BaseLLMAgent):
     """
     Agent responsible for determining if selected products fit within the user's budget.
-    Uses caching to avoid redundant LLM calls for the same product/budget combination.
+
+    In the default deterministic mode the total is compared with the budget in Python.
+    The LLM is only called in the opt-in explain mode, with caching to avoid redundant
+    calls for the same product/budget combination.
     """
 
+    @staticmethod
+    def calculate_total(products: List[ProductInfo]) -> float:
+        """
+        Calculate the total price of the products.
+
+        Args:
+            products (List[ProductInfo]): List of selected products.
+
+        Returns:
+            float: The sum of the product prices.
+        """
+        return sum(product.price for product in products)
+
     async def create_prompt(self, products: List[ProductInfo], budget: float) -> Tuple[str, float]:
         """
         Create the prompt to send to the LLM.
@@ -30,7 +48,7 @@ class BudgetingAgent(BaseLLMAgent):
             Tuple[str, float]: The constructed prompt and total price of the products.
         """
         prompt_text = await self.get_prompt(agent_name=Path(__file__).parent.name)
-        total_price = sum(product.price for product in products)
+        total_price = self.calculate_total(products)
 
         messages = [
             SystemMessage(content=prompt_text),
@@ -58,7 +76,21 @@ class BudgetingAgent(BaseLLMAgent):
         cache_key = make_cache_key("budgeting", {
             "products": [p.model_dump() for p in products],
             "budget": budget
-        })
+        }, namespaces=await get_cache_namespaces())
+
+        if settings.BUDGETING_MODE == "deterministic":
+            total_price = self.calculate_total(products)
+            within_budget = total_price <= budget
+            logger.info(f"BudgetingAgent deterministic check: {total_price} <= {budget} is {within_budget}")
+
+            await cache.set(cache_key, {
+                "within_budget": within_budget,
+                "total_cost": total_price
+            })
+
+            user_input["within_budget"] = within_budget
+            user_input["total_cost"] = total_price
+            return user_input
 
         cached_result = await cache.get(cache_key)
         if cached_result:
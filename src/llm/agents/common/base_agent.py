@@ -1,8 +1,7 @@
 import aiofiles
-from langchain_ollama import ChatOllama
-from langchain_openai import ChatOpenAI
 
 from settings import settings
+from src.llm.agents.common.token_counter import TokenUsageCallback
 
 
 class BaseLLMAgent:
@@ -16,17 +15,25 @@ class BaseLLMAgent:
         Initialize the LLM client based on the configured provider.
 
         If `LLM_NAME` is 'openai', uses OpenAI Chat model.
-        Otherwise, uses Ollama.
+        Otherwise, uses Ollama. Token usage of every call is recorded under the agent's class name.
+        Only the configured provider's package is imported, on first use.
         """
+        callbacks = [TokenUsageCallback(type(self).__name__)]
         if settings.LLM_NAME == "openai":
+            from langchain_openai import ChatOpenAI
+
             self.llm = ChatOpenAI(
                 model=settings.OPENAI_MODEL,
-                api_key=settings.OPENAI_API_KEY
+                api_key=settings.OPENAI_API_KEY,
+                callbacks=callbacks
             )
         else:
+            from langchain_ollama import ChatOllama
+
             self.llm = ChatOllama(
                 model=settings.OLLAMA_MODEL,
-                base_url=settings.OLLAMA_BASE_URL
+                base_url=settings.OLLAMA_BASE_URL,
+                callbacks=callbacks
             )
 
     @staticmethod
@@ -0,0 +1,67 @@
+import csv
+import io
+from typing import Any, Dict, Iterable, List, Sequence
+
+# Column names of the product tuples kept in the catalog snapshot
+PRODUCT_COLUMNS = ("name", "price", "manufacturer", "composition")
+
+
+def format_table(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """
+    Render rows as a compact CSV table with a header line.
+
+    Args:
+        columns (Sequence[str]): The column names.
+        rows (Iterable[Sequence[Any]]): The table rows.
+
+    Returns:
+        str: The table, one line per row, quoted only where a value needs it.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return buffer.getvalue().rstrip("\n")
+
+
+def format_product_candidates(candidates: Dict[str, List[List[tuple]]]) -> str:
+    """
+    Render the candidate products of each recipe as a deduplicated product table
+    followed by per-recipe references to it.
+
+    Every product is listed once with a numeric id, even when several ingredients or
+    recipes share it. Each recipe then lists its ingredients separated by ";", each
+    ingredient as the "|"-separated ids of its candidate products.
+
+    Args:
+        candidates (Dict[str, List[List[tuple]]]): Recipe name mapped to the candidate
+            product tuples of each of its ingredients.
+
+    Returns:
+        str: The rendered product table and recipe references.
+    """
+    ids: Dict[tuple, int] = {}
+    references = []
+    for recipe, ingredients in candidates.items():
+        options = []
+        for products in ingredients:
+            product_ids = [ids.setdefault(tuple(product), len(ids) + 1) for product in products]
+            options.append("|".join(map(str, product_ids)))
+        references.append((recipe, "; ".join(options)))
+
+    products_table = format_table(("id", *PRODUCT_COLUMNS), [(index, *product) for product, index in ids.items()])
+    recipes_table = format_table(("recipe", "ingredient options (product ids)"), references)
+    return f"Products:\n{products_table}\n\nRecipes:\n{recipes_table}"
+
+
+def format_recipes(recipes: List[Dict[str, Any]]) -> str:
+    """
+    Render recipes as a compact table of names and categories.
+
+    Args:
+        recipes (List[Dict[str, Any]]): Recipes with `name` and `category`.
+
+    Returns:
+        str: The rendered recipe table.
+    """
+    return format_table(("name", "category"), [(recipe["name"], recipe["category"]) for recipe in recipes])
@@ -0,0 +1,96 @@
+from collections import defaultdict
+from functools import cache
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from src.logger.logger import logger
+
+# Token totals of each agent in this worker
+token_usage: Dict[str, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0})
+
+
+@cache
+def get_encoding() -> Optional[Any]:
+    """
+    Load tiktoken's cl100k_base encoding on first use, or return None if it is unavailable.
+
+    Loading may download the encoding, so it is deferred until tokens are first counted.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # tiktoken missing or its encoding cannot be downloaded
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens from length: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a text with tiktoken's cl100k_base encoding, or
+    estimate them as one token per four characters when it is unavailable.
+
+    Args:
+        text (str): The text to count.
+
+    Returns:
+        int: The number of tokens.
+    """
+    encoding = get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + 3) // 4
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """
+    LangChain callback that logs the prompt and completion tokens of every LLM
+    call of an agent and adds them to `token_usage`.
+
+    Counts reported by the provider are used when present; otherwise the prompt
+    and completion are counted locally with `count_tokens`.
+    """
+
+    def __init__(self, agent_name: str) -> None:
+        """
+        Initialize the callback.
+
+        Args:
+            agent_name (str): The agent the counts are recorded under.
+        """
+        self.agent_name = agent_name
+        self._prompts: Dict[UUID, str] = {}
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List[List[BaseMessage]], *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._prompts[run_id] = "\n".join(str(message.content) for batch in messages for message in batch)
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs: Any) -> None:
+        self._prompts[run_id] = "\n".join(prompts)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._prompts.pop(run_id, None)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        prompt = self._prompts.pop(run_id, "")
+        generation = response.generations[0][0] if response.generations and response.generations[0] else None
+        message = getattr(generation, "message", None)
+        usage = getattr(message, "usage_metadata", None)
+
+        if usage:
+            prompt_tokens, completion_tokens = usage["input_tokens"], usage["output_tokens"]
+        else:
+            completion = generation.text if generation else ""
+            if message is not None and getattr(message, "tool_calls", None):
+                completion += str(message.tool_calls)
+            prompt_tokens, completion_tokens = count_tokens(prompt), count_tokens(completion)
+
+        totals = token_usage[self.agent_name]
+        totals["calls"] += 1
+        totals["prompt_tokens"] += prompt_tokens
+        totals["completion_tokens"] += completion_tokens
+        logger.info(f"{self.agent_name} tokens: prompt={prompt_tokens}, completion={completion_tokens}")
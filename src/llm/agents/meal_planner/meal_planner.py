@@ -0,0 +1,140 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from settings import settings
+from src.db.catalog.recipe_index import recipe_index
+from src.db.catalog.snapshot import catalog
+from src.llm.agents.common.base_agent import BaseLLMAgent
+from src.llm.agents.common.prompt_format import format_recipes
+from src.llm.agents.meal_planner.schemas import MealPlanStructuredSchema
+from src.llm.agents.planner.plan_cache import normalize_user_input, plan_cache
+from src.llm.graph_schema import AgentState
+from src.logger.logger import logger
+from src.redis_client.client import cache
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+from src.redis_client.single_flight import single_flight
+
+
+class MealPlannerAgent(BaseLLMAgent):
+    """
+    MealPlannerAgent replaces the PlannerAgent and RecipeAgent with a single LLM
+    call that returns the plan, intent, servings and recipes together.
+
+    It reads and writes the same cache entries as the two agents it replaces, so
+    the caches stay warm when switching between the modes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the MealPlannerAgent with the appropriate LLM client.
+        """
+        super().__init__()
+
+    async def create_prompt(self, user_input_content: str) -> str:
+        """
+        Construct a prompt for the LLM using the user input and available recipes.
+
+        Args:
+            user_input_content (str): The raw user input text.
+
+        Returns:
+            str: The assembled prompt text for the LLM.
+        """
+        prompt = await self.get_prompt(agent_name=Path(__file__).parent.name)
+        if settings.RECIPE_RETRIEVAL_TOP_K:
+            recipes = await recipe_index.search(user_input_content, settings.RECIPE_RETRIEVAL_TOP_K)
+        else:
+            recipes = (await catalog.get()).get_recipes()
+
+        messages = [
+            SystemMessage(content=prompt),
+            HumanMessage(content=f"User's input: {user_input_content}"),
+            SystemMessage(content=f"Recipes:\n{format_recipes(recipes)}")
+        ]
+
+        final_request = "\n".join([message.content for message in messages])
+        logger.info(f"MealPlannerAgent prompt: {final_request}")
+        return final_request
+
+    @staticmethod
+    async def recipes_cache_key(plan: str) -> str:
+        """
+        Build the recipe cache key of a plan, exactly as RecipeAgent does.
+        """
+        return make_cache_key("plan", plan, namespaces=await get_cache_namespaces("recipes"))
+
+    async def get_cached(self, user_message: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached plan and recipes of a request, if both are cached.
+
+        Args:
+            user_message (str): The raw user input text.
+
+        Returns:
+            Optional[Dict[str, Any]]: The `plan`, `intent`, `servings` and `recipes`, or None.
+        """
+        planned = await plan_cache.get(user_message)
+        if not planned:
+            return None
+        recipes = await cache.get(await self.recipes_cache_key(planned["plan"]))
+        if not recipes:
+            return None
+        return {**planned, "recipes": recipes}
+
+    async def generate(self, user_input: AgentState) -> AgentState:
+        """
+        Generate the plan, user intent, servings and recipes in one LLM call.
+
+        Args:
+            user_input (AgentState): The current agent state including the user's message.
+
+        Returns:
+            AgentState: The updated agent state with the plan, intent, servings and recipes.
+        """
+        user_message = user_input.get("user_input", "")
+        cache_key = make_cache_key(
+            "meal_planner", normalize_user_input(user_message), namespaces=await get_cache_namespaces("recipes")
+        )
+
+        # The combined entry first, then the entries the separate Planner and Recipe agents left
+        result = await cache.get(cache_key) or await self.get_cached(user_message)
+        if result:
+            logger.info(f"MealPlannerAgent cache hit: {result}")
+        else:
+            result = await single_flight.run(
+                cache_key, lambda: self.create_meal_plan(user_message=user_message, cache_key=cache_key)
+            )
+
+        user_input["plan"] = result["plan"]
+        user_input["user_intent"] = result["intent"]
+        user_input["servings"] = result["servings"]
+        user_input["recipes"] = result["recipes"]
+
+        return user_input
+
+    async def create_meal_plan(self, *, user_message: str, cache_key: str) -> Dict[str, Any]:
+        """
+        Ask the LLM for the plan and recipes and populate the planner and recipe caches.
+
+        Args:
+            user_message (str): The raw user input text.
+            cache_key (str): The cache key to store the combined result under.
+
+        Returns:
+            Dict[str, Any]: The `plan`, `intent`, `servings` and `recipes`.
+        """
+        prompt = await self.create_prompt(user_input_content=user_message)
+        llm_with_structured_output = self.llm.with_structured_output(MealPlanStructuredSchema)
+        llm_response = await llm_with_structured_output.ainvoke(prompt)
+
+        logger.info(f"MealPlannerAgent response: {llm_response}")
+
+        planned = llm_response.model_dump(include={"plan", "intent", "servings"})
+        await plan_cache.set(user_message, planned)
+        await cache.set(await self.recipes_cache_key(llm_response.plan), llm_response.names)
+
+        result = {**planned, "recipes": llm_response.names}
+        await cache.set(cache_key, result)
+        return result
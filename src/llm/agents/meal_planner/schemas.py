@@ -0,0 +1,23 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+class MealPlanStructuredSchema(BaseModel):
+    intent: str = Field(
+        ...,
+        description="A brief, clear description of the user's goal based on their message (e.g., 'create a dinner menu for 4 people')."
+    )
+    plan: str = Field(
+        ...,
+        description="A high-level plan of the meal: meal type (e.g., dinner, lunch), number of dishes, dietary preferences, or any constraints mentioned by the user."
+    )
+    servings: str = Field(
+        ...,
+        description="The number of servings or people the meal is for, as specified by the user. If the user does not specify, return '1'."
+    )
+    names: List[str] = Field(
+        ...,
+        description=(
+            "A list of recipe names, chosen from the provided recipes, that match the plan and servings. "
+            "The list should contain unique names, without duplicates. Return at least one recipe."
+        )
+    )
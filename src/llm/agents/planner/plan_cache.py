@@ -0,0 +1,205 @@
+import re
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from settings import settings
+from src.llm.embeddings import HashedNgramEmbedder
+from src.logger.logger import logger
+from src.redis_client.client import cache
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+
+_NUMBER_WORDS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "six": "6", "seven": "7",
+    "eight": "8", "nine": "9", "ten": "10", "eleven": "11", "twelve": "12", "a couple": "2",
+}
+_NUMBER_WORDS_RE = re.compile(r"\b(" + "|".join(sorted(_NUMBER_WORDS, key=len, reverse=True)) + r")\b")
+# Words that do not change what the planner returns
+_FILLER_WORDS = {"a", "an", "the", "please", "people", "persons", "person", "guests"}
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def normalize_user_input(text: str) -> str:
+    """
+    Normalize a user request so trivially different phrasings share one cache key.
+
+    Lowercases, folds Unicode, spells numbers as digits, removes punctuation and
+    filler words, and collapses whitespace: "Dinner for four people!" becomes "dinner for 4".
+
+    Args:
+        text (str): The raw user input.
+
+    Returns:
+        str: The normalized input.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _NUMBER_WORDS_RE.sub(lambda match: _NUMBER_WORDS[match.group(1)], text)
+    words = re.findall(r"\w+", text)
+    return " ".join(word for word in words if word not in _FILLER_WORDS)
+
+
+class SemanticPlanCache:
+    """
+    In-process nearest-neighbour cache of planner results.
+
+    Normalized queries are embedded with `HashedNgramEmbedder` into rows of a
+    preallocated NumPy matrix; a lookup is one matrix-vector product. A match needs
+    a cosine similarity of at least `threshold` and exactly the same numbers as the
+    query, so "dinner for 4" never reuses the plan for "dinner for 6". When full, the
+    oldest entry is overwritten.
+    """
+
+    def __init__(self, *, capacity: int, threshold: float, embedder: Optional[HashedNgramEmbedder] = None) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity (int): Maximum number of cached queries.
+            threshold (float): Minimum cosine similarity for a hit.
+            embedder (Optional[HashedNgramEmbedder]): The embedder. Defaults to a 512-dimension one.
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.embedder = embedder or HashedNgramEmbedder()
+        self._matrix = np.zeros((capacity, self.embedder.dim), dtype=np.float32)
+        self._entries: List[Optional[Tuple[Tuple[str, ...], Dict[str, Any]]]] = [None] * capacity
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get(self, normalized: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result of the most similar query, if close enough.
+
+        Args:
+            normalized (str): The normalized user input.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached planner result or None.
+        """
+        if not self._size:
+            return None
+
+        scores = self._matrix[:self._size] @ self.embedder.embed(normalized)
+        numbers = tuple(_NUMBER_RE.findall(normalized))
+        for index in np.argsort(scores)[::-1][:5]:
+            if scores[index] < self.threshold:
+                break
+            entry_numbers, value = self._entries[index]
+            if entry_numbers == numbers:
+                return value
+        return None
+
+    def set(self, normalized: str, value: Dict[str, Any]) -> None:
+        """
+        Add a query and its planner result.
+
+        Args:
+            normalized (str): The normalized user input.
+            value (Dict[str, Any]): The planner result.
+        """
+        self._matrix[self._next] = self.embedder.embed(normalized)
+        self._entries[self._next] = (tuple(_NUMBER_RE.findall(normalized)), value)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+
+class PlanCache:
+    """
+    Two-tier cache of PlannerAgent results: an exact tier in the shared agent cache,
+    keyed on the normalized user input, and an optional semantic tier in the process.
+    """
+
+    def __init__(self, *, semantic_enabled: bool, semantic_capacity: int, semantic_threshold: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            semantic_enabled (bool): Whether to use the semantic tier.
+            semantic_capacity (int): Maximum number of queries in the semantic tier.
+            semantic_threshold (float): Minimum cosine similarity for a semantic hit.
+        """
+        self.semantic: Optional[SemanticPlanCache] = (
+            SemanticPlanCache(capacity=semantic_capacity, threshold=semantic_threshold) if semantic_enabled else None
+        )
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.lookup_seconds_total = 0.0
+        self.lookup_seconds_max = 0.0
+
+    @staticmethod
+    async def make_key(user_input: str) -> str:
+        """
+        Build the exact-tier cache key of a user request.
+        """
+        return make_cache_key(
+            "planner", normalize_user_input(user_input), namespaces=await get_cache_namespaces()
+        )
+
+    async def get(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a planner result, first exactly and then semantically.
+
+        Args:
+            user_input (str): The raw user input.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached `plan`, `intent` and `servings`, or None.
+        """
+        start = time.perf_counter()
+        normalized = normalize_user_input(user_input)
+        value = await cache.get(await self.make_key(user_input))
+        if value:
+            self.exact_hits += 1
+        elif self.semantic is not None and (value := self.semantic.get(normalized)):
+            self.semantic_hits += 1
+            logger.info(f"PlanCache semantic hit for '{normalized}'")
+        else:
+            value = None
+            self.misses += 1
+
+        elapsed = time.perf_counter() - start
+        self.lookup_seconds_total += elapsed
+        self.lookup_seconds_max = max(self.lookup_seconds_max, elapsed)
+        return value
+
+    async def set(self, user_input: str, value: Dict[str, Any]) -> None:
+        """
+        Store a planner result in both tiers.
+
+        Args:
+            user_input (str): The raw user input.
+            value (Dict[str, Any]): The `plan`, `intent` and `servings`.
+        """
+        await cache.set(await self.make_key(user_input), value)
+        if self.semantic is not None:
+            self.semantic.set(normalize_user_input(user_input), value)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return hit-rate and lookup-latency metrics.
+        """
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        return {
+            "lookups": lookups,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": (self.exact_hits + self.semantic_hits) / lookups if lookups else 0.0,
+            "lookup_ms_avg": self.lookup_seconds_total / lookups * 1000 if lookups else 0.0,
+            "lookup_ms_max": self.lookup_seconds_max * 1000,
+            "semantic_size": len(self.semantic) if self.semantic is not None else None,
+        }
+
+
+# Process-wide planner cache
+plan_cache = PlanCache(
+    semantic_enabled=settings.PLANNER_SEMANTIC_CACHE_ENABLED,
+    semantic_capacity=settings.PLANNER_SEMANTIC_CACHE_SIZE,
+    semantic_threshold=settings.PLANNER_SEMANTIC_THRESHOLD
+)
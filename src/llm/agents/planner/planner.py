@@ -1,11 +1,14 @@
 from pathlib import Path
+from typing import Any, Dict
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
 from src.llm.agents.common.base_agent import BaseLLMAgent
+from src.llm.agents.planner.plan_cache import plan_cache
 from src.llm.agents.planner.schemas import PlanStructuredSchema
 from src.llm.graph_schema import AgentState
 from src.logger.logger import logger
+from src.redis_client.single_flight import single_flight
 
 
 class PlannerAgent(BaseLLMAgent):
@@ -53,6 +56,31 @@ class PlannerAgent(BaseLLMAgent):
             AgentState: The updated agent state with the generated plan, intent, and servings.
         """
         user_message = user_input.get("user_input", "")
+
+        result = await plan_cache.get(user_message)
+        if result:
+            logger.info(f"PlannerAgent cache hit: {result}")
+        else:
+            result = await single_flight.run(
+                await plan_cache.make_key(user_message), lambda: self.create_plan(user_message)
+            )
+
+        user_input["plan"] = result["plan"]
+        user_input["user_intent"] = result["intent"]
+        user_input["servings"] = result["servings"]
+
+        return user_input
+
+    async def create_plan(self, user_message: str) -> Dict[str, Any]:
+        """
+        Ask the LLM for a plan and store it in the planner cache.
+
+        Args:
+            user_message (str): The raw user input text.
+
+        Returns:
+            Dict[str, Any]: The `plan`, `intent` and `servings`.
+        """
         prompt = await self.create_prompt(user_input_content=user_message)
 
         llm_with_structured_output = self.llm.with_structured_output(PlanStructuredSchema)
@@ -60,8 +88,6 @@ class PlannerAgent(BaseLLMAgent):
 
         logger.info(f"PlannerAgent response: {llm_response}")
 
-        user_input["plan"] = llm_response.plan
-        user_input["user_intent"] = llm_response.intent
-        user_input["servings"] = llm_response.servings
-
-        return user_input
+        result = llm_response.model_dump()
+        await plan_cache.set(user_message, result)
+        return result
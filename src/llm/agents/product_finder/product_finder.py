@@ -1,17 +1,24 @@
+import asyncio
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from src.db.product.repository import get_product_by_category
-from src.db.recipe.repository import get_recipe_by_name
+from settings import settings
+from src.db.catalog.product_index import product_index
+from src.db.catalog.snapshot import catalog
+from src.db.product.enums import category_value
+from src.db.product.repository import get_products_by_categories
+from src.db.recipe.repository import get_recipes_by_names
 from src.llm.agents.common.base_agent import BaseLLMAgent
+from src.llm.agents.common.prompt_format import format_product_candidates
 from src.llm.agents.product_finder.schemas import ProductFinderStructuredSchema, ProductInfo
 from src.llm.graph_schema import AgentState
 from src.logger.logger import logger
 from src.redis_client.client import cache
-from src.redis_client.services import make_cache_key
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+from src.redis_client.single_flight import single_flight
 
 
 class ProductFinderAgent(BaseLLMAgent):
@@ -27,53 +34,91 @@ class ProductFinderAgent(BaseLLMAgent):
         super().__init__()
 
     @staticmethod
-    async def get_recipe(name: str) -> Any:
+    async def load_candidates(recipes: List[str]) -> Dict[str, List[Any]]:
         """
-        Retrieve a recipe by its name.
+        Load candidate store products for every ingredient of the given recipes.
 
-        Args:
-            name (str): The name of the recipe.
-
-        Returns:
-            Any: The recipe object or None if not found.
-        """
-        return await get_recipe_by_name(name=name)
+        Recipes and products are read from the in-memory catalog snapshot, so no
+        database round trips are made once the snapshot is loaded. With
+        `PRODUCT_INDEX_ENABLED`, each ingredient gets only the `PRODUCT_INDEX_TOP_K`
+        products of its category closest to the ingredient name in the product index.
 
-    async def create_prompt(self, recipes: List[str]) -> str:
-        """
-        Construct a prompt for the LLM using the recipes and their associated products.
+        Recipes missing from the snapshot, for example ones created in another worker
+        since the last generation check, are read from the database with one recipe
+        query and one product query over their ingredient categories.
 
         Args:
             recipes (List[str]): A list of recipe names.
 
         Returns:
-            str: The assembled prompt text for the LLM.
+            Dict[str, List[Any]]: Recipe name mapped to a list of candidate products per ingredient.
         """
-        prompt_text = await self.get_prompt(agent_name=Path(__file__).parent.name)
-        products: Dict[str, List[Any]] = defaultdict(list)
-
+        snapshot = await catalog.get()
+        index = product_index.get() if settings.PRODUCT_INDEX_ENABLED else None
+        missing = [name for name in recipes if not snapshot.get_recipe(name)]
+        stale = {
+            recipe.name: {"name": recipe.name, "ingredients": recipe.ingredients or []}
+            for recipe in await get_recipes_by_names(names=missing)
+        }
+
+        ingredients_by_recipe: Dict[str, List[Tuple[str, str]]] = {}
         for name in recipes:
-            recipe = await self.get_recipe(name=name)
-            if not recipe or not recipe.ingredients:
+            recipe = snapshot.get_recipe(name) or stale.get(name)
+            if not recipe or not recipe["ingredients"]:
                 logger.warning(f"Recipe '{name}' not found or has no ingredients.")
                 continue
 
-            for ingredient in recipe.ingredients:
+            ingredients = []
+            for ingredient in recipe["ingredients"]:
                 category = ingredient.get("category")
                 if not category:
                     logger.warning(f"Ingredient in '{name}' missing category: {ingredient}")
                     continue
+                ingredients.append((ingredient.get("name") or category_value(category), category_value(category)))
+            ingredients_by_recipe[name] = ingredients
 
-                product = await get_product_by_category(category=category)
+        products_by_category = {} if index else snapshot.get_products_by_categories(
+            [category for ingredients in ingredients_by_recipe.values() for _, category in ingredients]
+        )
+        if stale:
+            products_by_category.update(await get_products_by_categories(
+                categories=[category for name in stale for _, category in ingredients_by_recipe.get(name, [])]
+            ))
+
+        products: Dict[str, List[Any]] = defaultdict(list)
+        for name, ingredients in ingredients_by_recipe.items():
+            for ingredient, category in ingredients:
+                if index and name not in stale:
+                    product = [
+                        snapshot.products_by_id[product_id]
+                        for product_id in index.search(ingredient, category, settings.PRODUCT_INDEX_TOP_K)
+                        if product_id in snapshot.products_by_id
+                    ] or snapshot.get_products_by_category(category)
+                else:
+                    product = products_by_category.get(category)
                 if product:
                     products[name].append(product)
                 else:
                     logger.warning(f"No product found for category '{category}' in recipe '{name}'.")
+        return products
+
+    async def create_prompt(self, recipes: List[str]) -> str:
+        """
+        Construct a prompt for the LLM using the recipes and their associated products.
+
+        Args:
+            recipes (List[str]): A list of recipe names.
+
+        Returns:
+            str: The assembled prompt text for the LLM.
+        """
+        prompt_text = await self.get_prompt(agent_name=Path(__file__).parent.name)
+        products = await self.load_candidates(recipes)
 
         messages = [
             SystemMessage(content=prompt_text),
             HumanMessage(content=f"Recipes for user: {recipes}"),
-            SystemMessage(content=f"Products for recipes ingredients: {products}")
+            SystemMessage(content=f"Products for recipes ingredients:\n{format_product_candidates(products)}")
         ]
 
         final_request = "\n".join([message.content for message in messages])
@@ -92,7 +137,13 @@ class ProductFinderAgent(BaseLLMAgent):
             AgentState: The updated agent state with selected products.
         """
         recipes = user_input.get("recipes", [])
-        cache_key = make_cache_key("product_finder", recipes)
+        if settings.PRODUCT_FINDER_MODE == "fan_out":
+            user_input["products"] = await self.fan_out(recipes)
+            return user_input
+
+        cache_key = make_cache_key(
+            "product_finder", recipes, namespaces=await get_cache_namespaces("catalog", "recipes")
+        )
 
         cached = await cache.get(cache_key)
         if cached:
@@ -100,14 +151,76 @@ class ProductFinderAgent(BaseLLMAgent):
             user_input["products"] = [ProductInfo(**item) for item in cached]
             return user_input
 
+        products = await single_flight.run(
+            cache_key, lambda: self.select_products(recipes=recipes, cache_key=cache_key)
+        )
+
+        user_input["products"] = [ProductInfo(**item) for item in products]
+        return user_input
+
+    async def fan_out(self, recipes: List[str]) -> List[ProductInfo]:
+        """
+        Select products with one smaller LLM call per recipe, run concurrently.
+
+        Each recipe is cached under its own key, so cached recipes cost no LLM call
+        and a new recipe combination reuses the recipes it shares with earlier ones.
+        At most `PRODUCT_FINDER_MAX_CONCURRENCY` calls run at once. A recipe whose
+        call fails is logged and left out; the step fails only if every recipe does.
+
+        Args:
+            recipes (List[str]): A list of recipe names.
+
+        Returns:
+            List[ProductInfo]: The merged products, without duplicate names.
+        """
+        namespaces = await get_cache_namespaces("catalog", "recipes")
+        semaphore = asyncio.Semaphore(settings.PRODUCT_FINDER_MAX_CONCURRENCY)
+
+        async def select_for_recipe(recipe: str) -> List[Dict[str, Any]]:
+            cache_key = make_cache_key("product_finder", [recipe], namespaces=namespaces)
+            cached = await cache.get(cache_key)
+            if cached:
+                logger.info(f"ProductFinderAgent cache hit: {cache_key}")
+                return cached
+
+            async def compute() -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.select_products(recipes=[recipe], cache_key=cache_key)
+
+            return await single_flight.run(cache_key, compute)
+
+        results = await asyncio.gather(*[select_for_recipe(recipe) for recipe in recipes], return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
+        products: Dict[str, ProductInfo] = {}
+        for recipe, result in zip(recipes, results):
+            if isinstance(result, BaseException):
+                logger.error(f"ProductFinderAgent failed for recipe '{recipe}': {result}")
+                continue
+            for item in result:
+                products.setdefault(item["name"], ProductInfo(**item))
+        return list(products.values())
+
+    async def select_products(self, *, recipes: List[str], cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Ask the LLM to select products for the recipes and cache the result.
+
+        Args:
+            recipes (List[str]): A list of recipe names.
+            cache_key (str): The cache key to store the selected products under.
+
+        Returns:
+            List[Dict[str, Any]]: The selected products, in their cached form.
+        """
         prompt = await self.create_prompt(recipes)
         llm_with_structured_output = self.llm.with_structured_output(ProductFinderStructuredSchema)
         llm_response = await llm_with_structured_output.ainvoke(prompt)
 
         logger.info(f"ProductFinderAgent response: {llm_response}")
 
-        products = llm_response.products
-        await cache.set(cache_key, [p.model_dump() for p in products])
-
-        user_input["products"] = products
-        return user_input
+        products = [p.model_dump() for p in llm_response.products]
+        await cache.set(cache_key, products)
+        return products
@@ -1,14 +1,19 @@
 from pathlib import Path
+from typing import List
 
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from src.db.recipe.repository import get_recipes
+from settings import settings
+from src.db.catalog.recipe_index import recipe_index
+from src.db.catalog.snapshot import catalog
 from src.llm.agents.common.base_agent import BaseLLMAgent
+from src.llm.agents.common.prompt_format import format_recipes
 from src.llm.agents.recipe.schemas import RecipeStructuredSchema
 from src.llm.graph_schema import AgentState
 from src.logger.logger import logger
 from src.redis_client.client import cache
-from src.redis_client.services import make_cache_key
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+from src.redis_client.single_flight import single_flight
 
 
 class RecipeAgent(BaseLLMAgent):
@@ -27,6 +32,9 @@ class RecipeAgent(BaseLLMAgent):
         """
         Construct the prompt for the LLM based on the provided plan and available recipes.
 
+        With `RECIPE_RETRIEVAL_TOP_K` set, only the recipes that best match the plan
+        are included, so the prompt size does not grow with the recipe book.
+
         Args:
             plan (str): The plan generated by the planner agent.
 
@@ -34,13 +42,16 @@ class RecipeAgent(BaseLLMAgent):
             str: The constructed prompt to be sent to the LLM.
         """
         prompt = await self.get_prompt(agent_name=Path(__file__).parent.name)
-        recipes = await get_recipes()
+        if settings.RECIPE_RETRIEVAL_TOP_K:
+            recipes = await recipe_index.search(plan, settings.RECIPE_RETRIEVAL_TOP_K)
+        else:
+            recipes = (await catalog.get()).get_recipes()
         logger.info(f"Available recipes: {recipes}")
 
         messages = [
             SystemMessage(content=prompt),
             HumanMessage(content=f"Planner agent plan: {plan}"),
-            SystemMessage(content=f"Recipes: {recipes}")
+            SystemMessage(content=f"Recipes:\n{format_recipes(recipes)}")
         ]
 
         final_request = "\n".join([message.content for message in messages])
@@ -59,7 +70,7 @@ class RecipeAgent(BaseLLMAgent):
             AgentState: The updated agent state with selected recipes.
         """
         plan = user_input.get("plan", "")
-        cache_key = make_cache_key("plan", plan)
+        cache_key = make_cache_key("plan", plan, namespaces=await get_cache_namespaces("recipes"))
 
         cached = await cache.get(cache_key)
         if cached:
@@ -67,6 +78,22 @@ class RecipeAgent(BaseLLMAgent):
             user_input["recipes"] = cached
             return user_input
 
+        recipes = await single_flight.run(cache_key, lambda: self.select_recipes(plan=plan, cache_key=cache_key))
+
+        user_input["recipes"] = recipes
+        return user_input
+
+    async def select_recipes(self, *, plan: str, cache_key: str) -> List[str]:
+        """
+        Ask the LLM to select recipes for the plan and cache the result.
+
+        Args:
+            plan (str): The plan generated by the planner agent.
+            cache_key (str): The cache key to store the selected recipes under.
+
+        Returns:
+            List[str]: The selected recipe names.
+        """
         prompt = await self.create_prompt(plan=plan)
         llm_with_structured_output = self.llm.with_structured_output(RecipeStructuredSchema)
         llm_response = await llm_with_structured_output.ainvoke(prompt)
@@ -75,6 +102,4 @@ class RecipeAgent(BaseLLMAgent):
 
         recipes = llm_response.names
         await cache.set(cache_key, recipes)
-
-        user_input["recipes"] = recipes
-        return user_input
+        return recipes
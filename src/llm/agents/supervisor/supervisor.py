@@ -17,7 +17,8 @@ class SupervisorAgent:
 
         The agent flow follows these steps:
         - Planner → Recipe → ProductFinder → Budgeting → Finalizer
-        - If the budget is exceeded, retry ProductFinder up to 3 times.
+        - If the budget is exceeded, run BudgetSolver once to pick the cheapest basket
+          or prove that the budget is infeasible, then finalize.
 
         Args:
             user_input (AgentState): The current state of the multi-agent pipeline.
@@ -25,34 +26,36 @@ class SupervisorAgent:
         Returns:
             AgentState: The updated state with the `__next__` agent specified.
         """
-        if not user_input.get("plan"):
-            user_input["__next__"] = "Planner"
-
-        elif not user_input.get("recipes") or not isinstance(user_input.get("recipes"), List):
-            user_input["__next__"] = "Recipe"
-
-        elif not user_input.get("products") or not isinstance(user_input.get("products"), List):
-            user_input["__next__"] = "ProductFinder"
-
-        elif "within_budget" not in user_input or "total_cost" not in user_input:
-            user_input["__next__"] = "Budgeting"
-
-        elif user_input.get("within_budget") is False:
-            attempts = user_input.get("retry_attempts", 0)
-            if attempts < 2:
-                user_input["__next__"] = "ProductFinder"
-                user_input["retry_attempts"] = attempts + 1
-                logger.info(f"Budget exceeded. Retrying with ProductFinderAgent. Attempt {attempts + 1}")
-            else:
-                user_input["__next__"] = "Finalizer"
-                user_input["final_budget_status"] = "Recipe does not fit into budget after 3 attempts"
-                logger.info("Budget exceeded after 3 attempts. Proceeding to Finalizer with last recipe.")
-        else:
-            user_input["__next__"] = "Finalizer"
+        user_input["__next__"] = SupervisorAgent.next_agent(user_input)
+        if user_input["__next__"] == "BudgetSolver":
+            logger.info("Budget exceeded. Selecting the cheapest basket with BudgetSolverAgent.")
 
         return user_input
 
+    @staticmethod
+    def next_agent(state: AgentState) -> str:
+        """
+        Return the name of the first pipeline step whose output is missing from the state.
+
+        Args:
+            state (AgentState): The current state of the multi-agent pipeline.
+
+        Returns:
+            str: The name of the next agent.
+        """
+        if not state.get("plan"):
+            return "Planner"
+
+        if not state.get("recipes") or not isinstance(state.get("recipes"), List):
+            return "Recipe"
 
+        if not state.get("products") or not isinstance(state.get("products"), List):
+            return "ProductFinder"
 
+        if "within_budget" not in state or "total_cost" not in state:
+            return "Budgeting"
 
+        if state.get("within_budget") is False and not state.get("budget_solved"):
+            return "BudgetSolver"
 
+        return "Finalizer"
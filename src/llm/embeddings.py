@@ -0,0 +1,83 @@
+import re
+import zlib
+from typing import Iterable, List
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class HashedNgramEmbedder:
+    """
+    Deterministic, CPU-only text embedding built from hashed word and character n-grams.
+
+    Features are hashed with CRC32 (stable across processes, unlike `hash()`) into
+    a fixed number of dimensions and the vectors are L2-normalized, so the dot
+    product of two embeddings is their cosine similarity.
+    """
+
+    def __init__(self, *, dim: int = 512, min_n: int = 3, max_n: int = 5) -> None:
+        """
+        Initialize the embedder.
+
+        Args:
+            dim (int): Number of dimensions of the embedding.
+            min_n (int): Smallest character n-gram length.
+            max_n (int): Largest character n-gram length.
+        """
+        self.dim = dim
+        self.min_n = min_n
+        self.max_n = max_n
+
+    def features(self, text: str) -> List[str]:
+        """
+        Return the word tokens and character n-grams of a text.
+
+        Args:
+            text (str): The text to featurize.
+
+        Returns:
+            List[str]: The features, with words prefixed by 'w:'.
+        """
+        tokens = _TOKEN_RE.findall(text.lower())
+        features = [f"w:{token}" for token in tokens]
+        for token in tokens:
+            padded = f" {token} "
+            for n in range(self.min_n, self.max_n + 1):
+                features.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a single text.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            np.ndarray: A float32 vector of length `dim` with unit norm (or all zeros for empty text).
+        """
+        features = self.features(text)
+        digests = np.fromiter((zlib.crc32(feature.encode()) for feature in features), dtype=np.uint32, count=len(features))
+        # The top bit picks the sign, which keeps hash collisions from only adding up.
+        signs = np.where(digests & 0x80000000, 1.0, -1.0)
+        vector = np.bincount(digests % self.dim, weights=signs, minlength=self.dim).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return vector
+
+    def embed_many(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Embed several texts.
+
+        Args:
+            texts (Iterable[str]): The texts to embed.
+
+        Returns:
+            np.ndarray: A float32 matrix with one row per text.
+        """
+        rows = [self.embed(text) for text in texts]
+        if not rows:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack(rows)
@@ -1,50 +1,150 @@
+from typing import Callable, Dict, Optional
+
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from settings import settings
 from src.llm.graph_schema import AgentState
+from src.llm.agents.budget_solver.budget_solver import BudgetSolverAgent
 from src.llm.agents.budgeting.budgeting import BudgetingAgent
 from src.llm.agents.finalizer.finalizer import FinalizerAgent
+from src.llm.agents.meal_planner.meal_planner import MealPlannerAgent
 from src.llm.agents.planner.planner import PlannerAgent
 from src.llm.agents.product_finder.product_finder import ProductFinderAgent
 from src.llm.agents.recipe.recipe import RecipeAgent
 from src.llm.agents.supervisor.supervisor import SupervisorAgent
 
-def build_graph() -> CompiledStateGraph:
+# Pipeline steps in execution order
+PIPELINE = ("Planner", "Recipe", "ProductFinder", "Budgeting", "BudgetSolver", "Finalizer")
+
+
+def create_agents(planner_mode: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Create the node functions of every pipeline agent.
+
+    Args:
+        planner_mode (Optional[str]): "separate" or "fused". Defaults to `settings.PLANNER_MODE`.
+
+    Returns:
+        Dict[str, Callable]: The `generate` method of each agent, keyed by node name.
+    """
+    planner_mode = planner_mode or settings.PLANNER_MODE
+    return {
+        planner_node(planner_mode): (MealPlannerAgent() if planner_mode == "fused" else PlannerAgent()).generate,
+        "Recipe": RecipeAgent().generate,
+        "ProductFinder": ProductFinderAgent().generate,
+        "Budgeting": BudgetingAgent().generate,
+        "BudgetSolver": BudgetSolverAgent().generate,
+        "Finalizer": FinalizerAgent().generate,
+    }
+
+
+def planner_node(planner_mode: str) -> str:
+    """
+    Return the name of the node that creates the plan: "MealPlanner" in the fused mode, "Planner" otherwise.
+    """
+    return "MealPlanner" if planner_mode == "fused" else "Planner"
+
+
+def route_after_budgeting(state: AgentState) -> str:
+    """
+    Send an over-budget basket to the BudgetSolver once, everything else to the Finalizer.
+    """
+    if state.get("within_budget") is False and not state.get("budget_solved"):
+        return "BudgetSolver"
+    return "Finalizer"
+
+
+def build_graph(
+    topology: Optional[str] = None,
+    agents: Optional[Dict[str, Callable]] = None,
+    planner_mode: Optional[str] = None
+) -> CompiledStateGraph:
     """
     Build and compile the LangGraph multi-agent state graph.
 
+    The "supervisor" topology returns to the Supervisor after every agent, which
+    picks the next step. The "linear" topology wires the agents directly: a
+    conditional entry point skips steps whose output is already in the state, and
+    the only other branch sends an over-budget basket to the BudgetSolver. Both
+    produce the same final state, apart from the Supervisor's `__next__` marker.
+
+    In the "fused" planner mode the MealPlanner node takes the Planner's place and
+    also selects the recipes, so the Recipe node only runs when a state arrives with
+    a plan but no recipes.
+
+    Args:
+        topology (Optional[str]): "supervisor" or "linear". Defaults to `settings.GRAPH_TOPOLOGY`.
+        agents (Optional[Dict[str, Callable]]): Node functions keyed by node name. Defaults to `create_agents()`.
+        planner_mode (Optional[str]): "separate" or "fused". Defaults to `settings.PLANNER_MODE`.
+
     Returns:
         StateGraph: The compiled state graph ready for execution.
     """
+    topology = topology or settings.GRAPH_TOPOLOGY
+    planner_mode = planner_mode or settings.PLANNER_MODE
+    agents = agents or create_agents(planner_mode)
+    planner = planner_node(planner_mode)
+    nodes = {name: planner if name == "Planner" else name for name in PIPELINE}
     builder = StateGraph(state_schema=AgentState)
 
-    builder.add_node("Planner", PlannerAgent().generate)
-    builder.add_node("Recipe", RecipeAgent().generate)
-    builder.add_node("ProductFinder", ProductFinderAgent().generate)
-    builder.add_node("Budgeting", BudgetingAgent().generate)
-    builder.add_node("Finalizer", FinalizerAgent().generate)
-    builder.add_node("Supervisor", SupervisorAgent().generate)
+    for node in nodes.values():
+        builder.add_node(node, agents[node])
+    builder.set_finish_point("Finalizer")
 
+    if topology == "linear":
+        builder.set_conditional_entry_point(
+            path=SupervisorAgent.next_agent,
+            path_map=nodes
+        )
+        builder.add_edge(planner, "ProductFinder" if planner_mode == "fused" else "Recipe")
+        builder.add_edge("Recipe", "ProductFinder")
+        builder.add_edge("ProductFinder", "Budgeting")
+        builder.add_conditional_edges(
+            source="Budgeting",
+            path=route_after_budgeting,
+            path_map={"BudgetSolver": "BudgetSolver", "Finalizer": "Finalizer"}
+        )
+        builder.add_edge("BudgetSolver", "Finalizer")
+        return builder.compile()
+
+    builder.add_node("Supervisor", SupervisorAgent().generate)
     builder.set_entry_point("Supervisor")
-    builder.set_finish_point("Finalizer")
 
     builder.add_conditional_edges(
         source="Supervisor",
         path=lambda state: state.get("__next__"),
-        path_map={
-            "Planner": "Planner",
-            "Recipe": "Recipe",
-            "ProductFinder": "ProductFinder",
-            "Budgeting": "Budgeting",
-            "Finalizer": "Finalizer"
-        }
+        path_map=nodes
     )
 
-    builder.add_edge("Planner", "Supervisor")
+    builder.add_edge(planner, "Supervisor")
     builder.add_edge("Recipe", "Supervisor")
     builder.add_edge("ProductFinder", "Supervisor")
     builder.add_edge("Budgeting", "Supervisor")
+    builder.add_edge("BudgetSolver", "Supervisor")
 
     return builder.compile()
 
-graph = build_graph()
+
+# Compiled on first use, so importing this module builds no LLM clients
+_graph: Optional[CompiledStateGraph] = None
+
+
+def get_graph() -> CompiledStateGraph:
+    """
+    Return the shared compiled graph, building it on first use.
+
+    Returns:
+        CompiledStateGraph: The graph built with the configured topology and planner mode.
+    """
+    global _graph
+    if _graph is None:
+        _graph = build_graph()
+    return _graph
+
+
+def __getattr__(name: str):
+    # Keeps `from src.llm.graph import graph` working, compiling the graph on first access
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,146 @@
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, Callable, Dict, Optional
+
+from settings import settings
+from src.llm.agents.planner.plan_cache import normalize_user_input
+from src.llm.agents.product_finder.schemas import ProductInfo
+from src.llm.graph import get_graph
+from src.llm.graph_schema import AgentState
+from src.logger.logger import logger
+from src.redis_client.client import cache
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+from src.redis_client.single_flight import single_flight
+
+
+def graph_config() -> Dict[str, Any]:
+    """
+    Return the settings that change what the graph computes for the same request.
+    """
+    return {
+        "topology": settings.GRAPH_TOPOLOGY,
+        "planner_mode": settings.PLANNER_MODE,
+        "product_finder_mode": settings.PRODUCT_FINDER_MODE,
+        "budgeting_mode": settings.BUDGETING_MODE,
+        "recipe_top_k": settings.RECIPE_RETRIEVAL_TOP_K,
+        "product_index": settings.PRODUCT_INDEX_ENABLED and settings.PRODUCT_INDEX_TOP_K,
+    }
+
+
+async def make_graph_cache_key(initial_state: AgentState) -> str:
+    """
+    Build the cache key of a whole graph run.
+
+    The key covers the normalized user input, the budget and the graph
+    configuration, and folds in the catalog and recipe generations together with
+    the prompt and model namespaces, so any price, recipe, prompt, model or
+    pipeline change makes earlier results unreachable.
+
+    Args:
+        initial_state (AgentState): The initial graph state with `user_input` and `budget`.
+
+    Returns:
+        str: The cache key.
+    """
+    data = {
+        "user_input": normalize_user_input(initial_state.get("user_input", "")),
+        "budget": float(initial_state.get("budget", 0)),
+        "config": graph_config()
+    }
+    return make_cache_key("graph", data, namespaces=await get_cache_namespaces("catalog", "recipes"))
+
+
+async def get_graph_cache_key(initial_state: AgentState) -> Optional[str]:
+    """
+    Return the cache key of a request, or None when the graph cache is disabled.
+    """
+    return await make_graph_cache_key(initial_state) if settings.GRAPH_CACHE_ENABLED else None
+
+
+def dump_state(state: AgentState) -> Dict[str, Any]:
+    """
+    Convert a final graph state to a JSON-serializable dictionary.
+    """
+    dumped = {key: value for key, value in state.items() if key != "__next__"}
+    if dumped.get("products"):
+        dumped["products"] = [product.model_dump() for product in dumped["products"]]
+    return dumped
+
+
+def load_state(data: Dict[str, Any]) -> AgentState:
+    """
+    Restore a graph state stored by `dump_state`.
+    """
+    state: AgentState = dict(data)
+    if state.get("products"):
+        state["products"] = [ProductInfo(**product) for product in state["products"]]
+    return state
+
+
+async def get_cached_state(cache_key: Optional[str]) -> Optional[AgentState]:
+    """
+    Return the memoized final state of a request, if any.
+
+    Args:
+        cache_key (Optional[str]): The key from `get_graph_cache_key`.
+
+    Returns:
+        Optional[AgentState]: The final graph state or None on a miss or when the graph cache is disabled.
+    """
+    if cache_key is None:
+        return None
+    cached = await cache.get(cache_key)
+    return load_state(cached) if cached else None
+
+
+async def set_cached_state(cache_key: Optional[str], state: AgentState) -> None:
+    """
+    Memoize the final state of a completed run; runs without a final message are not stored.
+
+    Args:
+        cache_key (Optional[str]): The key from `get_graph_cache_key`, taken before the run started.
+        state (AgentState): The final graph state.
+    """
+    if cache_key is not None and state.get("final_message"):
+        await cache.set(cache_key, dump_state(state))
+
+
+async def invoke_graph(
+    initial_state: AgentState,
+    *,
+    slot: Optional[Callable[[], AsyncContextManager]] = None
+) -> AgentState:
+    """
+    Run the multi-agent graph, returning a memoized final state when the same
+    request was already answered against the current catalog.
+
+    Cache hits return without running any agent. On a miss, concurrent identical
+    requests share one graph run, which executes inside `slot` (e.g. a concurrency
+    limiter slot) if given.
+
+    Args:
+        initial_state (AgentState): The initial graph state with `user_input` and `budget`.
+        slot (Optional[Callable[[], AsyncContextManager]]): Factory of the context the graph run executes in.
+
+    Returns:
+        AgentState: The final graph state.
+    """
+    slot = slot or nullcontext
+    if not settings.GRAPH_CACHE_ENABLED:
+        async with slot():
+            return await get_graph().ainvoke(initial_state)
+
+    cache_key = await make_graph_cache_key(initial_state)
+    cached = await cache.get(cache_key)
+    if cached:
+        logger.info(f"Graph cache hit: {cache_key}")
+        return load_state(cached)
+
+    async def run() -> Dict[str, Any]:
+        async with slot():
+            graph_result = await get_graph().ainvoke(initial_state)
+        result = dump_state(graph_result)
+        if result.get("final_message"):
+            await cache.set(cache_key, result)
+        return result
+
+    return load_state(await single_flight.run(cache_key, run))
@@ -13,7 +13,7 @@ class AgentState(TypedDict, total=False):
     products: Optional[List[ProductInfo]]
     total_cost: Optional[float]
     within_budget: Optional[bool]
-    retry_attempts: Optional[int]
+    budget_solved: Optional[bool]
     final_budget_status: Optional[str]
     final_message: Optional[str]
     __next__: Optional[str]
\ No newline at end of file
@@ -1,29 +1,149 @@
-import json
-from typing import Any, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
 import redis.asyncio as redis
 from settings import settings
+from src.logger.logger import logger
+from src.redis_client.codec import CacheCodec
+
+# Marker for a missing in-process cache entry, since None is a valid cached value
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Size-bounded, in-process LRU cache with a per-entry time to live.
+
+    Cached values are returned as stored, without copying, so callers must treat
+    them as read-only.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int): Maximum number of entries before the least recently used one is evicted.
+        """
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Any:
+        """
+        Retrieve a value, or `_MISSING` if the key is absent or expired.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any: The cached value or `_MISSING`.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return _MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return _MISSING
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+            ttl (float): Time to live in seconds.
+        """
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a key if present.
+        """
+        self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit/miss/eviction counters and the current size.
+        """
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
 
 
 class RedisCache:
     """
     Asynchronous Redis cache handler for storing and retrieving JSON-serializable data.
+
+    Values are encoded by a `CacheCodec` (pluggable serializer and optional compression).
+    Optionally keeps an in-process LRU tier (L1) in front of Redis: reads check L1
+    first and fill it from Redis, writes go to both. With the 'memory' backend the
+    L1 tier is the only storage and no Redis connection is made.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        backend: str = settings.CACHE_BACKEND,
+        l1_enabled: bool = settings.CACHE_L1_ENABLED,
+        l1_max_size: int = settings.CACHE_L1_MAX_SIZE,
+        l1_ttl: int = settings.CACHE_L1_TTL,
+        codec: Optional[CacheCodec] = None
+    ) -> None:
         """
         Initialize Redis client with connection parameters from settings.
+
+        Args:
+            backend (str): 'redis' or 'memory'.
+            l1_enabled (bool): Whether to keep the in-process tier in front of Redis.
+            l1_max_size (int): Maximum number of entries in the in-process tier.
+            l1_ttl (int): Maximum time to live, in seconds, of in-process entries.
+            codec (Optional[CacheCodec]): Codec for values stored in Redis. Defaults to the configured one.
         """
-        self.client = redis.Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            db=0,
-            decode_responses=True
+        self.backend = backend
+        self.codec = codec or CacheCodec(
+            serializer=settings.CACHE_SERIALIZER,
+            compression=settings.CACHE_COMPRESSION,
+            compress_threshold=settings.CACHE_COMPRESSION_THRESHOLD
         )
+        self.l1_ttl = l1_ttl
+        self.client: Optional[redis.Redis] = None
+        if backend == "redis":
+            self.client = redis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=0
+            )
+        self.l1: Optional[LRUCache] = LRUCache(l1_max_size) if l1_enabled or self.client is None else None
+        self.redis_hits = 0
+        self.redis_misses = 0
 
     async def get(self, key: str) -> Optional[Any]:
         """
-        Retrieve a value from Redis by key.
+        Retrieve a value by key, from the in-process tier first and then from Redis.
 
         Args:
             key (str): The cache key.
@@ -31,21 +151,64 @@ class RedisCache:
         Returns:
             Optional[Any]: The deserialized value if found, otherwise None.
         """
-        value = await self.client.get(key)
-        if value:
-            return json.loads(value)
-        return None
+        if self.l1 is not None:
+            value = self.l1.get(key)
+            if value is not _MISSING:
+                return value
 
-    async def set(self, key: str, value: Any, expire: int = 3600) -> None:
+        if self.client is None:
+            return None
+
+        if self.l1 is None:
+            value = await self.client.get(key)
+        else:
+            async with self.client.pipeline(transaction=False) as pipe:
+                value, remaining_ttl = await pipe.get(key).ttl(key).execute()
+
+        if not value:
+            self.redis_misses += 1
+            return None
+
+        try:
+            result = self.codec.decode(value)
+        except Exception as e:
+            logger.warning(f"Cannot decode cached value for {key}, treating as a miss: {e}")
+            self.redis_misses += 1
+            return None
+
+        self.redis_hits += 1
+        if self.l1 is not None and remaining_ttl != 0:
+            # A negative TTL means the Redis key has no expiration.
+            self.l1.set(key, result, min(self.l1_ttl, remaining_ttl) if remaining_ttl > 0 else self.l1_ttl)
+        return result
+
+    async def set(self, key: str, value: Any, expire: int = settings.CACHE_TTL) -> None:
         """
-        Store a value in Redis with optional expiration.
+        Store a value in Redis (and the in-process tier) with optional expiration.
 
         Args:
             key (str): The cache key.
-            value (Any): The data to cache (must be JSON-serializable).
-            expire (int, optional): Expiration time in seconds. Defaults to 3600.
+            value (Any): The data to cache (must be serializable by the codec).
+            expire (int, optional): Expiration time in seconds. Defaults to `CACHE_TTL`.
+        """
+        if self.l1 is not None:
+            self.l1.set(key, value, expire if self.client is None else min(self.l1_ttl, expire))
+
+        if self.client is not None:
+            await self.client.set(key, self.codec.encode(value), ex=expire)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache counters for both tiers.
+
+        Returns:
+            Dict[str, Any]: The backend name, Redis hit/miss counters and in-process tier stats.
         """
-        await self.client.set(key, json.dumps(value), ex=expire)
+        return {
+            "backend": self.backend,
+            "redis": {"hits": self.redis_hits, "misses": self.redis_misses} if self.client is not None else None,
+            "l1": self.l1.stats() if self.l1 is not None else None,
+        }
 
 
 # Singleton cache instance
@@ -0,0 +1,142 @@
+import json
+import zlib
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Values written by CacheCodec start with this marker. 0xff never starts a UTF-8
+# JSON document, so values written before the codec existed are still recognized.
+HEADER_MAGIC = b"\xffSC"
+HEADER_SIZE = len(HEADER_MAGIC) + 2
+
+SERIALIZER_IDS: Dict[str, int] = {"json": 1, "orjson": 2, "msgpack": 3}
+COMPRESSION_IDS: Dict[str, int] = {"none": 0, "zlib": 1, "zstd": 2}
+
+
+def _serializers() -> Dict[int, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    """
+    Return the (dumps, loads) pairs of the installed serializers by id.
+    """
+    serializers = {
+        SERIALIZER_IDS["json"]: (
+            lambda value: json.dumps(value, separators=(",", ":")).encode(),
+            json.loads
+        ),
+    }
+    if orjson is not None:
+        serializers[SERIALIZER_IDS["orjson"]] = (orjson.dumps, orjson.loads)
+    if msgpack is not None:
+        serializers[SERIALIZER_IDS["msgpack"]] = (
+            lambda value: msgpack.packb(value, use_bin_type=True),
+            lambda data: msgpack.unpackb(data, raw=False)
+        )
+    return serializers
+
+
+def _compressors() -> Dict[int, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]:
+    """
+    Return the (compress, decompress) pairs of the installed compressors by id.
+    """
+    compressors = {
+        COMPRESSION_IDS["zlib"]: (lambda data: zlib.compress(data, 6), zlib.decompress),
+    }
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3)
+        decompressor = zstandard.ZstdDecompressor()
+        compressors[COMPRESSION_IDS["zstd"]] = (compressor.compress, decompressor.decompress)
+    return compressors
+
+
+class CacheCodec:
+    """
+    Encodes cached values with a pluggable serializer and optional compression.
+
+    Every encoded value carries a small header (magic, serializer id, compression id),
+    so values written with any serializer or compression, and plain JSON text written
+    before the header existed, can all be decoded during a rollout.
+    """
+
+    def __init__(self, *, serializer: str = "json", compression: str = "none", compress_threshold: int = 1024) -> None:
+        """
+        Initialize the codec.
+
+        Args:
+            serializer (str): 'json', 'orjson' or 'msgpack'.
+            compression (str): 'none', 'zlib' or 'zstd'.
+            compress_threshold (int): Serialized values smaller than this many bytes are stored uncompressed.
+
+        Raises:
+            ValueError: If the serializer or compression is unknown or its package is not installed.
+        """
+        self._serializers = _serializers()
+        self._compressors = _compressors()
+
+        serializer_id = SERIALIZER_IDS.get(serializer)
+        if serializer_id not in self._serializers:
+            raise ValueError(f"Cache serializer '{serializer}' is unknown or its package is not installed.")
+        compression_id = COMPRESSION_IDS.get(compression)
+        if compression_id is None or (compression_id and compression_id not in self._compressors):
+            raise ValueError(f"Cache compression '{compression}' is unknown or its package is not installed.")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self._serializer_id = serializer_id
+        self._compression_id = compression_id
+        self._dumps = self._serializers[serializer_id][0]
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Serialize, and compress if large enough, a value with its header.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The encoded value.
+        """
+        payload = self._dumps(value)
+        compression_id = 0
+        if self._compression_id and len(payload) >= self.compress_threshold:
+            compression_id = self._compression_id
+            payload = self._compressors[compression_id][0](payload)
+        return HEADER_MAGIC + bytes((self._serializer_id, compression_id)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a value written by any codec configuration or as plain JSON text.
+
+        Args:
+            data (bytes): The stored value.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            ValueError: If the value uses a serializer or compression that is not installed.
+        """
+        if not data.startswith(HEADER_MAGIC):
+            return json.loads(data)
+
+        serializer_id, compression_id = data[len(HEADER_MAGIC)], data[len(HEADER_MAGIC) + 1]
+        payload = data[HEADER_SIZE:]
+        if compression_id:
+            if compression_id not in self._compressors:
+                raise ValueError(f"Cached value uses unavailable compression id {compression_id}.")
+            payload = self._compressors[compression_id][1](payload)
+        if serializer_id not in self._serializers:
+            raise ValueError(f"Cached value uses unavailable serializer id {serializer_id}.")
+        return self._serializers[serializer_id][1](payload)
@@ -1,22 +1,104 @@
 import hashlib
 import json
-from typing import Any
+from typing import Any, Dict, Mapping, Optional
 
+from settings import settings
+from src.redis_client.client import cache
 
-def make_cache_key(prefix: str, data: Any) -> str:
+# Redis key prefix of the generation counters
+GENERATION_KEY_PREFIX = "generation"
+
+# Generation counters of the process, used when there is no Redis
+_local_generations: Dict[str, int] = {}
+
+
+def make_cache_key(prefix: str, data: Any, namespaces: Optional[Mapping[str, Any]] = None) -> str:
     """
     Generate a cache key by hashing the provided data with a given prefix.
 
     The data is serialized to JSON (with sorted keys for consistency),
-    then hashed using MD5 to produce a compact identifier.
+    then hashed using MD5 to produce a compact identifier. When namespaces are
+    given (see `get_cache_namespaces`), they are folded into the hash, so bumping
+    a namespace generation makes every key built from it unreachable at once.
 
     Args:
         prefix (str): A prefix to namespace the key (e.g., the agent or purpose).
         data (Any): The data to hash (must be JSON-serializable).
+        namespaces (Optional[Mapping[str, Any]]): Namespace versions the cached value depends on.
 
     Returns:
         str: The generated cache key in the format "{prefix}:{hash}".
     """
+    if namespaces:
+        data = {"data": data, "namespaces": dict(namespaces)}
     raw = json.dumps(data, sort_keys=True)
     hash_digest = hashlib.md5(raw.encode()).hexdigest()
     return f"{prefix}:{hash_digest}"
+
+
+def model_name() -> str:
+    """
+    Return the name of the configured LLM provider and model.
+    """
+    model = settings.OPENAI_MODEL if settings.LLM_NAME == "openai" else settings.OLLAMA_MODEL
+    return f"{settings.LLM_NAME}:{model}"
+
+
+async def get_generations(*names: str) -> Dict[str, int]:
+    """
+    Read the current generation counters of the given namespaces in one round trip.
+
+    Args:
+        *names (str): Namespace names, e.g. "catalog" or "recipes".
+
+    Returns:
+        Dict[str, int]: The generation of each namespace (0 if never bumped).
+    """
+    if not names:
+        return {}
+    if cache.client is None:
+        return {name: _local_generations.get(name, 0) for name in names}
+
+    values = await cache.client.mget([f"{GENERATION_KEY_PREFIX}:{name}" for name in names])
+    return {name: int(value or 0) for name, value in zip(names, values)}
+
+
+async def bump_generation(*names: str) -> None:
+    """
+    Increment the generation counters of the given namespaces.
+
+    Every cache key built with these namespaces changes, which invalidates all of
+    them in O(1) regardless of how many keys exist; the old entries expire on their own.
+
+    Args:
+        *names (str): Namespace names, e.g. "catalog" or "recipes".
+    """
+    if cache.client is None:
+        for name in names:
+            _local_generations[name] = _local_generations.get(name, 0) + 1
+        return
+
+    async with cache.client.pipeline(transaction=False) as pipe:
+        for name in names:
+            pipe.incr(f"{GENERATION_KEY_PREFIX}:{name}")
+        await pipe.execute()
+
+
+async def get_cache_namespaces(*names: str) -> Dict[str, Any]:
+    """
+    Build the namespace versions an LLM result depends on.
+
+    The prompt version and model name are always included; the given namespace
+    generations are read from Redis.
+
+    Args:
+        *names (str): Data namespaces the result depends on, e.g. "catalog" or "recipes".
+
+    Returns:
+        Dict[str, Any]: Namespace name mapped to its current version, for `make_cache_key`.
+    """
+    return {
+        "prompt": settings.PROMPT_VERSION,
+        "model": model_name(),
+        **await get_generations(*names),
+    }
@@ -0,0 +1,121 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict
+
+from settings import settings
+from src.logger.logger import logger
+from src.redis_client.client import RedisCache, cache
+
+# Deletes the lock only if it is still held by the given token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations of the same cache key.
+
+    The first caller for a key starts the computation in a task; concurrent callers
+    in the same process await its result instead of starting their own. A cancelled
+    caller stops waiting but leaves the computation running for the others. With
+    `distributed` enabled, a short Redis lock extends this across workers: the
+    worker holding the lock computes, the others poll the cache for its result.
+
+    The computation must store its result in the cache under the same key and
+    return the value exactly as it is cached, since remote waiters read it from there.
+    """
+
+    def __init__(
+        self,
+        *,
+        redis_cache: RedisCache,
+        distributed: bool = False,
+        lock_ttl: float = 60,
+        poll_interval: float = 0.1
+    ) -> None:
+        """
+        Initialize the single-flight group.
+
+        Args:
+            redis_cache (RedisCache): The cache the computations write to.
+            distributed (bool): Whether to coalesce across workers with a Redis lock.
+            lock_ttl (float): Maximum seconds the cross-worker lock is held.
+            poll_interval (float): Seconds between cache checks while waiting for another worker.
+        """
+        self.cache = redis_cache
+        self.distributed = distributed
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the result of `compute()` for `key`, sharing it with concurrent callers.
+
+        Args:
+            key (str): The cache key, as built by `make_cache_key`.
+            compute (Callable[[], Awaitable[Any]]): Computes, caches and returns the value.
+
+        Returns:
+            Any: The computed or shared value.
+        """
+        task = self._in_flight.get(key)
+        if task is not None and not task.done():
+            self.coalesced += 1
+            logger.info(f"Single-flight: awaiting in-flight computation for {key}")
+        else:
+            # The computation runs in its own task, so cancelling the caller that
+            # started it (e.g. a client disconnect) does not cancel the other waiters.
+            task = asyncio.create_task(self._compute(key, compute))
+            # Mark the exception as retrieved when nobody else was waiting for it.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            task.add_done_callback(lambda t: self._in_flight.pop(key) if self._in_flight.get(key) is t else None)
+            self._in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the computation, holding the cross-worker lock when enabled.
+        """
+        client = self.cache.client
+        if not self.distributed or client is None:
+            return await compute()
+
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.lock_ttl
+
+        while not await client.set(lock_key, token, nx=True, px=int(self.lock_ttl * 1000)):
+            await asyncio.sleep(self.poll_interval)
+            cached = await self.cache.get(key)
+            if cached:
+                self.coalesced += 1
+                logger.info(f"Single-flight: reused result computed by another worker for {key}")
+                return cached
+            if time.monotonic() >= deadline:
+                logger.warning(f"Single-flight: lock wait for {key} timed out, computing locally")
+                return await compute()
+
+        try:
+            # Another worker may have finished between our cache miss and taking the lock.
+            cached = await self.cache.get(key)
+            if cached:
+                return cached
+            return await compute()
+        finally:
+            await client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+
+# Process-wide single-flight group for agent cache misses
+single_flight = SingleFlight(
+    redis_cache=cache,
+    distributed=settings.SINGLE_FLIGHT_DISTRIBUTED,
+    lock_ttl=settings.SINGLE_FLIGHT_LOCK_TTL,
+    poll_interval=settings.SINGLE_FLIGHT_POLL_INTERVAL
+)
@@ -0,0 +1,107 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from settings import settings
+from src.logger.logger import logger
+
+
+class ConcurrencyLimiter:
+    """
+    Caps the number of concurrent graph runs and the number of requests waiting for a slot.
+
+    When every slot is busy and the wait queue is full, or a queued request waits
+    longer than `queue_timeout`, the request is rejected right away with
+    503 Service Unavailable and a `Retry-After` header instead of piling up.
+    """
+
+    def __init__(self, *, max_concurrency: int, max_queue: int, queue_timeout: float, retry_after: int) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency (int): Maximum number of runs executing at the same time.
+            max_queue (int): Maximum number of runs waiting for a free slot.
+            queue_timeout (float): Seconds a run may wait in the queue.
+            retry_after (int): Seconds sent to the client in the `Retry-After` header.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def _reject(self, reason: str) -> HTTPException:
+        logger.warning(f"Graph run rejected: {reason} (in flight: {self._in_flight}, waiting: {self._waiting})")
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"The assistant is busy: {reason}. Please retry later.",
+            headers={"Retry-After": str(self.retry_after)}
+        )
+
+    def ensure_capacity(self) -> None:
+        """
+        Reject the request right away if every slot is busy and the wait queue is full.
+
+        Raises:
+            HTTPException: 503 if the wait queue is full.
+        """
+        if self._in_flight >= self.max_concurrency and self._waiting >= self.max_queue:
+            raise self._reject("queue is full")
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot.
+
+        Raises:
+            HTTPException: 503 if the wait queue is full or the wait timed out.
+        """
+        self.ensure_capacity()
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise self._reject("timed out waiting for a free slot")
+        finally:
+            self._waiting -= 1
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """
+        Release a slot acquired with `acquire`.
+        """
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a slot for the duration of the `async with` block.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# Limiter shared by every endpoint that runs the graph
+graph_limiter = ConcurrencyLimiter(
+    max_concurrency=settings.GRAPH_MAX_CONCURRENCY,
+    max_queue=settings.GRAPH_MAX_QUEUE,
+    queue_timeout=settings.GRAPH_QUEUE_TIMEOUT,
+    retry_after=settings.GRAPH_RETRY_AFTER
+)
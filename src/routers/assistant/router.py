@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+
+from src.routers.assistant.limiter import graph_limiter
+from src.routers.assistant.schemas import AssistantQuery, AssistantResponse
+from src.routers.assistant.services import run_query, stream_graph
+
+router = APIRouter(prefix="/assistant", tags=["Assistant"])
+
+
+@router.post(
+    path="/query",
+    response_model=AssistantResponse,
+    summary="Run the assistant for a text query",
+    description="Run the multi-agent graph for a text query and budget. Returns 503 with a "
+                "Retry-After header when the assistant is at capacity.",
+    responses={
+        502: {"description": "An agent or the database failed while running the graph."},
+        503: {"description": "The assistant is at capacity; retry after the given delay."}
+    }
+)
+async def query(query_request: AssistantQuery) -> AssistantResponse:
+    """
+    Run the graph for a text query.
+
+    Args:
+        query_request (AssistantQuery): The user's request and budget.
+
+    Returns:
+        AssistantResponse: The final message and the generated shopping list.
+    """
+    return await run_query(query=query_request)
+
+
+@router.get(
+    path="/stream",
+    summary="Stream the assistant's progress",
+    description="Run the multi-agent graph for a text query and stream per-node progress "
+                "and the final message tokens as Server-Sent Events."
+)
+async def stream_query(
+    user_input: str = Query(..., min_length=1, description="What the user wants to prepare or buy."),
+    budget: float = Query(..., gt=0, description="The maximum budget for the shopping list.")
+) -> StreamingResponse:
+    """
+    Stream the graph execution for a text query.
+
+    Args:
+        user_input (str): The user's request.
+        budget (float): The user's budget.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` response with `start`, `node`, `token`,
+                           `done` and `error` events.
+    """
+    graph_limiter.ensure_capacity()
+    return StreamingResponse(
+        stream_graph(user_input=user_input, budget=budget),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,20 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.llm.agents.product_finder.schemas import ProductInfo
+
+
+class AssistantQuery(BaseModel):
+    user_input: str = Field(..., min_length=1, description="What the user wants to prepare or buy.")
+    budget: float = Field(..., gt=0, description="The maximum budget for the shopping list.")
+
+
+class AssistantResponse(BaseModel):
+    final_message: str = Field(..., description="The final message for the user.")
+    plan: Optional[str] = Field(None, description="The plan generated by the planner.")
+    recipes: List[str] = Field(default_factory=list, description="The selected recipes.")
+    products: List[ProductInfo] = Field(default_factory=list, description="The selected products.")
+    total_cost: Optional[float] = Field(None, description="The total cost of the selected products.")
+    within_budget: Optional[bool] = Field(None, description="Whether the total cost fits within the budget.")
+    final_budget_status: Optional[str] = Field(None, description="Explanation if the budget could not be met.")
@@ -0,0 +1,145 @@
+import json
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+
+from src.llm.graph import get_graph
+from src.llm.graph_cache import get_cached_state, get_graph_cache_key, invoke_graph, set_cached_state
+from src.llm.graph_schema import AgentState
+from src.logger.logger import logger
+from src.routers.assistant.limiter import graph_limiter
+from src.routers.assistant.schemas import AssistantQuery, AssistantResponse
+
+# State fields reported to the client when each node finishes.
+NODE_FIELDS: Dict[str, tuple] = {
+    "Planner": ("plan", "user_intent", "servings"),
+    "MealPlanner": ("plan", "user_intent", "servings", "recipes"),
+    "Recipe": ("recipes",),
+    "ProductFinder": ("products",),
+    "Budgeting": ("within_budget", "total_cost"),
+    "BudgetSolver": ("products", "within_budget", "total_cost", "final_budget_status"),
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    """
+    Format a single Server-Sent Event.
+
+    Args:
+        event (str): The event name.
+        data (Any): The JSON-serializable event payload.
+
+    Returns:
+        str: The encoded event, terminated by a blank line.
+    """
+    return f"event: {event}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+
+
+async def run_query(*, query: AssistantQuery) -> AssistantResponse:
+    """
+    Run the multi-agent graph for a text query within the graph concurrency limit.
+
+    Args:
+        query (AssistantQuery): The user's request and budget.
+
+    Returns:
+        AssistantResponse: The final message and the generated shopping list.
+
+    Raises:
+        HTTPException: 503 if the assistant is at capacity, 502 if the graph run failed.
+    """
+    initial_state: AgentState = {
+        "user_input": query.user_input,
+        "budget": query.budget
+    }
+
+    try:
+        graph_result = await invoke_graph(initial_state, slot=graph_limiter.slot)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Graph processing failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Graph processing failed: {e}"
+        )
+
+    return AssistantResponse(
+        final_message=graph_result.get("final_message", "No final message generated."),
+        plan=graph_result.get("plan"),
+        recipes=graph_result.get("recipes") or [],
+        products=graph_result.get("products") or [],
+        total_cost=graph_result.get("total_cost"),
+        within_budget=graph_result.get("within_budget"),
+        final_budget_status=graph_result.get("final_budget_status")
+    )
+
+
+async def stream_graph(*, user_input: str, budget: float) -> AsyncIterator[str]:
+    """
+    Run the multi-agent graph and stream its progress as Server-Sent Events.
+
+    A request already answered against the current catalog is replayed from the
+    graph cache as its `node` events and `done`; a completed stream is stored
+    there. Otherwise the run waits for a `graph_limiter` slot; if none frees up
+    in time an `error` event with `retry_after` is sent instead.
+
+    Emits a `start` event immediately, a `node` event as each agent finishes,
+    `token` events with the Finalizer's output as it is generated, and a final
+    `done` event with the complete message (or `error` if the run failed).
+
+    Args:
+        user_input (str): The user's request.
+        budget (float): The user's budget.
+
+    Yields:
+        str: Encoded Server-Sent Events.
+    """
+    yield format_sse("start", {"user_input": user_input, "budget": budget})
+
+    initial_state: AgentState = {
+        "user_input": user_input,
+        "budget": budget
+    }
+
+    cache_key = await get_graph_cache_key(initial_state)
+    cached = await get_cached_state(cache_key)
+    if cached:
+        for node, fields in NODE_FIELDS.items():
+            if node == "BudgetSolver" and not cached.get("budget_solved"):
+                continue
+            if all(field in cached for field in fields):
+                yield format_sse("node", {"node": node, **{field: cached.get(field) for field in fields}})
+        yield format_sse("done", {"final_message": cached.get("final_message", "No final message generated.")})
+        return
+
+    try:
+        await graph_limiter.acquire()
+    except HTTPException as e:
+        yield format_sse("error", {"message": e.detail, "retry_after": graph_limiter.retry_after})
+        return
+
+    final_state: AgentState = dict(initial_state)
+    try:
+        async for mode, chunk in get_graph().astream(initial_state, stream_mode=["updates", "messages"]):
+            if mode == "messages":
+                message, metadata = chunk
+                if metadata.get("langgraph_node") == "Finalizer" and message.content:
+                    yield format_sse("token", {"content": message.content})
+                continue
+
+            for node, output in chunk.items():
+                final_state.update(output or {})
+                if node == "Finalizer":
+                    final_message = (output or {}).get("final_message", "No final message generated.")
+                    yield format_sse("done", {"final_message": final_message})
+                elif node in NODE_FIELDS:
+                    fields = {field: (output or {}).get(field) for field in NODE_FIELDS[node]}
+                    yield format_sse("node", {"node": node, **fields})
+        await set_cached_state(cache_key, final_state)
+    except Exception as e:
+        logger.error(f"Graph streaming failed: {e}")
+        yield format_sse("error", {"message": "Graph processing failed", "error": str(e)})
+    finally:
+        graph_limiter.release()
@@ -1,13 +1,24 @@
-from fastapi import APIRouter, UploadFile, File, Request
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request
 from fastapi.responses import JSONResponse
 from fastapi.templating import Jinja2Templates
 
+from settings import settings
 from src.logger.logger import logger
-from src.routers.audio.services import transcribe_audio, run_graph
+from src.routers.audio.services import check_upload_size, transcribe_audio, run_graph
+from src.routers.common.body_limit import body_size_limit_route
 
-router = APIRouter(prefix="/audio")
+# Room for the multipart boundaries, headers and form fields around the audio file
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+router = APIRouter(
+    prefix="/audio",
+    route_class=body_size_limit_route(settings.AUDIO_MAX_UPLOAD_BYTES + FORM_OVERHEAD_BYTES)
+)
 templates = Jinja2Templates(directory="src/template")
 
+# Budget used when the recorder page does not send one
+DEFAULT_BUDGET = 9999
+
 
 @router.get("/")
 async def get_audio_page(request: Request):
@@ -24,39 +35,42 @@ async def get_audio_page(request: Request):
 
 
 @router.post("/upload-audio/")
-async def upload_audio(audio_file: UploadFile = File(...)) -> JSONResponse:
+async def upload_audio(
+    audio_file: UploadFile = File(...),
+    budget: float = Form(DEFAULT_BUDGET, gt=0)
+) -> JSONResponse:
     """
     Handle audio file upload, perform transcription, and run multi-agent graph.
 
     Args:
         audio_file (UploadFile): The uploaded audio file.
+        budget (float): The user's budget. Defaults to a large budget for the recorder page.
 
     Returns:
         JSONResponse: Response containing the filename, transcription, and graph final message.
     """
     try:
-        file_path = f"user_recording_{audio_file.filename}"
-        with open(file_path, "wb") as f:
-            f.write(await audio_file.read())
-        logger.info(f"Audio file saved: {file_path}")
-
-        transcription = await transcribe_audio(file_path=file_path)
+        check_upload_size(audio_file)
+        await audio_file.seek(0)
+        transcription = await transcribe_audio(audio=audio_file.file, filename=audio_file.filename or "recording.webm")
 
         if isinstance(transcription, JSONResponse):
             return transcription
 
-        final_message = await run_graph(request_content=transcription)
+        final_message = await run_graph(request_content=transcription, budget=budget)
 
         if isinstance(final_message, JSONResponse):
             return final_message
 
         return JSONResponse({
-            "message": "File saved, transcribed, and processed successfully!",
+            "message": "File received, transcribed, and processed successfully!",
             "filename": audio_file.filename,
             "transcription": transcription,
             "final_message": final_message
         })
 
+    except HTTPException:
+        raise
     except Exception as ex:
         logger.error(f"Error in audio transcription or processing: {ex}")
         return JSONResponse(
@@ -1,63 +1,144 @@
-from typing import Union
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
-from openai import OpenAI
+import httpx
+from fastapi import HTTPException, UploadFile, status
 from fastapi.responses import JSONResponse
 
 from settings import settings
-from src.llm.graph import graph
+from src.llm.graph_cache import invoke_graph
 from src.llm.graph_schema import AgentState
 from src.logger.logger import logger
+from src.routers.assistant.limiter import graph_limiter
 
-client = OpenAI(api_key=settings.OPENAI_API_KEY)
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 
-async def transcribe_audio(file_path: str) -> Union[str, JSONResponse]:
+def create_transcription_client(*, base_url: Optional[str] = None) -> "AsyncOpenAI":
     """
-    Transcribe audio file using OpenAI Whisper model.
+    Create an async OpenAI client with a pooled HTTP connection pool for transcription.
 
     Args:
-        file_path (str): Path to the audio file.
+        base_url (Optional[str]): Base URL of an OpenAI-compatible API. Defaults to the OpenAI API.
+
+    Returns:
+        AsyncOpenAI: The transcription client.
+    """
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=base_url,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.TRANSCRIPTION_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.TRANSCRIPTION_MAX_CONNECTIONS
+            )
+        )
+    )
+
+
+# Created on the first transcription, so importing this module does not import the OpenAI SDK
+transcription_client: Optional["AsyncOpenAI"] = None
+
+
+def get_transcription_client() -> "AsyncOpenAI":
+    """
+    Return the shared transcription client, creating it on first use.
+
+    Returns:
+        AsyncOpenAI: The transcription client.
+    """
+    global transcription_client
+    if transcription_client is None:
+        transcription_client = create_transcription_client(base_url=settings.TRANSCRIPTION_BASE_URL)
+    return transcription_client
+
+
+async def close_transcription_client() -> None:
+    """
+    Close the shared transcription client if it was created.
+    """
+    global transcription_client
+    if transcription_client is not None:
+        await transcription_client.close()
+        transcription_client = None
+
+
+def check_upload_size(audio_file: UploadFile) -> None:
+    """
+    Reject an audio file above `AUDIO_MAX_UPLOAD_BYTES`.
+
+    The route already refuses request bodies much larger than that before they
+    are read; this enforces the exact limit on the parsed file.
+
+    Args:
+        audio_file (UploadFile): The uploaded audio file.
+
+    Raises:
+        HTTPException: 413 if the file is too large.
+    """
+    if audio_file.size is not None and audio_file.size > settings.AUDIO_MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Audio file is larger than {settings.AUDIO_MAX_UPLOAD_BYTES} bytes"
+        )
+    logger.info(f"Audio upload received: {audio_file.filename} ({audio_file.size} bytes)")
+
+
+async def transcribe_audio(*, audio: BinaryIO, filename: str) -> Union[str, JSONResponse]:
+    """
+    Transcribe audio using the OpenAI Whisper model without blocking the event loop.
+
+    Args:
+        audio (BinaryIO): The audio contents.
+        filename (str): The original file name, used by the API to detect the format.
 
     Returns:
         Union[str, JSONResponse]: Transcribed text if successful, otherwise JSON error response.
     """
     try:
-        with open(file_path, "rb") as audio_f:
-            transcript_response = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_f
-            )
+        transcript_response = await get_transcription_client().audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, audio)
+        )
         return transcript_response.text
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         return JSONResponse(
             {
-                "message": "File saved, but transcription failed",
+                "message": "File received, but transcription failed",
                 "error": str(e)
             },
             status_code=500
         )
 
 
-async def run_graph(request_content: str) -> Union[str, JSONResponse]:
+async def run_graph(request_content: str, budget: float) -> Union[str, JSONResponse]:
     """
     Execute the LangGraph multi-agent workflow based on transcribed input.
 
     Args:
         request_content (str): The transcribed user input.
+        budget (float): The user's budget.
 
     Returns:
         Union[str, JSONResponse]: Final message from the graph or JSON error response if failed.
+
+    Raises:
+        HTTPException: 503 if the assistant is at capacity.
     """
     try:
         initial_state: AgentState = {
             "user_input": request_content,
-            "budget": 9999  # Default large budget; adjust as needed
+            "budget": budget
         }
-        graph_result = await graph.ainvoke(initial_state)
+        graph_result = await invoke_graph(initial_state, slot=graph_limiter.slot)
 
         final_message = graph_result.get("final_message", "No final message generated.")
         return final_message
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Graph processing failed: {e}")
         return JSONResponse(
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Coroutine, Type
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.types import Message
+
+
+def body_size_limit_route(max_bytes: int) -> Type[APIRoute]:
+    """
+    Create a route class that rejects request bodies larger than `max_bytes` with 413
+    before they are parsed.
+
+    A declared `Content-Length` above the limit is rejected without reading the body;
+    bodies without one are counted as they are received and cut off at the limit,
+    so an oversized upload is never buffered in full.
+
+    Args:
+        max_bytes (int): Maximum size of a request body in bytes.
+
+    Returns:
+        Type[APIRoute]: The route class, for `APIRouter(route_class=...)`.
+    """
+    def too_large() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Request body is larger than {max_bytes} bytes"
+        )
+
+    class BodySizeLimitRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            handler = super().get_route_handler()
+
+            async def limited_handler(request: Request) -> Response:
+                content_length = request.headers.get("content-length", "")
+                if content_length.isdigit() and int(content_length) > max_bytes:
+                    raise too_large()
+
+                received = 0
+
+                async def receive() -> Message:
+                    nonlocal received
+                    message = await request.receive()
+                    received += len(message.get("body", b""))
+                    if received > max_bytes:
+                        raise too_large()
+                    return message
+
+                return await handler(Request(request.scope, receive))
+
+            return limited_handler
+
+    return BodySizeLimitRoute
@@ -0,0 +1,49 @@
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+# Fetches up to `limit` rows with an id greater than `after_id`, ordered by id
+FetchPage = Callable[[Optional[int], int], Awaitable[List[Dict[str, Any]]]]
+
+
+async def stream_page(
+    fetch: FetchPage,
+    *,
+    after_id: Optional[int],
+    limit: int,
+    chunk_size: int
+) -> AsyncIterator[str]:
+    """
+    Stream one keyset-paginated page as a JSON object, fetching it in chunks.
+
+    The page is read `chunk_size` rows at a time, each chunk continuing after the
+    last id of the previous one, and every chunk is serialized and sent before the
+    next is fetched, so at most one chunk is held in memory.
+
+    The response is `{"items": [...], "next_after_id": id}`, where `next_after_id`
+    is the id to pass for the next page, or null once there are no more rows.
+
+    Args:
+        fetch (FetchPage): Fetches rows after an id, ordered by id.
+        after_id (Optional[int]): Start after this id.
+        limit (int): Maximum number of rows in the page.
+        chunk_size (int): Maximum number of rows per query.
+
+    Yields:
+        str: Parts of the JSON response.
+    """
+    yield '{"items": ['
+    sent = 0
+    exhausted = False
+    while sent < limit:
+        size = min(chunk_size, limit - sent)
+        rows = await fetch(after_id, size)
+        if rows:
+            separator = ", " if sent else ""
+            yield separator + ", ".join(json.dumps(row, default=str) for row in rows)
+            sent += len(rows)
+            after_id = rows[-1]["id"]
+        if len(rows) < size:
+            exhausted = True
+            break
+    next_after_id = None if exhausted or not sent else after_id
+    yield f'], "next_after_id": {json.dumps(next_after_id)}}}'
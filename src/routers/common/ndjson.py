@@ -0,0 +1,122 @@
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple, Type, Union
+
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from src.logger.logger import logger
+
+# A parsed line: its 1-based number and the validated item or the reason it was rejected
+ParsedLine = Tuple[int, Union[BaseModel, str]]
+
+
+async def iter_ndjson(
+    request: Request,
+    schema: Type[BaseModel],
+    *,
+    max_line_bytes: int
+) -> AsyncIterator[ParsedLine]:
+    """
+    Parse a streamed NDJSON request body line by line as it arrives.
+
+    Only the current incomplete line is buffered, so memory stays flat for any
+    payload size. Blank lines are skipped; invalid lines are yielded with an error.
+
+    Args:
+        request (Request): The incoming request.
+        schema (Type[BaseModel]): The model each line is validated against.
+        max_line_bytes (int): Maximum length of a single line.
+
+    Yields:
+        ParsedLine: The line number and the validated item or an error message.
+    """
+    buffer = b""
+    line_number = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, parse_line(line, schema)
+        if len(buffer) > max_line_bytes:
+            raise ValueError(f"Line {line_number + 1} is longer than {max_line_bytes} bytes")
+    if buffer.strip():
+        yield line_number + 1, parse_line(buffer, schema)
+
+
+def parse_line(line: bytes, schema: Type[BaseModel]) -> Union[BaseModel, str]:
+    """
+    Validate one NDJSON line, returning the item or an error message.
+    """
+    try:
+        return schema.model_validate(json.loads(line))
+    except (ValueError, ValidationError) as e:
+        return str(e).splitlines()[0] if isinstance(e, ValidationError) else f"Invalid JSON: {e}"
+
+
+async def import_ndjson(
+    request: Request,
+    schema: Type[BaseModel],
+    *,
+    upsert: Callable[[List[BaseModel]], Awaitable[int]],
+    on_complete: Callable[[], Awaitable[None]],
+    batch_size: int,
+    max_line_bytes: int
+) -> AsyncIterator[str]:
+    """
+    Import a streamed NDJSON body in batches, reporting each batch as an NDJSON line.
+
+    Every `batch_size` valid items are written with one `upsert` call; a batch that
+    fails is reported and skipped. `on_complete` runs once at the end if anything
+    was written, even when the import stops early.
+
+    Args:
+        request (Request): The incoming request.
+        schema (Type[BaseModel]): The model each line is validated against.
+        upsert (Callable[[List[BaseModel]], Awaitable[int]]): Writes a batch and returns the number of rows written.
+        on_complete (Callable[[], Awaitable[None]]): Runs after the last batch, e.g. to invalidate caches.
+        batch_size (int): Number of items per batch.
+        max_line_bytes (int): Maximum length of a single line.
+
+    Yields:
+        str: One JSON line per batch, then a summary line.
+    """
+    totals = {"received": 0, "written": 0, "rejected": 0, "batches": 0}
+
+    async def flush(items: List[BaseModel], errors: List[Dict[str, Any]]) -> str:
+        totals["batches"] += 1
+        totals["rejected"] += len(errors)
+        written = 0
+        if items:
+            try:
+                written = await upsert(items)
+            except Exception as e:
+                logger.error(f"Bulk import batch {totals['batches']} failed: {e}")
+                errors.append({"error": f"Batch failed: {e}"})
+                totals["rejected"] += len(items)
+        totals["written"] += written
+        return json.dumps({"batch": totals["batches"], "written": written, "errors": errors}) + "\n"
+
+    items: List[BaseModel] = []
+    errors: List[Dict[str, Any]] = []
+    try:
+        try:
+            async for line_number, item in iter_ndjson(request, schema, max_line_bytes=max_line_bytes):
+                totals["received"] += 1
+                if isinstance(item, str):
+                    errors.append({"line": line_number, "error": item})
+                else:
+                    items.append(item)
+                if len(items) >= batch_size:
+                    yield await flush(items, errors)
+                    items, errors = [], []
+        except ValueError as e:
+            errors.append({"error": str(e)})
+
+        if items or errors:
+            yield await flush(items, errors)
+        yield json.dumps({"done": True, **totals}) + "\n"
+    finally:
+        if totals["written"]:
+            await on_complete()
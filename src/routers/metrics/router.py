@@ -0,0 +1,72 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Request
+
+from src.llm.agents.common.token_counter import token_usage
+from src.llm.agents.planner.plan_cache import plan_cache
+from src.redis_client.client import cache
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get(
+    path="/cache",
+    summary="Cache statistics",
+    description="Hit, miss and eviction counters of the agent cache tiers in this worker."
+)
+async def get_cache_metrics() -> Dict[str, Any]:
+    """
+    Get the cache counters of this worker.
+
+    Returns:
+        Dict[str, Any]: The cache statistics.
+    """
+    return cache.stats()
+
+
+@router.get(
+    path="/planner",
+    summary="Planner cache statistics",
+    description="Exact and semantic hit counters and lookup latency of the planner cache in this worker."
+)
+async def get_planner_metrics() -> Dict[str, Any]:
+    """
+    Get the planner cache counters of this worker.
+
+    Returns:
+        Dict[str, Any]: The planner cache statistics.
+    """
+    return plan_cache.stats()
+
+
+@router.get(
+    path="/tokens",
+    summary="LLM token usage",
+    description="Number of LLM calls and prompt and completion tokens of each agent in this worker."
+)
+async def get_token_metrics() -> Dict[str, Any]:
+    """
+    Get the token counters of this worker.
+
+    Returns:
+        Dict[str, Any]: The token usage of each agent.
+    """
+    return dict(token_usage)
+
+
+@router.get(
+    path="/boot",
+    summary="Worker boot time",
+    description="Milliseconds this worker spent on each startup phase, from its first import to serving requests."
+)
+async def get_boot_metrics(request: Request) -> Dict[str, float]:
+    """
+    Get the boot timings of this worker.
+
+    Args:
+        request (Request): The incoming request.
+
+    Returns:
+        Dict[str, float]: Milliseconds per startup phase and in total.
+    """
+    return getattr(request.app.state, "boot_timings", {})
@@ -1,17 +1,63 @@
-from fastapi import APIRouter
-from typing import Dict
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from typing import Dict, Optional
+
+from settings import settings
+from src.db.product.enums import ProductCategoryEnum
 
 from src.routers.products.schemas import Product, UpdateProduct
 from src.routers.products.services import (
     get_product_from_db,
     create_product_in_db,
     update_product_in_db,
-    delete_product_in_db
+    delete_product_in_db,
+    import_products,
+    list_products_page
 )
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
 
+@router.get(
+    path="/",
+    summary="List products",
+    description="List products ordered by id, optionally filtered by category, price range and name prefix. "
+                "Pass the returned `next_after_id` as `after_id` to fetch the next page.",
+    response_class=StreamingResponse
+)
+async def list_products(
+    after_id: Optional[int] = Query(None, ge=0, description="Return products after this id."),
+    limit: int = Query(settings.LIST_DEFAULT_LIMIT, ge=1, le=settings.LIST_MAX_LIMIT, description="Page size."),
+    category: Optional[ProductCategoryEnum] = Query(None, description="Product category."),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price."),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price."),
+    name_prefix: Optional[str] = Query(None, max_length=50, description="Case-sensitive name prefix.")
+) -> StreamingResponse:
+    """
+    List one page of products.
+
+    Args:
+        after_id (Optional[int]): The `next_after_id` of the previous page.
+        limit (int): Maximum number of products in the page.
+        category (Optional[ProductCategoryEnum]): Only list products of this category.
+        min_price (Optional[float]): Only list products at least this expensive.
+        max_price (Optional[float]): Only list products at most this expensive.
+        name_prefix (Optional[str]): Only list products whose name starts with this text.
+
+    Returns:
+        StreamingResponse: `{"items": [...], "next_after_id": ...}`, streamed as it is read.
+    """
+    page = list_products_page(
+        after_id=after_id,
+        limit=limit,
+        category=category,
+        min_price=min_price,
+        max_price=max_price,
+        name_prefix=name_prefix
+    )
+    return StreamingResponse(page, media_type="application/json")
+
+
 @router.get(
     path="/{name}",
     response_model=Product,
@@ -87,3 +133,27 @@ async def delete_product(name: str) -> Dict[str, bool]:
     """
     status = await delete_product_in_db(name=name)
     return {"success": status}
+
+
+@router.post(
+    path="/bulk",
+    summary="Bulk import products",
+    description="Create or update products from a streamed NDJSON body, one Product object per line. "
+                "Responds with one NDJSON line per written batch and a final summary line.",
+    response_class=Response,
+    openapi_extra={"requestBody": {"content": {"application/x-ndjson": {"schema": {"type": "string"}}}, "required": True}}
+)
+async def bulk_import_products(request: Request) -> Response:
+    """
+    Import products from a streamed NDJSON body.
+
+    Args:
+        request (Request): The request with one product per line.
+
+    Returns:
+        Response: The per-batch results as NDJSON.
+    """
+    # The body is consumed here rather than from a streaming response: on ASGI servers
+    # below spec 2.4 its disconnect listener would read body messages concurrently.
+    results = [line async for line in import_products(request)]
+    return Response("".join(results), media_type="application/x-ndjson")
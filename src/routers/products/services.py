@@ -1,14 +1,25 @@
-from fastapi import HTTPException, status
+from typing import AsyncIterator, List, Optional
+
+from fastapi import HTTPException, Request, status
 from tortoise.exceptions import DoesNotExist
 
+from settings import settings
+from src.db.catalog.product_index import product_index
+from src.db.catalog.snapshot import catalog
+from src.db.product.enums import ProductCategoryEnum
 from src.db.product.model import ProductModel
 from src.db.product.repository import (
     get_product_by_name,
     create_product,
     update_product,
-    delete_product
+    delete_product,
+    upsert_products,
+    list_products
 )
+from src.routers.common.listing import stream_page
+from src.routers.common.ndjson import import_ndjson
 from src.routers.products.schemas import Product, UpdateProduct
+from src.redis_client.services import bump_generation
 
 
 def product_to_pydantic(product: ProductModel) -> Product:
@@ -54,6 +65,10 @@ async def create_product_in_db(*, product_data: Product) -> Product:
         Product: The created product.
     """
     product = await create_product(**product_data.model_dump())
+    await bump_generation("catalog")
+    await catalog.refresh()
+    if settings.PRODUCT_INDEX_ENABLED:
+        product_index.schedule_rebuild()
     return product_to_pydantic(product)
 
 
@@ -81,6 +96,10 @@ async def update_product_in_db(*, name: str, product_data: UpdateProduct) -> Pro
 
     update_data = product_data.model_dump(exclude_unset=True)
     await update_product(product=product, update_data=update_data)
+    await bump_generation("catalog")
+    await catalog.refresh()
+    if settings.PRODUCT_INDEX_ENABLED:
+        product_index.schedule_rebuild()
 
     return product_to_pydantic(product)
 
@@ -97,7 +116,81 @@ async def delete_product_in_db(name: str) -> bool:
     """
     try:
         deleted = await delete_product(name=name)
-        return deleted > 0
     except Exception:
         return False
 
+    if deleted:
+        await bump_generation("catalog")
+        await catalog.refresh()
+        if settings.PRODUCT_INDEX_ENABLED:
+            product_index.schedule_rebuild()
+    return deleted > 0
+
+
+def import_products(request: Request) -> AsyncIterator[str]:
+    """
+    Create or update products from a streamed NDJSON body, one product per line.
+
+    Products are written in batches of `BULK_IMPORT_BATCH_SIZE` per transaction,
+    matched by name. Caches are invalidated and the catalog snapshot reloaded once,
+    after the last batch.
+
+    Args:
+        request (Request): The request with the NDJSON body.
+
+    Returns:
+        AsyncIterator[str]: One JSON line per batch with its written count and errors, then a summary line.
+    """
+    async def upsert(items: List[Product]) -> int:
+        return await upsert_products(products=[item.model_dump() for item in items])
+
+    async def on_complete() -> None:
+        await bump_generation("catalog")
+        await catalog.refresh()
+        if settings.PRODUCT_INDEX_ENABLED:
+            product_index.schedule_rebuild()
+
+    return import_ndjson(
+        request,
+        Product,
+        upsert=upsert,
+        on_complete=on_complete,
+        batch_size=settings.BULK_IMPORT_BATCH_SIZE,
+        max_line_bytes=settings.BULK_IMPORT_MAX_LINE_BYTES
+    )
+
+
+def list_products_page(
+    *,
+    after_id: Optional[int],
+    limit: int,
+    category: Optional[ProductCategoryEnum],
+    min_price: Optional[float],
+    max_price: Optional[float],
+    name_prefix: Optional[str]
+) -> AsyncIterator[str]:
+    """
+    Stream one page of products, ordered by id, as JSON.
+
+    Args:
+        after_id (Optional[int]): Only list products after this id, the `next_after_id` of the previous page.
+        limit (int): Maximum number of products in the page.
+        category (Optional[ProductCategoryEnum]): Only list products of this category.
+        min_price (Optional[float]): Only list products at least this expensive.
+        max_price (Optional[float]): Only list products at most this expensive.
+        name_prefix (Optional[str]): Only list products whose name starts with this text.
+
+    Returns:
+        AsyncIterator[str]: Parts of the JSON response, see `stream_page`.
+    """
+    async def fetch(after: Optional[int], size: int):
+        return await list_products(
+            limit=size,
+            after_id=after,
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            name_prefix=name_prefix
+        )
+
+    return stream_page(fetch, after_id=after_id, limit=limit, chunk_size=settings.LIST_CHUNK_SIZE)
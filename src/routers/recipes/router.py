@@ -1,15 +1,61 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
+
+from settings import settings
+from src.db.product.enums import ProductCategoryEnum
+from src.db.recipe.enums import RecipeCategoryEnum
 from src.routers.recipes.schemas import Recipe, UpdateRecipe
 from src.routers.recipes.services import (
     get_recipe_from_db,
     create_recipe_in_db,
     update_recipe_in_db,
-    delete_recipe_in_db
+    delete_recipe_in_db,
+    import_recipes,
+    list_recipes_page
 )
 
 router = APIRouter(prefix="/recipes", tags=["Recipes"])
 
 
+@router.get(
+    path="/",
+    summary="List recipes",
+    description="List recipes ordered by id, optionally filtered by category, ingredient category and name prefix. "
+                "Pass the returned `next_after_id` as `after_id` to fetch the next page.",
+    response_class=StreamingResponse
+)
+async def list_recipes(
+    after_id: Optional[int] = Query(None, ge=0, description="Return recipes after this id."),
+    limit: int = Query(settings.LIST_DEFAULT_LIMIT, ge=1, le=settings.LIST_MAX_LIMIT, description="Page size."),
+    category: Optional[RecipeCategoryEnum] = Query(None, description="Recipe category."),
+    ingredient_category: Optional[ProductCategoryEnum] = Query(None, description="Category of an ingredient."),
+    name_prefix: Optional[str] = Query(None, max_length=50, description="Case-sensitive name prefix.")
+) -> StreamingResponse:
+    """
+    List one page of recipes.
+
+    Args:
+        after_id (Optional[int]): The `next_after_id` of the previous page.
+        limit (int): Maximum number of recipes in the page.
+        category (Optional[RecipeCategoryEnum]): Only list recipes of this category.
+        ingredient_category (Optional[ProductCategoryEnum]): Only list recipes using a product of this category.
+        name_prefix (Optional[str]): Only list recipes whose name starts with this text.
+
+    Returns:
+        StreamingResponse: `{"items": [...], "next_after_id": ...}`, streamed as it is read.
+    """
+    page = list_recipes_page(
+        after_id=after_id,
+        limit=limit,
+        category=category,
+        ingredient_category=ingredient_category,
+        name_prefix=name_prefix
+    )
+    return StreamingResponse(page, media_type="application/json")
+
+
 @router.get("/{name}", response_model=Recipe)
 async def get_recipe(name: str):
     """
@@ -78,3 +124,26 @@ async def delete_recipe(name: str):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to delete recipe")
     return {"success": success}
 
+
+@router.post(
+    path="/bulk",
+    summary="Bulk import recipes",
+    description="Create or update recipes from a streamed NDJSON body, one Recipe object per line. "
+                "Responds with one NDJSON line per written batch and a final summary line.",
+    response_class=Response,
+    openapi_extra={"requestBody": {"content": {"application/x-ndjson": {"schema": {"type": "string"}}}, "required": True}}
+)
+async def bulk_import_recipes(request: Request) -> Response:
+    """
+    Import recipes from a streamed NDJSON body.
+
+    Args:
+        request (Request): The request with one recipe per line.
+
+    Returns:
+        Response: The per-batch results as NDJSON.
+    """
+    # The body is consumed here rather than from a streaming response: on ASGI servers
+    # below spec 2.4 its disconnect listener would read body messages concurrently.
+    results = [line async for line in import_recipes(request)]
+    return Response("".join(results), media_type="application/x-ndjson")
@@ -1,12 +1,25 @@
-from fastapi import HTTPException, status
+from typing import AsyncIterator, List, Optional
+
+from fastapi import HTTPException, Request, status
+
+from settings import settings
+from src.db.catalog.recipe_index import recipe_index
+from src.db.catalog.snapshot import catalog
+from src.db.product.enums import ProductCategoryEnum
+from src.db.recipe.enums import RecipeCategoryEnum
 from src.db.recipe.repository import (
     get_recipe_by_name,
     create_recipe,
     update_recipe,
-    delete_recipe
+    delete_recipe,
+    upsert_recipes,
+    list_recipes
 )
+from src.routers.common.listing import stream_page
+from src.routers.common.ndjson import import_ndjson
 from src.routers.recipes.schemas import Recipe, UpdateRecipe
 from src.db.recipe.model import RecipeModel
+from src.redis_client.services import bump_generation
 
 
 def recipe_to_pydantic(recipe: RecipeModel) -> Recipe:
@@ -77,6 +90,8 @@ async def create_recipe_in_db(*, recipe_data: Recipe) -> Recipe:
         category=recipe_data.category,
         ingredients=[ingredient.model_dump() for ingredient in recipe_data.ingredients]
     )
+    await bump_generation("recipes")
+    await recipe_index.for_snapshot(await catalog.refresh())
     return recipe_to_pydantic(recipe)
 
 
@@ -94,6 +109,8 @@ async def update_recipe_in_db(*, name: str, recipe_data: UpdateRecipe) -> Recipe
     recipe = await _get_existing_recipe(name)
     update_data = recipe_data.model_dump(exclude_unset=True)
     await update_recipe(recipe=recipe, update_data=update_data)
+    await bump_generation("recipes")
+    await recipe_index.for_snapshot(await catalog.refresh())
     return recipe_to_pydantic(recipe)
 
 
@@ -109,6 +126,74 @@ async def delete_recipe_in_db(name: str) -> bool:
     """
     try:
         deleted = await delete_recipe(name=name)
-        return deleted > 0
     except Exception:
         return False
+
+    if deleted:
+        await bump_generation("recipes")
+        await recipe_index.for_snapshot(await catalog.refresh())
+    return deleted > 0
+
+
+def import_recipes(request: Request) -> AsyncIterator[str]:
+    """
+    Create or update recipes from a streamed NDJSON body, one recipe per line.
+
+    Recipes are written in batches of `BULK_IMPORT_BATCH_SIZE` per transaction,
+    matched by name. Caches are invalidated and the catalog snapshot reloaded once,
+    after the last batch.
+
+    Args:
+        request (Request): The request with the NDJSON body.
+
+    Returns:
+        AsyncIterator[str]: One JSON line per batch with its written count and errors, then a summary line.
+    """
+    async def upsert(items: List[Recipe]) -> int:
+        return await upsert_recipes(recipes=[item.model_dump() for item in items])
+
+    async def on_complete() -> None:
+        await bump_generation("recipes")
+        await recipe_index.for_snapshot(await catalog.refresh())
+
+    return import_ndjson(
+        request,
+        Recipe,
+        upsert=upsert,
+        on_complete=on_complete,
+        batch_size=settings.BULK_IMPORT_BATCH_SIZE,
+        max_line_bytes=settings.BULK_IMPORT_MAX_LINE_BYTES
+    )
+
+
+def list_recipes_page(
+    *,
+    after_id: Optional[int],
+    limit: int,
+    category: Optional[RecipeCategoryEnum],
+    ingredient_category: Optional[ProductCategoryEnum],
+    name_prefix: Optional[str]
+) -> AsyncIterator[str]:
+    """
+    Stream one page of recipes, ordered by id, as JSON.
+
+    Args:
+        after_id (Optional[int]): Only list recipes after this id, the `next_after_id` of the previous page.
+        limit (int): Maximum number of recipes in the page.
+        category (Optional[RecipeCategoryEnum]): Only list recipes of this category.
+        ingredient_category (Optional[ProductCategoryEnum]): Only list recipes using a product of this category.
+        name_prefix (Optional[str]): Only list recipes whose name starts with this text.
+
+    Returns:
+        AsyncIterator[str]: Parts of the JSON response, see `stream_page`.
+    """
+    async def fetch(after: Optional[int], size: int):
+        return await list_recipes(
+            limit=size,
+            after_id=after,
+            category=category,
+            ingredient_category=ingredient_category,
+            name_prefix=name_prefix
+        )
+
+    return stream_page(fetch, after_id=after_id, limit=limit, chunk_size=settings.LIST_CHUNK_SIZE)
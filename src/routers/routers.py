@@ -3,10 +3,14 @@ from fastapi import APIRouter
 from src.routers.products.router import router as product_router
 from src.routers.recipes.router import router as recipe_router
 from src.routers.audio.router import router as audio_router
+from src.routers.assistant.router import router as assistant_router
+from src.routers.metrics.router import router as metrics_router
 
 
 router = APIRouter(prefix="/api/v1")
 
 router.include_router(router=product_router)
 router.include_router(router=recipe_router)
-router.include_router(router=audio_router)
\ No newline at end of file
+router.include_router(router=audio_router)
+router.include_router(router=assistant_router)
+router.include_router(router=metrics_router)
@@ -1,9 +1,20 @@
 import asyncio
+import atexit
+import threading
+from typing import Any, Coroutine, TypeVar
+
 import streamlit as st
 
+from src.db.catalog.recipe_index import recipe_index
+from src.db.catalog.snapshot import catalog
 from src.db.db_setup import DB
-from src.llm.graph import graph
+from src.llm.graph import get_graph
+from src.llm.graph_cache import invoke_graph
 from src.llm.graph_schema import AgentState
+from src.logger.logger import logger
+from src.redis_client.client import cache
+
+T = TypeVar("T")
 
 st.set_page_config(page_title="🛒 Grocery AI Assistant", page_icon="🛒")
 st.title("🛒 Grocery Shopping Assistant")
@@ -13,6 +24,62 @@ user_input = st.text_input("What do you want to buy?", placeholder="For example:
 budget = st.number_input("Maximum budget (USD)", min_value=1, value=25, step=1)
 
 
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Start the event loop shared by every session and rerun of this Streamlit process.
+
+    The database pool, the Redis connections and the LLM HTTP clients are bound to
+    the loop they were first used on, so all graph runs go through this one
+    long-lived loop, running in a background thread.
+
+    Returns:
+        asyncio.AbstractEventLoop: The running background loop.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="streamlit-event-loop", daemon=True).start()
+    return loop
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
+
+
+async def start_clients() -> None:
+    """
+    Open the database pool, load the catalog snapshot, warm up the Redis connection
+    and compile the graph with its LLM clients.
+    """
+    get_graph()
+    await DB.init_orm()
+    await recipe_index.for_snapshot(await catalog.refresh())
+    if cache.client is not None:
+        await cache.client.ping()
+
+
+async def stop_clients() -> None:
+    """
+    Close the database pool and the Redis connections.
+    """
+    if cache.client is not None:
+        await cache.client.aclose()
+    await DB.close_orm()
+
+
+@st.cache_resource
+def get_clients() -> None:
+    """
+    Initialize the ORM, Redis and catalog once per process, as the FastAPI lifespan does,
+    and close them when the process exits.
+    """
+    run_async(start_clients())
+    atexit.register(lambda: run_async(stop_clients()))
+    logger.info("Streamlit clients started")
+
+
 async def generate_state(*, input_content: str, user_budget: int):
     """
     Generate a shopping list by invoking the multi-agent graph.
@@ -24,16 +91,11 @@ async def generate_state(*, input_content: str, user_budget: int):
     Returns:
         AgentState: The final state of the multi-agent graph, including the final message.
     """
-    await DB.init_orm()
-    try:
-        initial_state: AgentState = {
-            "user_input": input_content,
-            "budget": user_budget
-        }
-        graph_result = await graph.ainvoke(initial_state)
-    finally:
-        await DB.close_orm()
-    return graph_result
+    initial_state: AgentState = {
+        "user_input": input_content,
+        "budget": user_budget
+    }
+    return await invoke_graph(initial_state)
 
 
 def main() -> None:
@@ -43,7 +105,8 @@ def main() -> None:
     if st.button("Generate shopping list"):
         with st.spinner("Generating list..."):
             try:
-                result = asyncio.run(generate_state(input_content=user_input, user_budget=budget))
+                get_clients()
+                result = run_async(generate_state(input_content=user_input, user_budget=budget))
                 final_message = result.get("final_message", "No final message generated.")
                 st.success("Shopping list ready!")
                 st.subheader("🧾 Final shopping list:")
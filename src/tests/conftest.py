@@ -0,0 +1,31 @@
+import pytest
+import pytest_asyncio
+from tortoise import Tortoise
+
+from src.redis_client import services
+from src.redis_client.client import LRUCache, cache
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    """
+    Fixture that initializes the application models on an in-memory SQLite database.
+    """
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": ["src.db.db_models"]},
+    )
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """
+    Fixture that switches the shared cache to the in-memory backend, so no Redis is needed.
+    """
+    monkeypatch.setattr(cache, "client", None)
+    monkeypatch.setattr(cache, "l1", LRUCache(max_size=1024))
+    monkeypatch.setattr(services, "_local_generations", {})
+    return cache
@@ -0,0 +1,122 @@
+import json
+from typing import TypedDict
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import StateGraph
+
+from src.routers.assistant import services
+from src.routers.assistant.router import router
+
+
+class StubState(TypedDict, total=False):
+    user_input: str
+    budget: float
+    plan: str
+    final_message: str
+
+
+def build_stub_graph():
+    """
+    Build a two-node graph whose Finalizer calls a fake streaming chat model.
+    """
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content="Here is your list")]))
+
+    async def planner(state: StubState) -> StubState:
+        state["plan"] = "simple dinner"
+        return state
+
+    async def finalizer(state: StubState) -> StubState:
+        response = await llm.ainvoke("Generate a final message.")
+        state["final_message"] = response.content
+        return state
+
+    builder = StateGraph(state_schema=StubState)
+    builder.add_node("Planner", planner)
+    builder.add_node("Finalizer", finalizer)
+    builder.set_entry_point("Planner")
+    builder.add_edge("Planner", "Finalizer")
+    builder.set_finish_point("Finalizer")
+    return builder.compile()
+
+
+def parse_events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_node_progress_then_finalizer_tokens(monkeypatch, memory_cache):
+    """
+    The SSE endpoint reports each finished node and streams the Finalizer output token by token.
+    """
+    stub_graph = build_stub_graph()
+    monkeypatch.setattr(services, "get_graph", lambda: stub_graph)
+    app = FastAPI()
+    app.include_router(router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/assistant/stream", params={"user_input": "Dinner", "budget": 20})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.text)
+
+    names = [name for name, _ in events]
+    assert names[:2] == ["start", "node"] and names[-1] == "done"
+    assert len(names) > 4 and set(names[2:-1]) == {"token"}
+    assert events[1][1] == {"node": "Planner", "plan": "simple dinner", "user_intent": None, "servings": None}
+    assert "".join(data["content"] for name, data in events if name == "token") == "Here is your list"
+    assert events[-1][1] == {"final_message": "Here is your list"}
+
+
+@pytest.mark.asyncio
+async def test_completed_stream_is_replayed_from_graph_cache(monkeypatch, memory_cache):
+    """
+    A streamed run is memoized, so the same request streams again without running the graph.
+    """
+    runs = 0
+
+    def get_stub_graph():
+        nonlocal runs
+        runs += 1
+        return build_stub_graph()
+
+    monkeypatch.setattr(services, "get_graph", get_stub_graph)
+    app = FastAPI()
+    app.include_router(router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        responses = [
+            await client.get("/assistant/stream", params={"user_input": "Dinner", "budget": 20})
+            for _ in range(2)
+        ]
+
+    assert runs == 1
+    replayed = parse_events(responses[1].text)
+    assert "token" not in [name for name, _ in replayed]
+    assert replayed[-1] == ("done", {"final_message": "Here is your list"})
+
+
+@pytest.mark.asyncio
+async def test_query_reports_graph_failure_as_bad_gateway(monkeypatch):
+    """
+    A failing graph run is logged and returned as a 502 with the error, not an unhandled 500.
+    """
+    async def failing_invoke_graph(initial_state, *, slot=None):
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(services, "invoke_graph", failing_invoke_graph)
+    app = FastAPI()
+    app.include_router(router)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/assistant/query", json={"user_input": "Dinner", "budget": 20})
+
+    assert response.status_code == 502
+    assert response.json() == {"detail": "Graph processing failed: LLM unavailable"}
@@ -0,0 +1,121 @@
+import asyncio
+import socket
+import threading
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import APIRouter, FastAPI, File, Request, UploadFile
+
+from src.routers.audio import router as audio_router
+from src.routers.audio import services
+from src.routers.common.body_limit import body_size_limit_route
+
+STUB_DELAY = 0.5
+
+
+def create_stub_transcription_app() -> FastAPI:
+    """
+    A local stand-in for the Whisper API that takes `STUB_DELAY` seconds per request.
+    """
+    app = FastAPI()
+
+    @app.post("/v1/audio/transcriptions")
+    async def transcriptions(request: Request):
+        form = await request.form()
+        audio = await form["file"].read()
+        await asyncio.sleep(STUB_DELAY)
+        return {"text": f"{len(audio)} bytes"}
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def stub_server_url():
+    """
+    Run the stub transcription server on a free local port in a background thread.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(create_stub_transcription_app(), host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    yield f"http://127.0.0.1:{port}/v1"
+
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads_overlap(monkeypatch, stub_server_url):
+    """
+    Concurrent uploads are transcribed in parallel instead of blocking the event loop one after another.
+    """
+    async def fake_run_graph(request_content: str, budget: float) -> str:
+        return f"Plan for {request_content} within {budget}"
+
+    monkeypatch.setattr(services, "transcription_client", services.create_transcription_client(base_url=stub_server_url))
+    monkeypatch.setattr(audio_router, "run_graph", fake_run_graph)
+    app = FastAPI()
+    app.include_router(audio_router.router)
+
+    uploads = 4
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post(
+                "/audio/upload-audio/",
+                files={"audio_file": ("recording.webm", b"\x00" * 200_000, "audio/webm")},
+                data={"budget": "30"}
+            )
+            for _ in range(uploads)
+        ])
+        elapsed = time.perf_counter() - start
+
+    await services.transcription_client.close()
+
+    assert [response.status_code for response in responses] == [200] * uploads
+    assert responses[0].json()["final_message"] == "Plan for 200000 bytes within 30.0"
+    assert elapsed < STUB_DELAY * uploads / 2, f"Uploads were serialized: {elapsed:.2f}s"
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_is_rejected_before_it_is_buffered():
+    """
+    Bodies over the route limit get 413 from their Content-Length, or as soon as the
+    streamed bytes pass the limit, without reading the rest.
+    """
+    router = APIRouter(route_class=body_size_limit_route(1000))
+
+    @router.post("/upload")
+    async def upload(audio_file: UploadFile = File(...)):
+        return {"size": audio_file.size}
+
+    app = FastAPI()
+    app.include_router(router)
+    sent_chunks = 0
+
+    async def chunked_body():
+        nonlocal sent_chunks
+        yield b'--x\r\nContent-Disposition: form-data; name="audio_file"; filename="a.webm"\r\n\r\n'
+        for _ in range(100):
+            sent_chunks += 1
+            yield b"\x00" * 100
+        yield b"\r\n--x--\r\n"
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        small = await client.post("/upload", files={"audio_file": ("a.webm", b"\x00" * 100, "audio/webm")})
+        declared = await client.post("/upload", files={"audio_file": ("a.webm", b"\x00" * 5000, "audio/webm")})
+        streamed = await client.post("/upload", content=chunked_body(),
+                                     headers={"Content-Type": "multipart/form-data; boundary=x"})
+
+    assert small.status_code == 200 and small.json() == {"size": 100}
+    assert declared.status_code == 413
+    assert streamed.status_code == 413 and sent_chunks < 100
+
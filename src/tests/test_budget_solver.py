@@ -0,0 +1,61 @@
+import pytest
+
+from src.llm.agents.budget_solver.budget_solver import select_cheapest_basket
+from src.llm.agents.supervisor.supervisor import SupervisorAgent
+
+CANDIDATES = {
+    "dairy": [("Milk", 40, "SimpleDairy", "Whole milk"), ("Cheese", 150, "CheeseHouse", None)],
+    "bakery": [("Bread", 25, "Bakery #1", "Wheat flour"), ("Yeast", 8, "Fermento", "Dry yeast")],
+}
+
+
+def test_selects_cheapest_product_per_ingredient():
+    """
+    Each ingredient gets the cheapest product matching its name, falling back to its category.
+    """
+    ingredients = [{"name": "Milk", "category": "dairy"}, {"name": "Flour", "category": "bakery"}]
+    selection = select_cheapest_basket(candidates=CANDIDATES, ingredients=ingredients, budget=48)
+
+    assert [product.name for product in selection.products] == ["Milk", "Yeast"]
+    assert selection.total_cost == 48
+    assert selection.feasible
+    assert selection.products[0].composition == "Whole milk"
+
+
+def test_same_category_ingredients_each_get_a_product():
+    """
+    Two ingredients of one category are both bought and both counted in the total.
+    """
+    ingredients = [
+        {"name": "Milk", "category": "dairy"},
+        {"name": "Bread", "category": "bakery"},
+        {"name": "Cheese", "category": "dairy"},
+    ]
+    selection = select_cheapest_basket(candidates=CANDIDATES, ingredients=ingredients, budget=200)
+
+    assert [product.name for product in selection.products] == ["Milk", "Bread", "Cheese"]
+    assert selection.total_cost == 215
+    assert not selection.feasible
+
+
+def test_reports_infeasible_budget_and_missing_categories():
+    """
+    A budget below the min-cost basket is infeasible, and categories with no products are reported.
+    """
+    ingredients = [{"name": "Milk", "category": "dairy"}, {"name": "Salmon", "category": "seafood"}]
+    selection = select_cheapest_basket(candidates=CANDIDATES, ingredients=ingredients, budget=39)
+
+    assert not selection.feasible
+    assert selection.total_cost == 40
+    assert selection.missing_categories == ["seafood"]
+
+
+@pytest.mark.asyncio
+async def test_supervisor_routes_over_budget_state_to_solver_once():
+    """
+    An over-budget basket goes to BudgetSolver, and a solved one goes to Finalizer.
+    """
+    state = {"plan": "p", "recipes": ["r"], "products": [object()], "within_budget": False, "total_cost": 99}
+
+    assert (await SupervisorAgent.generate(dict(state)))["__next__"] == "BudgetSolver"
+    assert (await SupervisorAgent.generate({**state, "budget_solved": True}))["__next__"] == "Finalizer"
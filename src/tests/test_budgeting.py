@@ -0,0 +1,50 @@
+import pytest
+
+from settings import settings
+from src.llm.agents.budgeting import budgeting
+from src.llm.agents.budgeting.budgeting import BudgetingAgent
+from src.llm.agents.product_finder.schemas import ProductInfo
+
+
+class FakeCache:
+    def __init__(self) -> None:
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, expire=3600):
+        self.data[key] = value
+
+
+class FailingLLM:
+    def with_structured_output(self, schema):
+        raise AssertionError("The LLM must not be called in deterministic mode.")
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setattr(budgeting, "settings", settings.model_copy(update={"BUDGETING_MODE": "deterministic"}))
+    monkeypatch.setattr(budgeting, "cache", FakeCache())
+    agent = BudgetingAgent()
+    agent.llm = FailingLLM()
+    return agent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("budget, within_budget", [(50, True), (49.99, False), (100, True)])
+async def test_deterministic_budget_check(agent, budget, within_budget):
+    """
+    The deterministic mode compares the total with the budget without calling the LLM
+    and writes the same cache entry shape as the LLM mode.
+    """
+    products = [
+        ProductInfo(name="Milk", price=40, manufacturer="SimpleDairy", composition="Whole milk"),
+        ProductInfo(name="Bread", price=10, manufacturer="Bakery #1", composition="Wheat flour"),
+    ]
+
+    result = await agent.generate({"products": products, "budget": budget})
+
+    assert result["within_budget"] is within_budget
+    assert result["total_cost"] == 50
+    assert list(budgeting.cache.data.values()) == [{"within_budget": within_budget, "total_cost": 50}]
@@ -0,0 +1,79 @@
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from settings import settings
+from src.db.product.model import ProductModel
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
+from src.routers.products import services as product_services
+from src.routers.products.router import router as products_router
+from src.routers.recipes.router import router as recipes_router
+
+
+def build_client() -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(products_router)
+    app.include_router(recipes_router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def ndjson_body(lines):
+    """
+    Stream the body in small chunks that split lines, as a slow client would.
+    """
+    payload = "".join(f"{line}\n" for line in lines).encode()
+    for start in range(0, len(payload), 7):
+        yield payload[start:start + 7]
+
+
+def product_line(name: str, price: float) -> str:
+    return json.dumps({
+        "name": name, "price": price, "category": "dairy", "manufacturer": "Farm", "composition": name.lower()
+    })
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_products_reports_batches(sqlite_db, memory_cache, monkeypatch):
+    """
+    Valid lines are written in batches, invalid lines are reported with their number, names are upserted.
+    """
+    monkeypatch.setattr(product_services, "settings", settings.model_copy(update={"BULK_IMPORT_BATCH_SIZE": 2}))
+    await ProductModel.create(name="Milk", price=5, category="dairy", manufacturer="Old", composition="milk")
+    lines = [product_line("Milk", 3), "{not json", product_line("Kefir", 2), "", json.dumps({"name": "Brie"}),
+             product_line("Brie", 7)]
+
+    async with build_client() as client:
+        response = await client.post("/products/bulk", content=ndjson_body(lines),
+                                     headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [(result["batch"], result["written"]) for result in results[:-1]] == [(1, 2), (2, 1)]
+    assert [error["line"] for error in results[0]["errors"] + results[1]["errors"]] == [2, 5]
+    assert results[-1] == {"done": True, "received": 5, "written": 3, "rejected": 2, "batches": 2}
+    assert await ProductModel.all().order_by("name").values_list("name", "price", "manufacturer") == [
+        ("Brie", 7, "Farm"), ("Kefir", 2, "Farm"), ("Milk", 3, "Farm")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_recipes_syncs_ingredients(sqlite_db, memory_cache):
+    """
+    Re-importing a recipe replaces its ingredient rows.
+    """
+    def recipe_line(*ingredients: str) -> str:
+        return json.dumps({
+            "name": "Toast",
+            "category": "appetizer",
+            "ingredients": [{"name": name, "category": "bakery", "weight_grams": 100} for name in ingredients]
+        })
+
+    async with build_client() as client:
+        for line in (recipe_line("Bread", "Butter"), recipe_line("Rye bread")):
+            response = await client.post("/recipes/bulk", content=ndjson_body([line]))
+            assert json.loads(response.text.splitlines()[-1])["written"] == 1
+
+    assert await RecipeModel.all().count() == 1
+    assert await RecipeIngredientModel.all().values_list("name", flat=True) == ["Rye bread"]
@@ -0,0 +1,63 @@
+import pytest
+
+from src.redis_client import client as client_module
+from src.redis_client.client import LRUCache, RedisCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(client_module.time, "monotonic", fake.monotonic)
+    return fake
+
+
+def test_lru_evicts_least_recently_used(clock):
+    """
+    The least recently used entry is evicted once the cache is full.
+    """
+    lru = LRUCache(max_size=2)
+    lru.set("a", 1, ttl=10)
+    lru.set("b", 2, ttl=10)
+    assert lru.get("a") == 1
+    lru.set("c", 3, ttl=10)
+
+    assert lru.get("b") is client_module._MISSING
+    assert lru.get("a") == 1 and lru.get("c") == 3
+    assert lru.stats()["evictions"] == 1
+
+
+def test_lru_expires_entries(clock):
+    """
+    Entries are dropped once their time to live has passed.
+    """
+    lru = LRUCache(max_size=2)
+    lru.set("a", 1, ttl=10)
+    clock.now += 10
+
+    assert lru.get("a") is client_module._MISSING
+    assert lru.stats() == {"size": 0, "max_size": 2, "hits": 0, "misses": 1, "evictions": 0, "expirations": 1}
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_works_without_redis(clock):
+    """
+    The memory backend serves get/set from the process with the requested expiration.
+    """
+    cache = RedisCache(backend="memory", l1_enabled=False, l1_max_size=10, l1_ttl=5)
+    await cache.set("plan:1", ["Simple Pizza"], expire=3600)
+
+    clock.now += 60
+    assert cache.client is None
+    assert await cache.get("plan:1") == ["Simple Pizza"]
+
+    clock.now += 3600
+    assert await cache.get("plan:1") is None
+    assert cache.stats()["l1"]["hits"] == 1
@@ -0,0 +1,62 @@
+import pytest
+
+from src.db.catalog.snapshot import CatalogStore
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.model import RecipeModel
+from src.redis_client.services import bump_generation
+
+
+@pytest.mark.asyncio
+async def test_snapshot_indexes_products_and_recipes(sqlite_db, memory_cache):
+    """
+    The snapshot groups products by category and recipes by name.
+    """
+    await ProductModel.create(name="Milk", price=40, category=ProductCategoryEnum.DAIRY, manufacturer="SimpleDairy")
+    await RecipeModel.create(
+        name="Milkshake",
+        category=RecipeCategoryEnum.DRINKS,
+        ingredients=[{"name": "Milk", "category": "dairy", "weight_grams": 300}],
+    )
+
+    snapshot = await CatalogStore().get()
+
+    assert snapshot.version == 1
+    assert snapshot.get_products_by_category(ProductCategoryEnum.DAIRY) == [("Milk", 40, "SimpleDairy", None)]
+    assert snapshot.get_products_by_categories(["dairy", "bakery"]) == {"dairy": [("Milk", 40, "SimpleDairy", None)]}
+    assert snapshot.get_recipes() == [{"name": "Milkshake", "category": "drinks"}]
+
+
+@pytest.mark.asyncio
+async def test_refresh_publishes_new_version_without_touching_old_snapshot(sqlite_db, memory_cache):
+    """
+    A refresh swaps in a new snapshot while readers holding the old one keep their view.
+    """
+    store = CatalogStore()
+    old = await store.get()
+
+    await ProductModel.create(name="Bread", price=25, category=ProductCategoryEnum.BAKERY)
+    new = await store.refresh()
+
+    assert store.version == new.version == old.version + 1
+    assert old.get_products_by_category("bakery") == []
+    assert new.get_products_by_category("bakery") == [("Bread", 25, None, None)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reloads_when_another_worker_bumps_a_generation(sqlite_db, memory_cache):
+    """
+    A generation bump (an edit made elsewhere) makes the next `get` reload the snapshot.
+    """
+    store = CatalogStore(check_interval=0)
+    first = await store.get()
+    assert await store.get() is first
+
+    await ProductModel.create(name="Bread", price=25, category=ProductCategoryEnum.BAKERY)
+    await bump_generation("catalog")
+    second = await store.get()
+
+    assert second.version == first.version + 1
+    assert second.generations == {"catalog": 1, "recipes": 0}
+    assert second.get_products_by_category("bakery") == [("Bread", 25, None, None)]
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from src.redis_client.codec import HEADER_MAGIC, CacheCodec, msgpack, orjson, zstandard
+
+PRODUCTS = [
+    {"name": f"Product {index}", "price": 10.5 + index, "manufacturer": "FarmFresh", "composition": "Fresh tomatoes"}
+    for index in range(50)
+]
+
+CONFIGURATIONS = [
+    ("json", "none"),
+    ("json", "zlib"),
+    pytest.param("orjson", "none", marks=pytest.mark.skipif(orjson is None, reason="orjson is not installed")),
+    pytest.param("msgpack", "zlib", marks=pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")),
+    pytest.param("json", "zstd", marks=pytest.mark.skipif(zstandard is None, reason="zstandard is not installed")),
+]
+
+
+@pytest.mark.parametrize("serializer, compression", CONFIGURATIONS)
+def test_round_trip(serializer, compression):
+    """
+    Every configuration decodes its own output, and any codec decodes it during a rollout.
+    """
+    codec = CacheCodec(serializer=serializer, compression=compression, compress_threshold=256)
+    encoded = codec.encode(PRODUCTS)
+
+    assert encoded.startswith(HEADER_MAGIC)
+    assert codec.decode(encoded) == PRODUCTS
+    assert CacheCodec().decode(encoded) == PRODUCTS
+
+
+def test_small_values_are_not_compressed_and_legacy_json_is_decoded():
+    """
+    Values under the threshold skip compression, and plain JSON written before the codec still decodes.
+    """
+    codec = CacheCodec(compression="zlib", compress_threshold=1024)
+
+    assert codec.encode(["Cheese Plate"])[len(HEADER_MAGIC) + 1] == 0
+    assert codec.decode(json.dumps(PRODUCTS).encode()) == PRODUCTS
+
+
+def test_unknown_serializer_is_rejected():
+    with pytest.raises(ValueError):
+        CacheCodec(serializer="pickle")
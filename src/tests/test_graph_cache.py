@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from src.llm import graph_cache
+from src.llm.agents.product_finder.schemas import ProductInfo
+from src.redis_client.services import bump_generation
+
+PRODUCT = ProductInfo(name="Fresh Tomatoes 500g", price=3.0, manufacturer="FarmFresh", composition="tomatoes")
+
+
+class CountingGraph:
+    def __init__(self):
+        self.calls = 0
+
+    async def ainvoke(self, state):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {**state, "products": [PRODUCT], "total_cost": 3.0, "final_message": "Buy tomatoes"}
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_are_served_from_cache(monkeypatch, memory_cache):
+    """
+    Identical and rephrased requests reuse one graph run until the catalog changes.
+    """
+    fake_graph = CountingGraph()
+    monkeypatch.setattr(graph_cache, "get_graph", lambda: fake_graph)
+
+    results = await asyncio.gather(
+        graph_cache.invoke_graph({"user_input": "Salad for two", "budget": 10}),
+        graph_cache.invoke_graph({"user_input": "salad for 2!", "budget": 10.0}),
+    )
+    assert fake_graph.calls == 1
+    assert results[0]["products"] == [PRODUCT] and results[1]["final_message"] == "Buy tomatoes"
+
+    cached = await graph_cache.invoke_graph({"user_input": "Salad for 2", "budget": 10})
+    assert fake_graph.calls == 1 and cached["products"] == [PRODUCT]
+
+    await graph_cache.invoke_graph({"user_input": "Salad for 2", "budget": 20})
+    assert fake_graph.calls == 2
+
+    await bump_generation("catalog")
+    await graph_cache.invoke_graph({"user_input": "Salad for 2", "budget": 10})
+    assert fake_graph.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_pipeline_settings_are_part_of_the_key(monkeypatch, memory_cache):
+    """
+    Results computed under another topology, planner or budgeting mode are not reused.
+    """
+    state = {"user_input": "Salad for 2", "budget": 10}
+    key = await graph_cache.make_graph_cache_key(state)
+
+    for update in ({"GRAPH_TOPOLOGY": "linear"}, {"PLANNER_MODE": "fused"}, {"BUDGETING_MODE": "explain"}):
+        monkeypatch.setattr(graph_cache, "settings", graph_cache.settings.model_copy(update=update))
+        assert await graph_cache.make_graph_cache_key(state) != key
+        key = await graph_cache.make_graph_cache_key(state)
@@ -0,0 +1,60 @@
+import pytest
+
+from src.benchmarks.common import create_stub_agents
+from src.llm.graph import build_graph
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("over_budget", [False, True])
+async def test_linear_topology_matches_supervisor(over_budget):
+    """
+    The linear topology reaches the same final state with half the node runs.
+    """
+    initial_state = {"user_input": "Dinner for 4", "budget": 10}
+    results = {}
+    for topology in ("supervisor", "linear"):
+        graph = build_graph(topology=topology, agents=create_stub_agents(over_budget=over_budget))
+        steps = [list(update) async for update in graph.astream(initial_state, stream_mode="updates")]
+        final_state = await graph.ainvoke(initial_state)
+        final_state.pop("__next__", None)
+        results[topology] = (steps, final_state)
+
+    supervisor_steps, supervisor_state = results["supervisor"]
+    linear_steps, linear_state = results["linear"]
+
+    assert linear_state == supervisor_state
+    assert bool(supervisor_state.get("budget_solved")) == over_budget
+    assert [step for step in supervisor_steps if step != ["Supervisor"]] == linear_steps
+    assert len(supervisor_steps) == 2 * len(linear_steps)
+
+
+@pytest.mark.asyncio
+async def test_linear_entry_skips_completed_steps():
+    """
+    The conditional entry point starts at the first step whose output is missing.
+    """
+    graph = build_graph(topology="linear", agents=create_stub_agents(over_budget=False))
+    state = {"user_input": "Dinner", "budget": 10, "plan": "dinner", "recipes": ["Simple Pizza"]}
+
+    steps = [list(update) async for update in graph.astream(state, stream_mode="updates")]
+
+    assert steps == [["ProductFinder"], ["Budgeting"], ["Finalizer"]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("topology", ["supervisor", "linear"])
+async def test_fused_planner_replaces_planner_and_recipe(topology):
+    """
+    In the fused planner mode one MealPlanner node produces the plan and the recipes.
+    """
+    agents = create_stub_agents(over_budget=False)
+    initial_state = {"user_input": "Dinner for 4", "budget": 10}
+    graph = build_graph(topology=topology, agents=agents, planner_mode="fused")
+
+    steps = [list(update) async for update in graph.astream(initial_state, stream_mode="updates")]
+    final_state = await graph.ainvoke(initial_state)
+    final_state.pop("__next__", None)
+
+    separate_state = await build_graph(topology="linear", agents=agents).ainvoke(initial_state)
+    assert final_state == separate_state
+    assert ["MealPlanner"] in steps and ["Recipe"] not in steps and ["Planner"] not in steps
@@ -0,0 +1,17 @@
+import os
+
+from src.benchmarks.common import PROVIDER_MODULES, measure_import_time
+
+# Cold import budget of the app, in milliseconds; raise it with IMPORT_TIME_LIMIT_MS on slow machines
+IMPORT_TIME_LIMIT_MS = float(os.environ.get("IMPORT_TIME_LIMIT_MS", 3000))
+
+
+def test_app_import_stays_within_budget():
+    """
+    Importing the app loads no LLM provider SDK and stays below the import time limit.
+    """
+    timings = measure_import_time("src.app")
+
+    assert [name for name in PROVIDER_MODULES if name in timings] == []
+    import_ms = timings["src.app"][1] / 1000
+    assert import_ms <= IMPORT_TIME_LIMIT_MS, f"src.app imported in {import_ms:.0f} ms, limit {IMPORT_TIME_LIMIT_MS:.0f} ms"
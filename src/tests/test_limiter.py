@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.routers.assistant.limiter import ConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrency_and_rejects_when_queue_is_full():
+    """
+    Runs beyond `max_concurrency` wait in the queue, and once the queue is full
+    new runs are rejected immediately with 503 and Retry-After.
+    """
+    limiter = ConcurrencyLimiter(max_concurrency=2, max_queue=1, queue_timeout=5, retry_after=7)
+    release = asyncio.Event()
+    peak = 0
+
+    async def run():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(run()) for _ in range(3)]
+    try:
+        await asyncio.sleep(0.05)
+        assert (limiter.in_flight, limiter.waiting) == (2, 1)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.acquire()
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "7"}
+    finally:
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert (limiter.in_flight, limiter.waiting) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_after_queue_timeout():
+    """
+    A queued run that cannot get a slot in time is rejected.
+    """
+    limiter = ConcurrencyLimiter(max_concurrency=1, max_queue=1, queue_timeout=0.01, retry_after=1)
+    await limiter.acquire()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.acquire()
+
+    assert exc_info.value.status_code == 503
+    assert limiter.waiting == 0
+    limiter.release()
@@ -0,0 +1,65 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from settings import settings
+from src.db.product.model import ProductModel
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.repository import create_recipe
+from src.routers.products import services as product_services
+from src.routers.products.router import router as products_router
+from src.routers.recipes.router import router as recipes_router
+
+
+def build_client() -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(products_router)
+    app.include_router(recipes_router)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_products_keyset_pages_with_filters(sqlite_db, monkeypatch):
+    """
+    Pages continue from `next_after_id` across several fetch chunks and respect every filter.
+    """
+    monkeypatch.setattr(product_services, "settings", settings.model_copy(update={"LIST_CHUNK_SIZE": 2}))
+    for name, price, category in (("Milk", 3, "dairy"), ("Mozzarella", 6, "dairy"), ("Bread", 2, "bakery"),
+                                  ("Brie", 9, "dairy"), ("Mascarpone", 5, "dairy"), ("Muffin", 4, "bakery")):
+        await ProductModel.create(name=name, price=price, category=category)
+
+    names, after_id = [], None
+    async with build_client() as client:
+        while True:
+            params = {"limit": 3, "category": "dairy", **({"after_id": after_id} if after_id else {})}
+            page = (await client.get("/products/", params=params)).json()
+            names.append([item["name"] for item in page["items"]])
+            after_id = page["next_after_id"]
+            if after_id is None:
+                break
+
+        filtered = (await client.get("/products/", params={"name_prefix": "M", "min_price": 4, "max_price": 6})).json()
+
+    assert names == [["Milk", "Mozzarella", "Brie"], ["Mascarpone"]]
+    assert [(item["name"], item["price"]) for item in filtered["items"]] == [("Mozzarella", 6), ("Mascarpone", 5), ("Muffin", 4)]
+    assert filtered["next_after_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_recipes_filter_by_ingredient_category(sqlite_db):
+    """
+    Recipes can be listed by the product category of one of their ingredients.
+    """
+    await create_recipe(name="Toast", category=RecipeCategoryEnum.APPETIZER,
+                        ingredients=[{"name": "Bread", "category": "bakery", "weight_grams": 100},
+                                     {"name": "Cheese", "category": "dairy", "weight_grams": 50}])
+    await create_recipe(name="Salad", category=RecipeCategoryEnum.APPETIZER,
+                        ingredients=[{"name": "Tomato", "category": "vegetables", "weight_grams": 200}])
+
+    async with build_client() as client:
+        response = await client.get("/recipes/", params={"ingredient_category": "dairy", "category": "appetizer"})
+
+    assert response.headers["content-type"] == "application/json"
+    page = response.json()
+    assert [item["name"] for item in page["items"]] == ["Toast"]
+    assert page["items"][0]["ingredients"][1]["name"] == "Cheese"
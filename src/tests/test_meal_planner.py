@@ -0,0 +1,63 @@
+import pytest
+
+from src.llm.agents.meal_planner.meal_planner import MealPlannerAgent
+from src.llm.agents.meal_planner.schemas import MealPlanStructuredSchema
+from src.llm.agents.planner.plan_cache import plan_cache
+from src.redis_client.client import cache
+from src.redis_client.services import get_cache_namespaces, make_cache_key
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        assert schema is MealPlanStructuredSchema
+        return self
+
+    async def ainvoke(self, prompt: str) -> MealPlanStructuredSchema:
+        self.calls += 1
+        return MealPlanStructuredSchema(
+            intent="dinner for 2", plan="A simple dinner", servings="2", names=["Simple Pizza"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_meal_planner_populates_planner_and_recipe_caches(monkeypatch, memory_cache):
+    """
+    One LLM call fills the state and the cache entries of the Planner and Recipe agents.
+    """
+    agent = MealPlannerAgent()
+    agent.llm = FakeLLM()
+
+    async def create_prompt(user_input_content):
+        return user_input_content
+
+    monkeypatch.setattr(agent, "create_prompt", create_prompt)
+
+    state = await agent.generate({"user_input": "Dinner for two"})
+
+    assert (state["plan"], state["servings"], state["recipes"]) == ("A simple dinner", "2", ["Simple Pizza"])
+    recipe_key = make_cache_key("plan", "A simple dinner", namespaces=await get_cache_namespaces("recipes"))
+    assert await cache.get(recipe_key) == ["Simple Pizza"]
+    assert (await plan_cache.get("dinner for 2"))["intent"] == "dinner for 2"
+
+    await agent.generate({"user_input": "dinner for 2"})
+    assert agent.llm.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_meal_planner_reads_its_combined_entry(memory_cache):
+    """
+    A request whose combined result is cached is answered from it without calling the LLM.
+    """
+    agent = MealPlannerAgent()
+    agent.llm = FakeLLM()
+    cache_key = make_cache_key("meal_planner", "lunch", namespaces=await get_cache_namespaces("recipes"))
+    await cache.set(cache_key, {"plan": "A light lunch", "intent": "lunch", "servings": "1", "recipes": ["Tomato Salad"]})
+
+    state = await agent.generate({"user_input": "Lunch"})
+
+    assert (state["plan"], state["recipes"]) == ("A light lunch", ["Tomato Salad"])
+    assert agent.llm.calls == 0
+
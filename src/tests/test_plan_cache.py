@@ -0,0 +1,42 @@
+import pytest
+
+from src.llm.agents.planner.plan_cache import PlanCache, SemanticPlanCache, normalize_user_input
+
+PLAN = {"intent": "dinner", "plan": "A dinner with two dishes", "servings": "4"}
+
+
+def test_normalize_user_input():
+    """
+    Case, punctuation, number words and filler words do not change the normalized input.
+    """
+    assert normalize_user_input("Dinner for FOUR people, please!") == "dinner for 4"
+    assert normalize_user_input("  dinner   for 4 ") == "dinner for 4"
+
+
+def test_semantic_cache_requires_equal_numbers():
+    """
+    Similar requests share a plan only when they mention the same numbers.
+    """
+    semantic = SemanticPlanCache(capacity=2, threshold=0.7)
+    semantic.set("simple dinner for 4", PLAN)
+
+    assert semantic.get("simple dinner for 4 tonight") == PLAN
+    assert semantic.get("simple dinner for 6") is None
+    assert semantic.get("cheap breakfast for 4") is None
+
+
+@pytest.mark.asyncio
+async def test_plan_cache_tiers(memory_cache):
+    """
+    Rephrased requests hit the exact tier, near-duplicates the semantic tier.
+    """
+    plan_cache = PlanCache(semantic_enabled=True, semantic_capacity=8, semantic_threshold=0.7)
+
+    assert await plan_cache.get("Dinner for four people") is None
+    await plan_cache.set("Dinner for four people", PLAN)
+
+    assert await plan_cache.get("dinner for 4!") == PLAN
+    assert await plan_cache.get("dinner for 4 tonight") == PLAN
+
+    stats = plan_cache.stats()
+    assert (stats["exact_hits"], stats["semantic_hits"], stats["misses"]) == (1, 1, 1)
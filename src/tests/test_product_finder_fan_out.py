@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+import pytest
+
+from settings import settings
+from src.llm.agents.product_finder import product_finder
+from src.llm.agents.product_finder.product_finder import ProductFinderAgent
+from src.llm.agents.product_finder.schemas import ProductFinderStructuredSchema, ProductInfo
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    def with_structured_output(self, schema):
+        return self
+
+    async def ainvoke(self, prompt: str) -> ProductFinderStructuredSchema:
+        self.calls.append(prompt)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.05)
+        self.running -= 1
+        if prompt == "Broken":
+            raise ValueError("Invalid structured output")
+        return ProductFinderStructuredSchema(products=[
+            ProductInfo(name=f"{prompt} Sauce", price=2.0, manufacturer="Co", composition="tomatoes"),
+            ProductInfo(name="Salt 1kg", price=1.0, manufacturer="Co", composition="salt"),
+        ])
+
+
+@pytest.fixture
+def agent(monkeypatch, memory_cache):
+    monkeypatch.setattr(product_finder, "settings", settings.model_copy(
+        update={"PRODUCT_FINDER_MODE": "fan_out", "PRODUCT_FINDER_MAX_CONCURRENCY": 3}
+    ))
+    agent = ProductFinderAgent()
+    agent.llm = FakeLLM()
+
+    async def create_prompt(recipes):
+        return recipes[0]
+
+    monkeypatch.setattr(agent, "create_prompt", create_prompt)
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_fan_out_runs_recipes_concurrently_and_merges(agent):
+    """
+    Recipes are selected concurrently within the cap and merged without duplicate products.
+    """
+    recipes = ["Pizza", "Pasta", "Soup", "Salad", "Stew"]
+
+    start = time.perf_counter()
+    state = await agent.generate({"recipes": recipes})
+    elapsed = time.perf_counter() - start
+
+    names = [product.name for product in state["products"]]
+    assert names == ["Pizza Sauce", "Salt 1kg", "Pasta Sauce", "Soup Sauce", "Salad Sauce", "Stew Sauce"]
+    assert agent.llm.max_running == 3 and elapsed < 0.2
+
+    await agent.generate({"recipes": ["Pizza", "Curry"]})
+    assert agent.llm.calls[5:] == ["Curry"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_tolerates_a_failed_recipe(agent):
+    """
+    A failed recipe is left out instead of failing the whole basket.
+    """
+    state = await agent.generate({"recipes": ["Broken", "Pizza"]})
+    assert [product.name for product in state["products"]] == ["Pizza Sauce", "Salt 1kg"]
+
+    with pytest.raises(ValueError):
+        await agent.generate({"recipes": ["Broken"]})
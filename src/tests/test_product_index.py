@@ -0,0 +1,100 @@
+import pytest
+
+from settings import settings
+from src.db.catalog.product_index import ProductIndex, ProductIndexStore, build_product_index
+from src.db.catalog.snapshot import CatalogStore
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.model import RecipeModel
+from src.llm.agents.product_finder import product_finder
+from src.llm.agents.product_finder.product_finder import ProductFinderAgent
+from src.llm.embeddings import HashedNgramEmbedder
+
+ROWS = [
+    (1, "dairy", "Fresh Mozzarella 250g", "milk, salt, enzymes"),
+    (2, "dairy", "Whole Milk 1l", "milk"),
+    (3, "vegetables", "Fresh Tomatoes 500g", "tomatoes"),
+    (4, "dairy", "Cheddar Cheese 200g", "milk, salt"),
+]
+
+
+def test_build_search_and_incremental_rebuild(tmp_path):
+    """
+    Search ranks within a category; a rebuild only embeds new and edited products.
+    """
+    path = tmp_path / "index.npy"
+    embedder = HashedNgramEmbedder(dim=64)
+
+    assert build_product_index(ROWS, path=path, embedder=embedder) == 4
+    index = ProductIndex(path)
+    assert index.search("mozzarella", "dairy", 2)[0] == 1
+    assert index.search("tomatoes", "dairy", 5) != [] and 3 not in index.search("tomatoes", "dairy", 5)
+    assert index.search("tomatoes", "bakery", 5) == []
+
+    edited = ROWS[:3] + [(4, "dairy", "Cheddar Cheese 200g", "milk, salt, annatto"), (5, "bakery", "Bread", None)]
+    assert build_product_index(edited, path=path, embedder=embedder) == 2
+    assert ProductIndex(path).search("bread", "bakery", 1) == [5]
+
+
+def test_store_reopens_a_replaced_file(tmp_path):
+    """
+    A worker picks up an index file replaced by another process.
+    """
+    path = tmp_path / "index.npy"
+    store = ProductIndexStore(path=path, dim=64, check_interval=0)
+    assert store.get() is None
+
+    build_product_index(ROWS[:2], path=path, embedder=store.embedder)
+    assert len(store.get()) == 2
+    build_product_index(ROWS, path=path, embedder=store.embedder)
+    assert len(store.get()) == 4
+
+
+@pytest.mark.asyncio
+async def test_product_finder_candidates_come_from_the_index(tmp_path, monkeypatch, sqlite_db, memory_cache):
+    """
+    With the index enabled each ingredient gets the top-k closest products of its category.
+    """
+    store = ProductIndexStore(path=tmp_path / "index.npy", dim=64, check_interval=0)
+    monkeypatch.setattr(product_finder, "product_index", store)
+    monkeypatch.setattr(product_finder, "catalog", CatalogStore())
+    monkeypatch.setattr(product_finder, "settings", settings.model_copy(
+        update={"PRODUCT_INDEX_ENABLED": True, "PRODUCT_INDEX_TOP_K": 1}
+    ))
+    for name, composition in (("Fresh Mozzarella 250g", "milk, salt"), ("Whole Milk 1l", "milk")):
+        await ProductModel.create(name=name, price=4, category=ProductCategoryEnum.DAIRY, composition=composition)
+    await RecipeModel.create(
+        name="Caprese", category=RecipeCategoryEnum.APPETIZER,
+        ingredients=[{"name": "mozzarella", "category": "dairy"}, {"name": "milk", "category": "dairy"}],
+    )
+    await store.rebuild()
+
+    candidates = await ProductFinderAgent.load_candidates(["Caprese"])
+
+    assert candidates["Caprese"] == [
+        [("Fresh Mozzarella 250g", 4, None, "milk, salt")],
+        [("Whole Milk 1l", 4, None, "milk")],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduled_rebuilds_are_coalesced(tmp_path, monkeypatch):
+    """
+    Writes before a scheduled rebuild share it; a write during the rebuild schedules one more.
+    """
+    store = ProductIndexStore(path=tmp_path / "index.npy", dim=64, check_interval=0, rebuild_delay=0)
+    rebuilds = []
+
+    async def rebuild():
+        rebuilds.append(len(rebuilds))
+        if len(rebuilds) == 1:
+            store.schedule_rebuild()
+
+    monkeypatch.setattr(store, "rebuild", rebuild)
+    task = store.schedule_rebuild()
+    assert store.schedule_rebuild() is task
+
+    await task
+
+    assert rebuilds == [0, 1]
@@ -0,0 +1,51 @@
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.llm.agents.common import token_counter
+from src.llm.agents.common.prompt_format import format_product_candidates, format_recipes
+from src.llm.agents.common.token_counter import TokenUsageCallback
+
+TOMATOES = ("Fresh Tomatoes 500g", 3.0, "FarmFresh", "tomatoes")
+CHEESE = ("Mozzarella, 250g", 4.0, "CheeseCo", "milk, salt")
+
+
+def test_product_candidates_are_listed_once_and_referenced_by_id():
+    """
+    Shared products appear once in the table and recipes reference them by id.
+    """
+    rendered = format_product_candidates({
+        "Simple Pizza": [[TOMATOES], [CHEESE, TOMATOES]],
+        "Caprese Salad": [[TOMATOES, CHEESE]],
+    })
+
+    assert rendered == (
+        "Products:\n"
+        "id,name,price,manufacturer,composition\n"
+        "1,Fresh Tomatoes 500g,3.0,FarmFresh,tomatoes\n"
+        '2,"Mozzarella, 250g",4.0,CheeseCo,"milk, salt"\n'
+        "\n"
+        "Recipes:\n"
+        "recipe,ingredient options (product ids)\n"
+        "Simple Pizza,1; 2|1\n"
+        "Caprese Salad,1|2"
+    )
+    assert format_recipes([{"name": "Simple Pizza", "category": "dinner"}]) == "name,category\nSimple Pizza,dinner"
+
+
+@pytest.mark.asyncio
+async def test_token_usage_callback_records_calls(monkeypatch):
+    """
+    Every LLM call adds its prompt and completion tokens to the agent's totals.
+    """
+    monkeypatch.setattr(token_counter, "token_usage", token_counter.defaultdict(
+        lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    ))
+    llm = GenericFakeChatModel(
+        messages=iter([AIMessage(content="Here is your list")]), callbacks=[TokenUsageCallback("FinalizerAgent")]
+    )
+
+    await llm.ainvoke("Generate a final message for the user.")
+
+    usage = token_counter.token_usage["FinalizerAgent"]
+    assert usage["calls"] == 1 and usage["prompt_tokens"] > 0 and usage["completion_tokens"] > 0
@@ -0,0 +1,48 @@
+from types import MappingProxyType
+
+import pytest
+
+from src.db.catalog.recipe_index import RecipeIndex, RecipeIndexStore
+from src.db.catalog.snapshot import CatalogSnapshot
+
+RECIPES = [
+    {"name": "Simple Pizza", "category": "dinner", "ingredients": [
+        {"name": "flour", "category": "grains"}, {"name": "tomato", "category": "vegetables"}]},
+    {"name": "Pancakes", "category": "breakfast", "ingredients": [
+        {"name": "flour", "category": "grains"}, {"name": "milk", "category": "dairy"}]},
+    {"name": "Tomato Soup", "category": "lunch", "ingredients": [
+        {"name": "tomato", "category": "vegetables"}]},
+    {"name": "Fruit Salad", "category": "dessert", "ingredients": []},
+]
+
+
+def snapshot(recipes, generation):
+    return CatalogSnapshot(
+        version=generation + 1,
+        recipes_by_name=MappingProxyType({recipe["name"]: recipe for recipe in recipes}),
+        generations=MappingProxyType({"catalog": 0, "recipes": generation}),
+    )
+
+
+def test_search_ranks_by_bm25_and_fills_up():
+    """
+    The best matches come first; unmatched recipes only fill up the result in catalog order.
+    """
+    index = RecipeIndex(RECIPES)
+
+    assert [recipe["name"] for recipe in index.search("A tomato soup for lunch", 2)] == ["Tomato Soup", "Simple Pizza"]
+    assert [recipe["name"] for recipe in index.search("breakfast", 3)] == ["Pancakes", "Simple Pizza", "Tomato Soup"]
+    assert len(index.search("anything", 10)) == 4
+
+
+@pytest.mark.asyncio
+async def test_store_rebuilds_only_when_recipes_change():
+    """
+    The index is reused across snapshots until the recipes generation changes.
+    """
+    store = RecipeIndexStore()
+    first = await store.for_snapshot(snapshot(RECIPES, generation=0))
+
+    assert await store.for_snapshot(snapshot(RECIPES, generation=0)) is first
+    rebuilt = await store.for_snapshot(snapshot(RECIPES[:2], generation=1))
+    assert rebuilt is not first and len(rebuilt) == 2
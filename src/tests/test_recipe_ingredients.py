@@ -0,0 +1,53 @@
+import pytest
+
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.migrations import migrate_recipe_ingredients
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
+from src.db.recipe.repository import (
+    create_recipe,
+    get_candidate_products,
+    get_recipe_names_by_ingredient_category,
+    update_recipe,
+)
+
+TOAST_INGREDIENTS = [
+    {"name": "Bread", "category": "bakery", "weight_grams": 100},
+    {"name": "Cheese", "category": ProductCategoryEnum.DAIRY, "weight_grams": 50},
+]
+
+
+@pytest.mark.asyncio
+async def test_migration_fills_ingredient_table_once(sqlite_db):
+    """
+    The data migration copies the JSON ingredients of unmigrated recipes only.
+    """
+    await RecipeModel.create(name="Toast", category=RecipeCategoryEnum.APPETIZER, ingredients=TOAST_INGREDIENTS)
+    await RecipeModel.create(name="Tea", category=RecipeCategoryEnum.DRINKS, ingredients=[{"name": "Tea"}])
+
+    assert await migrate_recipe_ingredients() == 2
+    assert await migrate_recipe_ingredients() == 0
+    assert await RecipeIngredientModel.filter(category="dairy").values_list("name", "weight_grams") == [("Cheese", 50)]
+
+
+@pytest.mark.asyncio
+async def test_candidate_products_in_one_query(sqlite_db):
+    """
+    One join returns each ingredient's products cheapest first; repository writes keep the table in sync.
+    """
+    for name, price, category in (("Milk", 3, "dairy"), ("Brie", 5, "dairy"), ("Bread", 2, "bakery"), ("Kefir", 1, "dairy")):
+        await ProductModel.create(name=name, price=price, category=category)
+    toast = await create_recipe(name="Toast", category=RecipeCategoryEnum.APPETIZER, ingredients=TOAST_INGREDIENTS)
+
+    assert await get_candidate_products(names=["Toast", "Unknown"]) == {"Toast": [
+        [("Bread", 2, None, None)],
+        [("Kefir", 1, None, None), ("Milk", 3, None, None), ("Brie", 5, None, None)],
+    ]}
+    assert await get_candidate_products(names=["Toast"], limit_per_ingredient=1) == {"Toast": [
+        [("Bread", 2, None, None)], [("Kefir", 1, None, None)],
+    ]}
+    assert await get_recipe_names_by_ingredient_category(category="dairy") == ["Toast"]
+
+    await update_recipe(toast, {"ingredients": TOAST_INGREDIENTS[:1]})
+    assert await get_recipe_names_by_ingredient_category(category="dairy") == []
@@ -0,0 +1,59 @@
+import pytest
+
+from src.db.catalog.snapshot import CatalogStore
+from src.db.product.enums import ProductCategoryEnum
+from src.db.product.model import ProductModel
+from src.db.product.repository import get_products_by_categories, get_product_by_category
+from src.db.recipe.enums import RecipeCategoryEnum
+from src.db.recipe.model import RecipeModel
+from src.db.recipe.repository import get_recipes_by_names
+from src.llm.agents.product_finder import product_finder
+from src.llm.agents.product_finder.product_finder import ProductFinderAgent
+
+
+@pytest.mark.asyncio
+async def test_get_products_by_categories_matches_single_category_lookup(sqlite_db):
+    """
+    The bulk lookup returns the same rows as one `get_product_by_category` call per category.
+    """
+    await ProductModel.create(name="Milk", price=40, category=ProductCategoryEnum.DAIRY)
+    await ProductModel.create(name="Cheese", price=150, category=ProductCategoryEnum.DAIRY)
+    await ProductModel.create(name="Bread", price=25, category=ProductCategoryEnum.BAKERY)
+
+    result = await get_products_by_categories(categories=["dairy", ProductCategoryEnum.BAKERY, "dairy", "seafood"])
+
+    assert set(result) == {"dairy", "bakery"}
+    for category, products in result.items():
+        assert sorted(products) == sorted(await get_product_by_category(category=category))
+
+
+@pytest.mark.asyncio
+async def test_get_recipes_by_names_skips_missing(sqlite_db):
+    """
+    The bulk recipe lookup ignores unknown names.
+    """
+    await RecipeModel.create(name="Cheese Plate", category=RecipeCategoryEnum.APPETIZER, ingredients=[])
+
+    recipes = await get_recipes_by_names(names=["Cheese Plate", "Unknown"])
+
+    assert [recipe.name for recipe in recipes] == ["Cheese Plate"]
+
+
+@pytest.mark.asyncio
+async def test_product_finder_reads_recipes_missing_from_the_snapshot(sqlite_db, memory_cache, monkeypatch):
+    """
+    A recipe created after the snapshot was loaded is read from the database with its products.
+    """
+    store = CatalogStore()
+    monkeypatch.setattr(product_finder, "catalog", store)
+    await ProductModel.create(name="Milk", price=40, category=ProductCategoryEnum.DAIRY)
+    await store.refresh()
+    await ProductModel.create(name="Bread", price=25, category=ProductCategoryEnum.BAKERY)
+    await RecipeModel.create(name="Toast", category=RecipeCategoryEnum.APPETIZER, ingredients=[
+        {"name": "Bread", "category": "bakery"}, {"name": "Milk", "category": "dairy"}
+    ])
+
+    candidates = await ProductFinderAgent.load_candidates(["Toast"])
+
+    assert candidates == {"Toast": [[("Bread", 25, None, None)], [("Milk", 40, None, None)]]}
+    assert store.version == 1
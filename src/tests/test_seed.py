@@ -0,0 +1,32 @@
+import pytest
+
+from src.db.product.model import ProductModel
+from src.db.recipe.model import RecipeIngredientModel, RecipeModel
+from src.db.seed import delete_test_data, seed_test_data, test_products, test_recipes
+
+
+@pytest.mark.asyncio
+async def test_seeding_is_idempotent(sqlite_db):
+    """
+    Seeding twice writes each demo row once, with the ingredient table filled.
+    """
+    await seed_test_data()
+    await seed_test_data()
+
+    assert await ProductModel.all().count() == len(test_products)
+    assert await RecipeModel.all().count() == len(test_recipes)
+    assert await RecipeIngredientModel.all().count() == sum(len(recipe["ingredients"]) for recipe in test_recipes)
+
+
+@pytest.mark.asyncio
+async def test_delete_test_data_keeps_real_catalog(sqlite_db):
+    """
+    Only the demo rows are deleted; other products survive.
+    """
+    await seed_test_data()
+    await ProductModel.create(name="Kefir", price=3, category="dairy")
+
+    await delete_test_data()
+
+    assert await ProductModel.all().values_list("name", flat=True) == ["Kefir"]
+    assert await RecipeModel.all().count() == 0
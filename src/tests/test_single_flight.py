@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from src.redis_client.client import RedisCache
+from src.redis_client.single_flight import SingleFlight
+
+
+@pytest.fixture
+def group():
+    return SingleFlight(redis_cache=RedisCache(backend="memory", l1_enabled=False, l1_max_size=10, l1_ttl=60))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation(group):
+    """
+    Concurrent callers for the same key await the first caller's computation.
+    """
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        await group.cache.set("plan:1", ["Simple Pizza"])
+        return ["Simple Pizza"]
+
+    results = await asyncio.gather(*[group.run("plan:1", compute) for _ in range(10)])
+
+    assert calls == 1
+    assert results == [["Simple Pizza"]] * 10
+    assert group.coalesced == 9
+    assert await group.run("plan:2", compute) == ["Simple Pizza"] and calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_and_not_remembered(group):
+    """
+    A failed computation fails every waiter, and the next call computes again.
+    """
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("LLM unavailable")
+
+    results = await asyncio.gather(*[group.run("plan:1", fail) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def succeed():
+        return ["Cheese Plate"]
+
+    assert await group.run("plan:1", succeed) == ["Cheese Plate"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_waiters(group):
+    """
+    Cancelling the caller that started the computation leaves it running for the other waiters.
+    """
+    async def compute():
+        await asyncio.sleep(0.05)
+        return ["Milkshake"]
+
+    leader = asyncio.create_task(group.run("plan:1", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(group.run("plan:1", compute))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert await waiter == ["Milkshake"]
+    with pytest.raises(asyncio.CancelledError):
+        await leader